@@ -0,0 +1,67 @@
+"""adicionar_periodo_em_bookings
+
+Revision ID: 4f6b8d2a9c31
+Revises: e7a2c5d9f1b3
+Create Date: 2026-10-17 22:48:05.126734
+
+"""
+from datetime import datetime, time
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f6b8d2a9c31'
+down_revision = 'e7a2c5d9f1b3'
+branch_labels = None
+depends_on = None
+
+
+def _combine_date_and_time(data, horario):
+    # Cópia da regra da aplicação no momento desta revisão (horário inválido = 00:00);
+    # a migração não depende do código atual do domínio
+    try:
+        hours, minutes = map(int, horario.strip().split(':')[:2])
+        horario_time = time(hours, minutes)
+    except (AttributeError, ValueError):
+        horario_time = time(0, 0)
+    dia = data.date() if isinstance(data, datetime) else data
+    return datetime.combine(dia, horario_time)
+
+
+def upgrade() -> None:
+    # Intervalo normalizado (data + horário) dos agendamentos
+    op.add_column('bookings', sa.Column('periodo_inicio', sa.DateTime(), nullable=True))
+    op.add_column('bookings', sa.Column('periodo_fim', sa.DateTime(), nullable=True))
+    op.create_index('idx_bookings_artist_periodo', 'bookings', ['artist_id', 'periodo_inicio', 'periodo_fim'], unique=False)
+    op.create_index('idx_bookings_space_periodo', 'bookings', ['space_id', 'periodo_inicio', 'periodo_fim'], unique=False)
+    
+    # Popular o intervalo dos agendamentos existentes
+    bookings = sa.table(
+        'bookings',
+        sa.column('id', sa.Integer),
+        sa.column('data_inicio', sa.DateTime),
+        sa.column('horario_inicio', sa.String),
+        sa.column('data_fim', sa.DateTime),
+        sa.column('horario_fim', sa.String),
+        sa.column('periodo_inicio', sa.DateTime),
+        sa.column('periodo_fim', sa.DateTime)
+    )
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(
+        bookings.c.id, bookings.c.data_inicio, bookings.c.horario_inicio, bookings.c.data_fim, bookings.c.horario_fim
+    )).fetchall()
+    for row in rows:
+        connection.execute(
+            bookings.update().where(bookings.c.id == row.id).values(
+                periodo_inicio=_combine_date_and_time(row.data_inicio, row.horario_inicio),
+                periodo_fim=_combine_date_and_time(row.data_fim, row.horario_fim)
+            )
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_bookings_space_periodo', table_name='bookings')
+    op.drop_index('idx_bookings_artist_periodo', table_name='bookings')
+    op.drop_column('bookings', 'periodo_fim')
+    op.drop_column('bookings', 'periodo_inicio')
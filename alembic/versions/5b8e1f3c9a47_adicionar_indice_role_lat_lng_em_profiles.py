@@ -0,0 +1,25 @@
+"""adicionar_indice_role_lat_lng_em_profiles
+
+Revision ID: 5b8e1f3c9a47
+Revises: 37212dd22c82
+Create Date: 2026-10-17 18:40:12.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b8e1f3c9a47'
+down_revision = '37212dd22c82'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Índice para o pré-filtro por bounding box nas buscas por localização
+    op.create_index('idx_profiles_role_lat_lng', 'profiles', ['role_id', 'latitude', 'longitude'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_profiles_role_lat_lng', table_name='profiles')
@@ -0,0 +1,38 @@
+"""adicionar_contracting_events_count_em_spaces
+
+Revision ID: 9d4c2a7e6b15
+Revises: 5b8e1f3c9a47
+Create Date: 2026-10-17 19:05:47.902311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4c2a7e6b15'
+down_revision = '5b8e1f3c9a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Contador desnormalizado de eventos/festivais com status CONTRATANDO por espaço
+    op.add_column('spaces', sa.Column('contracting_events_count', sa.Integer(), nullable=False, server_default='0'))
+    
+    # Popular o contador com os dados existentes
+    op.execute("""
+        UPDATE spaces SET contracting_events_count = (
+            SELECT COUNT(*) FROM space_event_types
+            WHERE space_event_types.space_id = spaces.id
+              AND space_event_types.status = 'CONTRATANDO'
+        ) + (
+            SELECT COUNT(*) FROM space_festival_types
+            WHERE space_festival_types.space_id = spaces.id
+              AND space_festival_types.status = 'CONTRATANDO'
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('spaces', 'contracting_events_count')
@@ -0,0 +1,51 @@
+"""criar_tabela_profile_rating_summaries
+
+Revision ID: a8d3f6c1e2b9
+Revises: 4f6b8d2a9c31
+Create Date: 2026-10-17 23:31:42.518903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d3f6c1e2b9'
+down_revision = '4f6b8d2a9c31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Resumo das avaliações por profile (quantidade, soma e histograma das notas)
+    op.create_table('profile_rating_summaries',
+    sa.Column('profile_id', sa.Integer(), nullable=False),
+    sa.Column('total_reviews', sa.Integer(), nullable=False),
+    sa.Column('soma_notas', sa.Integer(), nullable=False),
+    sa.Column('nota_1', sa.Integer(), nullable=False),
+    sa.Column('nota_2', sa.Integer(), nullable=False),
+    sa.Column('nota_3', sa.Integer(), nullable=False),
+    sa.Column('nota_4', sa.Integer(), nullable=False),
+    sa.Column('nota_5', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['profile_id'], ['profiles.id'], ),
+    sa.PrimaryKeyConstraint('profile_id')
+    )
+    
+    # Popular o resumo a partir das avaliações existentes
+    op.execute("""
+        INSERT INTO profile_rating_summaries
+            (profile_id, total_reviews, soma_notas, nota_1, nota_2, nota_3, nota_4, nota_5)
+        SELECT profile_id, COUNT(*), SUM(nota),
+               SUM(CASE WHEN nota = 1 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN nota = 2 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN nota = 3 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN nota = 4 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN nota = 5 THEN 1 ELSE 0 END)
+        FROM reviews
+        GROUP BY profile_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('profile_rating_summaries')
@@ -0,0 +1,32 @@
+"""criar_tabela_cep_lookups
+
+Revision ID: c3e8a1f4d2b7
+Revises: 9d4c2a7e6b15
+Create Date: 2026-10-17 21:12:31.448210
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e8a1f4d2b7'
+down_revision = '9d4c2a7e6b15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Cache persistente (positivo e negativo) das consultas à ViaCEP
+    op.create_table('cep_lookups',
+    sa.Column('cep', sa.String(length=8), nullable=False),
+    sa.Column('found', sa.Boolean(), nullable=False),
+    sa.Column('cidade', sa.String(length=100), nullable=True),
+    sa.Column('uf', sa.String(length=2), nullable=True),
+    sa.Column('fetched_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('cep')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cep_lookups')
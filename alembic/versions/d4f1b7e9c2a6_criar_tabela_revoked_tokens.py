@@ -0,0 +1,32 @@
+"""criar_tabela_revoked_tokens
+
+Revision ID: d4f1b7e9c2a6
+Revises: a8d3f6c1e2b9
+Create Date: 2026-10-18 09:14:27.903115
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f1b7e9c2a6'
+down_revision = 'a8d3f6c1e2b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tokens revogados (logout) por jti, removidos após o exp do token
+    op.create_table('revoked_tokens',
+    sa.Column('jti', sa.String(length=64), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('jti')
+    )
+    op.create_index(op.f('ix_revoked_tokens_expires_at'), 'revoked_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_revoked_tokens_expires_at'), table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
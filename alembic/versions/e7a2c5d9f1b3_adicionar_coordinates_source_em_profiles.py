@@ -0,0 +1,31 @@
+"""adicionar_coordinates_source_em_profiles
+
+Revision ID: e7a2c5d9f1b3
+Revises: c3e8a1f4d2b7
+Create Date: 2026-10-17 22:03:18.517046
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a2c5d9f1b3'
+down_revision = 'c3e8a1f4d2b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Origem das coordenadas do profile (MANUAL, CIDADE_UF ou VIACEP)
+    op.add_column('profiles', sa.Column('coordinates_source', sa.String(length=20), nullable=True))
+    
+    # Coordenadas já cadastradas foram informadas pelos usuários
+    op.execute("""
+        UPDATE profiles SET coordinates_source = 'MANUAL'
+        WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('profiles', 'coordinates_source')
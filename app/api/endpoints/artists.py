@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
+from typing import List, Optional
 import json
 from app.schemas.artist import ArtistCreate, ArtistResponse, ArtistUpdate, ArtistResponseWithRelations, ArtistListResponse, ArtistListResponseWithRelations
 from app.application.services.artist_service import ArtistService
-from app.application.dependencies import get_artist_service
+from app.application.dependencies import get_artist_service, get_legacy_page_request
+from domain.repositories.pagination import Page, PageRequest
 from app.core.auth import get_current_active_user
 from app.schemas.user import UserResponse
 
@@ -43,13 +44,14 @@ def convert_artist_to_response(artist, include_relations: bool = False):
     else:
         return ArtistResponse.model_validate(artist)
 
-def convert_artists_list_to_response(artists, include_relations: bool = False):
-    """Converter lista de artistas para o schema de resposta apropriado"""
-    converted_artists = [convert_artist_to_response(artist, include_relations) for artist in artists]
+def convert_artists_list_to_response(artists, include_relations: bool = False, page: Optional[PageRequest] = None):
+    """Converter lista (ou página) de artistas para o schema de resposta apropriado"""
+    result = Page.from_rows(artists, page) if page else Page(items=list(artists))
+    converted_artists = [convert_artist_to_response(artist, include_relations) for artist in result.items]
     if include_relations:
-        return ArtistListResponseWithRelations(items=converted_artists)
+        return ArtistListResponseWithRelations(items=converted_artists, next_cursor=result.next_cursor)
     else:
-        return ArtistListResponse(items=converted_artists)
+        return ArtistListResponse(items=converted_artists, next_cursor=result.next_cursor)
 
 router = APIRouter()
 
@@ -71,16 +73,19 @@ def create_artist(
 
 @router.get("/")
 def get_artists(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, description="Paginação por OFFSET (obsoleto; ignorado se houver cursor)"),
+    page: PageRequest = Depends(get_legacy_page_request),
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile e artist_type)"),
     artist_service: ArtistService = Depends(get_artist_service),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Listar todos os artistas (requer autenticação)"""
-    artists = artist_service.get_artists(skip=skip, limit=limit, include_relations=include_relations)
+    if skip and not page.cursor:
+        artists = artist_service.get_artists(skip=skip, limit=page.limit, include_relations=include_relations)
+        return convert_artists_list_to_response(artists, include_relations)
     
-    return convert_artists_list_to_response(artists, include_relations)
+    artists = artist_service.get_artists(include_relations=include_relations, page=page)
+    return convert_artists_list_to_response(artists, include_relations, page=page)
 
 @router.get("/{artist_id}")
 def get_artist(
@@ -119,16 +124,19 @@ def get_artist_by_profile(
 @router.get("/type/{artist_type_id}")
 def get_artists_by_type(
     artist_type_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, description="Paginação por OFFSET (obsoleto; ignorado se houver cursor)"),
+    page: PageRequest = Depends(get_legacy_page_request),
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile e artist_type)"),
     artist_service: ArtistService = Depends(get_artist_service),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Listar artistas por tipo (requer autenticação)"""
-    artists = artist_service.get_artists_by_type(artist_type_id, skip=skip, limit=limit, include_relations=include_relations)
+    if skip and not page.cursor:
+        artists = artist_service.get_artists_by_type(artist_type_id, skip=skip, limit=page.limit, include_relations=include_relations)
+        return convert_artists_list_to_response(artists, include_relations)
     
-    return convert_artists_list_to_response(artists, include_relations)
+    artists = artist_service.get_artists_by_type(artist_type_id, include_relations=include_relations, page=page)
+    return convert_artists_list_to_response(artists, include_relations, page=page)
 
 @router.put("/{artist_id}", response_model=ArtistResponse)
 def update_artist(
@@ -14,16 +14,15 @@ def get_auth_service(user_service: UserService = Depends(get_user_service)) -> A
     return AuthService(user_service)
 
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
-def register(
+async def register(
     user_data: UserRegister,
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Registrar novo usuário"""
     try:
-        user = auth_service.register_user(user_data)
-        # Fazer login automático após registro
-        login_data = UserLogin(email=user_data.email, password=user_data.password)
-        return auth_service.login_user(login_data)
+        user = await auth_service.register_user(user_data)
+        # Login automático após registro (a senha acabou de ser definida)
+        return auth_service.issue_tokens(user)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -31,13 +30,13 @@ def register(
         )
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     user_data: UserLogin,
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Fazer login do usuário"""
     try:
-        return auth_service.login_user(user_data)
+        return await auth_service.login_user(user_data)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -56,8 +55,8 @@ def logout(
         # Extrair token do header Authorization
         if authorization and authorization.startswith("Bearer "):
             token = authorization.replace("Bearer ", "")
-            # Adicionar token à blacklist
-            auth_service.add_token_to_blacklist(token)
+            # Revogar o token até a sua expiração
+            auth_service.revoke_token(token)
         
         return {"message": "Logout realizado com sucesso"}
     except ValueError as e:
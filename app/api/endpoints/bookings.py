@@ -10,8 +10,11 @@ from app.schemas.booking import (
     BookingListWithRelations
 )
 from app.application.services.booking_service import BookingService
-from app.application.dependencies import get_booking_service
+from app.application.dependencies import get_booking_service, get_page_request
+from domain.repositories.pagination import Page, PageRequest
 from app.core.auth import get_current_active_user
+from app.core.config import settings
+from app.api.export import ExportFormat, export_response
 from app.schemas.user import UserResponse
 
 def convert_booking_to_response(booking, include_relations: bool = False):
@@ -58,13 +61,14 @@ def convert_booking_to_response(booking, include_relations: bool = False):
             "updated_at": booking.updated_at
         })
 
-def convert_bookings_list_to_response(bookings, include_relations: bool = False):
-    """Converter lista de agendamentos para o schema de resposta apropriado"""
-    converted_bookings = [convert_booking_to_response(booking, include_relations) for booking in bookings]
+def convert_bookings_list_to_response(bookings, include_relations: bool = False, page: Optional[PageRequest] = None):
+    """Converter lista (ou página) de agendamentos para o schema de resposta apropriado"""
+    result = Page.from_rows(bookings, page) if page else Page(items=list(bookings))
+    converted_bookings = [convert_booking_to_response(booking, include_relations) for booking in result.items]
     if include_relations:
-        return BookingListWithRelations(items=converted_bookings)
+        return BookingListWithRelations(items=converted_bookings, next_cursor=result.next_cursor)
     else:
-        return BookingListResponse(items=converted_bookings)
+        return BookingListResponse(items=converted_bookings, next_cursor=result.next_cursor)
 
 router = APIRouter()
 
@@ -88,66 +92,72 @@ def create_booking(
 def get_all_bookings(
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile, space, artist)"),
     booking_service: BookingService = Depends(get_booking_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os agendamentos (requer autenticação)"""
-    bookings = booking_service.get_all_bookings(include_relations=include_relations)
-    return convert_bookings_list_to_response(bookings, include_relations=include_relations)
+    bookings = booking_service.get_all_bookings(include_relations=include_relations, page=page)
+    return convert_bookings_list_to_response(bookings, include_relations=include_relations, page=page)
 
 @router.get("/profile/{profile_id}")
 def get_bookings_by_profile(
     profile_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile, space, artist)"),
     booking_service: BookingService = Depends(get_booking_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os agendamentos de um profile (requer autenticação)"""
-    bookings = booking_service.get_bookings_by_profile(profile_id, include_relations=include_relations)
-    return convert_bookings_list_to_response(bookings, include_relations=include_relations)
+    bookings = booking_service.get_bookings_by_profile(profile_id, include_relations=include_relations, page=page)
+    return convert_bookings_list_to_response(bookings, include_relations=include_relations, page=page)
 
 @router.get("/space/{space_id}")
 def get_bookings_by_space(
     space_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile, space, artist)"),
     booking_service: BookingService = Depends(get_booking_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os agendamentos de um espaço (requer autenticação)"""
-    bookings = booking_service.get_bookings_by_space(space_id, include_relations=include_relations)
-    return convert_bookings_list_to_response(bookings, include_relations=include_relations)
+    bookings = booking_service.get_bookings_by_space(space_id, include_relations=include_relations, page=page)
+    return convert_bookings_list_to_response(bookings, include_relations=include_relations, page=page)
 
 @router.get("/artist/{artist_id}")
 def get_bookings_by_artist(
     artist_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile, space, artist)"),
     booking_service: BookingService = Depends(get_booking_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os agendamentos de um artista (requer autenticação)"""
-    bookings = booking_service.get_bookings_by_artist(artist_id, include_relations=include_relations)
-    return convert_bookings_list_to_response(bookings, include_relations=include_relations)
+    bookings = booking_service.get_bookings_by_artist(artist_id, include_relations=include_relations, page=page)
+    return convert_bookings_list_to_response(bookings, include_relations=include_relations, page=page)
 
 @router.get("/space-event-type/{space_event_type_id}")
 def get_bookings_by_space_event_type(
     space_event_type_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile, space, artist)"),
     booking_service: BookingService = Depends(get_booking_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os agendamentos de um space-event type (requer autenticação)"""
-    bookings = booking_service.get_bookings_by_space_event_type(space_event_type_id, include_relations=include_relations)
-    return convert_bookings_list_to_response(bookings, include_relations=include_relations)
+    bookings = booking_service.get_bookings_by_space_event_type(space_event_type_id, include_relations=include_relations, page=page)
+    return convert_bookings_list_to_response(bookings, include_relations=include_relations, page=page)
 
 @router.get("/space-festival-type/{space_festival_type_id}")
 def get_bookings_by_space_festival_type(
     space_festival_type_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile, space, artist)"),
     booking_service: BookingService = Depends(get_booking_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os agendamentos de um space-festival type (requer autenticação)"""
-    bookings = booking_service.get_bookings_by_space_festival_type(space_festival_type_id, include_relations=include_relations)
-    return convert_bookings_list_to_response(bookings, include_relations=include_relations)
+    bookings = booking_service.get_bookings_by_space_festival_type(space_festival_type_id, include_relations=include_relations, page=page)
+    return convert_bookings_list_to_response(bookings, include_relations=include_relations, page=page)
 
 @router.get("/date-range")
 def get_bookings_by_date_range(
@@ -155,6 +165,7 @@ def get_bookings_by_date_range(
     data_fim: datetime = Query(..., description="Data de fim (ISO format)"),
     include_relations: bool = Query(False, description="Incluir dados relacionados (profile, space, artist)"),
     booking_service: BookingService = Depends(get_booking_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter agendamentos em um período (requer autenticação)"""
@@ -164,8 +175,21 @@ def get_bookings_by_date_range(
             detail="Data de fim deve ser posterior à data de início"
         )
     
-    bookings = booking_service.get_bookings_by_date_range(data_inicio, data_fim, include_relations=include_relations)
-    return convert_bookings_list_to_response(bookings, include_relations=include_relations)
+    bookings = booking_service.get_bookings_by_date_range(data_inicio, data_fim, include_relations=include_relations, page=page)
+    return convert_bookings_list_to_response(bookings, include_relations=include_relations, page=page)
+
+@router.get("/export")
+def export_bookings(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Formato do arquivo (ndjson ou csv)"),
+    booking_service: BookingService = Depends(get_booking_service),
+    current_user: UserResponse = Depends(get_current_active_user)
+):
+    """Exportar todos os agendamentos em streaming (NDJSON ou CSV) (requer autenticação)"""
+    bookings = booking_service.export_bookings(batch_size=settings.EXPORT_BATCH_SIZE)
+    return export_response(
+        bookings, BookingResponse, format, "bookings",
+        chunk_size=settings.EXPORT_BATCH_SIZE, convert=convert_booking_to_response
+    )
 
 @router.get("/{booking_id}")
 def get_booking(
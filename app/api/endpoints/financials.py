@@ -3,6 +3,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from infrastructure.database.database import get_database_session
 from app.core.auth import get_current_active_user
+from app.core.config import settings
+from app.api.export import ExportFormat, export_response
 from app.application.services.financial_service import FinancialService
 from app.schemas.financial import (
     FinancialCreate, FinancialUpdate, FinancialResponse, FinancialWithRelations,
@@ -10,6 +12,8 @@ from app.schemas.financial import (
     TipoChavePixEnum, PreferenciaTransferenciaEnum
 )
 from app.schemas.user import UserResponse
+from app.application.dependencies import get_page_request
+from domain.repositories.pagination import Page, PageRequest
 
 router = APIRouter()
 
@@ -17,7 +21,7 @@ def get_financial_service(db: Session = Depends(get_database_session)) -> Financ
     return FinancialService(db)
 
 @router.post("/", response_model=FinancialResponse, status_code=201)
-async def create_financial(
+def create_financial(
     financial_data: FinancialCreate,
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
@@ -36,8 +40,18 @@ async def create_financial(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
+@router.get("/export")
+def export_financials(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Formato do arquivo (ndjson ou csv)"),
+    current_user: UserResponse = Depends(get_current_active_user),
+    service: FinancialService = Depends(get_financial_service)
+):
+    """Exportar todos os registros financeiros em streaming (NDJSON ou CSV)"""
+    financials = service.export_financials(batch_size=settings.EXPORT_BATCH_SIZE)
+    return export_response(financials, FinancialResponse, format, "financials", chunk_size=settings.EXPORT_BATCH_SIZE)
+
 @router.get("/{financial_id}", response_model=Union[FinancialResponse, FinancialWithRelations])
-async def get_financial(
+def get_financial(
     financial_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
     current_user: UserResponse = Depends(get_current_active_user),
@@ -53,36 +67,41 @@ async def get_financial(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/", response_model=Union[FinancialListResponse, FinancialListWithRelations])
-async def get_all_financials(
+def get_all_financials(
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
     """Obter todos os registros financeiros"""
     try:
-        financials = service.get_all_financials(include_relations)
-        return {"items": financials}
+        financials = service.get_all_financials(include_relations, page=page)
+        result = Page.from_rows(financials, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/profile/{profile_id}", response_model=Union[FinancialListResponse, FinancialListWithRelations])
-async def get_financials_by_profile(
+def get_financials_by_profile(
     profile_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
     """Obter todos os registros financeiros de um profile"""
     try:
-        financials = service.get_financials_by_profile_id(profile_id, include_relations)
-        return {"items": financials}
+        financials = service.get_financials_by_profile_id(profile_id, include_relations, page=page)
+        result = Page.from_rows(financials, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/banco/{banco}", response_model=Union[FinancialListResponse, FinancialListWithRelations])
-async def get_financials_by_banco(
+def get_financials_by_banco(
     banco: str,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
@@ -96,43 +115,48 @@ async def get_financials_by_banco(
         if banco_num < 1 or banco_num > 999:
             raise HTTPException(status_code=400, detail="Código do banco deve estar entre 001 e 999")
         
-        financials = service.get_financials_by_banco(banco, include_relations)
-        return {"items": financials}
+        financials = service.get_financials_by_banco(banco, include_relations, page=page)
+        result = Page.from_rows(financials, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/tipo-conta/{tipo_conta}", response_model=Union[FinancialListResponse, FinancialListWithRelations])
-async def get_financials_by_tipo_conta(
+def get_financials_by_tipo_conta(
     tipo_conta: TipoContaEnum,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
     """Obter registros financeiros por tipo de conta"""
     try:
-        financials = service.get_financials_by_tipo_conta(tipo_conta, include_relations)
-        return {"items": financials}
+        financials = service.get_financials_by_tipo_conta(tipo_conta, include_relations, page=page)
+        result = Page.from_rows(financials, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/tipo-chave-pix/{tipo_chave_pix}", response_model=Union[FinancialListResponse, FinancialListWithRelations])
-async def get_financials_by_tipo_chave_pix(
+def get_financials_by_tipo_chave_pix(
     tipo_chave_pix: TipoChavePixEnum,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
     """Obter registros financeiros por tipo de chave PIX"""
     try:
-        financials = service.get_financials_by_tipo_chave_pix(tipo_chave_pix, include_relations)
-        return {"items": financials}
+        financials = service.get_financials_by_tipo_chave_pix(tipo_chave_pix, include_relations, page=page)
+        result = Page.from_rows(financials, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/chave-pix/{chave_pix}", response_model=Union[FinancialResponse, FinancialWithRelations])
-async def get_financial_by_chave_pix(
+def get_financial_by_chave_pix(
     chave_pix: str,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
     current_user: UserResponse = Depends(get_current_active_user),
@@ -150,35 +174,39 @@ async def get_financial_by_chave_pix(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/preferencia/{preferencia}", response_model=Union[FinancialListResponse, FinancialListWithRelations])
-async def get_financials_by_preferencia(
+def get_financials_by_preferencia(
     preferencia: PreferenciaTransferenciaEnum,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
     """Obter registros financeiros por preferência de transferência"""
     try:
-        financials = service.get_financials_by_preferencia(preferencia, include_relations)
-        return {"items": financials}
+        financials = service.get_financials_by_preferencia(preferencia, include_relations, page=page)
+        result = Page.from_rows(financials, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/cpf-cnpj/{cpf_cnpj}", response_model=Union[FinancialListResponse, FinancialListWithRelations])
-async def get_financials_by_cpf_cnpj(
+def get_financials_by_cpf_cnpj(
     cpf_cnpj: str,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
     """Obter registros financeiros por CPF/CNPJ"""
     try:
-        financials = service.get_financials_by_cpf_cnpj(cpf_cnpj, include_relations)
-        return {"items": financials}
+        financials = service.get_financials_by_cpf_cnpj(cpf_cnpj, include_relations, page=page)
+        result = Page.from_rows(financials, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/check-chave-pix/{chave_pix}")
-async def check_chave_pix_availability(
+def check_chave_pix_availability(
     chave_pix: str,
     exclude_id: int = Query(None, description="ID a ser excluído da verificação"),
     current_user: UserResponse = Depends(get_current_active_user),
@@ -196,7 +224,7 @@ async def check_chave_pix_availability(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/statistics/banks")
-async def get_banks_statistics(
+def get_banks_statistics(
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
@@ -211,7 +239,7 @@ async def get_banks_statistics(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/statistics/pix-types")
-async def get_pix_types_statistics(
+def get_pix_types_statistics(
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
 ):
@@ -225,8 +253,38 @@ async def get_pix_types_statistics(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
+@router.get("/statistics/preferencias")
+def get_preferencias_statistics(
+    current_user: UserResponse = Depends(get_current_active_user),
+    service: FinancialService = Depends(get_financial_service)
+):
+    """Obter estatísticas de preferências de transferência"""
+    try:
+        preferencias_summary = service.get_preferencias_summary()
+        return {
+            "total_preferencias": len(preferencias_summary),
+            "preferencias": preferencias_summary
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
+
+@router.get("/statistics/tipos-conta")
+def get_tipos_conta_statistics(
+    current_user: UserResponse = Depends(get_current_active_user),
+    service: FinancialService = Depends(get_financial_service)
+):
+    """Obter estatísticas de tipos de conta"""
+    try:
+        tipos_conta_summary = service.get_tipos_conta_summary()
+        return {
+            "total_tipos_conta": len(tipos_conta_summary),
+            "tipos_conta": tipos_conta_summary
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
+
 @router.put("/{financial_id}", response_model=FinancialResponse)
-async def update_financial(
+def update_financial(
     financial_id: int,
     financial_data: FinancialUpdate,
     current_user: UserResponse = Depends(get_current_active_user),
@@ -249,7 +307,7 @@ async def update_financial(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.delete("/{financial_id}", status_code=200)
-async def delete_financial(
+def delete_financial(
     financial_id: int,
     current_user: UserResponse = Depends(get_current_active_user),
     service: FinancialService = Depends(get_financial_service)
@@ -13,8 +13,11 @@ from app.schemas.interest import (
     StatusInterestEnum
 )
 from app.application.services.interest_service import InterestService
-from app.application.dependencies import get_interest_service, get_profile_service
+from app.application.dependencies import get_interest_service, get_read_interest_service, get_profile_service, get_page_request
+from domain.repositories.pagination import Page, PageRequest
 from app.core.auth import get_current_active_user
+from app.core.config import settings
+from app.api.export import ExportFormat, export_response
 from app.schemas.user import UserResponse
 from domain.entities.interest import StatusInterest
 
@@ -67,13 +70,14 @@ def convert_interest_to_response(interest, include_relations: bool = False):
             "updated_at": interest.updated_at
         })
 
-def convert_interests_list_to_response(interests, include_relations: bool = False):
-    """Converter lista de manifestações de interesse para o schema de resposta apropriado"""
-    converted_interests = [convert_interest_to_response(interest, include_relations) for interest in interests]
+def convert_interests_list_to_response(interests, include_relations: bool = False, page: Optional[PageRequest] = None):
+    """Converter lista (ou página) de manifestações de interesse para o schema de resposta apropriado"""
+    result = Page.from_rows(interests, page) if page else Page(items=list(interests))
+    converted_interests = [convert_interest_to_response(interest, include_relations) for interest in result.items]
     if include_relations:
-        return InterestListWithRelations(items=converted_interests)
+        return InterestListWithRelations(items=converted_interests, next_cursor=result.next_cursor)
     else:
-        return InterestListResponse(items=converted_interests)
+        return InterestListResponse(items=converted_interests, next_cursor=result.next_cursor)
 
 router = APIRouter()
 
@@ -96,18 +100,32 @@ def create_interest(
 @router.get("/")
 def get_all_interests(
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todas as manifestações de interesse (requer autenticação)"""
-    interests = interest_service.get_all_interests(include_relations=include_relations)
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    interests = interest_service.get_all_interests(include_relations=include_relations, page=page)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
+
+@router.get("/export")
+def export_interests(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Formato do arquivo (ndjson ou csv)"),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    current_user: UserResponse = Depends(get_current_active_user)
+):
+    """Exportar todas as manifestações de interesse em streaming (NDJSON ou CSV) (requer autenticação)"""
+    interests = interest_service.export_interests(batch_size=settings.EXPORT_BATCH_SIZE)
+    return export_response(
+        interests, InterestResponse, format, "interests",
+        chunk_size=settings.EXPORT_BATCH_SIZE, convert=convert_interest_to_response
+    )
 
 @router.get("/{interest_id}")
 def get_interest_by_id(
     interest_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter uma manifestação de interesse por ID (requer autenticação)"""
@@ -123,39 +141,42 @@ def get_interest_by_id(
 def get_interests_by_profile_interessado(
     profile_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todas as manifestações de interesse feitas por um profile (requer autenticação)"""
-    interests = interest_service.get_interests_by_profile_interessado(profile_id, include_relations=include_relations)
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    interests = interest_service.get_interests_by_profile_interessado(profile_id, include_relations=include_relations, page=page)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
 
 @router.get("/profile/interesse/{profile_id}")
 def get_interests_by_profile_interesse(
     profile_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todas as manifestações de interesse recebidas por um profile (requer autenticação)"""
-    interests = interest_service.get_interests_by_profile_interesse(profile_id, include_relations=include_relations)
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    interests = interest_service.get_interests_by_profile_interesse(profile_id, include_relations=include_relations, page=page)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
 
 @router.get("/profile/{profile_id}/pending")
 def get_pending_interests_for_profile(
     profile_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter manifestações de interesse pendentes para um profile (requer autenticação)"""
-    interests = interest_service.get_pending_interests_for_profile(profile_id, include_relations=include_relations)
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    interests = interest_service.get_pending_interests_for_profile(profile_id, include_relations=include_relations, page=page)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
 
 @router.get("/profile/{profile_id}/statistics", response_model=InterestStatistics)
 def get_interest_statistics(
     profile_id: int,
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter estatísticas de interesse para um profile (requer autenticação)"""
@@ -166,14 +187,15 @@ def get_interest_statistics(
 def get_interests_by_status(
     status: StatusInterestEnum,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter manifestações de interesse por status (requer autenticação)"""
     # Converter enum do schema para enum da entidade
     status_entity = StatusInterest(status.value)
-    interests = interest_service.get_interests_by_status(status_entity, include_relations=include_relations)
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    interests = interest_service.get_interests_by_status(status_entity, include_relations=include_relations, page=page)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
 
 @router.get("/profile/{profile_id}/status/{status}")
 def get_interests_by_profile_and_status(
@@ -181,7 +203,8 @@ def get_interests_by_profile_and_status(
     status: StatusInterestEnum,
     is_interessado: bool = Query(True, description="True para buscar como interessado, False para buscar como pessoa de interesse"),
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter manifestações de interesse de um profile filtradas por status (requer autenticação)"""
@@ -190,36 +213,39 @@ def get_interests_by_profile_and_status(
     interests = interest_service.get_interests_by_profile_and_status(
         profile_id, status_entity, is_interessado, include_relations=include_relations
     )
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
 
 @router.get("/space-event-type/{space_event_type_id}")
 def get_interests_by_space_event_type(
     space_event_type_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter manifestações de interesse relacionadas a um space-event type (requer autenticação)"""
-    interests = interest_service.get_interests_by_space_event_type(space_event_type_id, include_relations=include_relations)
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    interests = interest_service.get_interests_by_space_event_type(space_event_type_id, include_relations=include_relations, page=page)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
 
 @router.get("/space-festival-type/{space_festival_type_id}")
 def get_interests_by_space_festival_type(
     space_festival_type_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter manifestações de interesse relacionadas a um space-festival type (requer autenticação)"""
-    interests = interest_service.get_interests_by_space_festival_type(space_festival_type_id, include_relations=include_relations)
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    interests = interest_service.get_interests_by_space_festival_type(space_festival_type_id, include_relations=include_relations, page=page)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
 
 @router.get("/date-range/")
 def get_interests_by_date_range(
     data_inicio: date = Query(..., description="Data inicial (formato: YYYY-MM-DD)"),
     data_fim: date = Query(..., description="Data final (formato: YYYY-MM-DD)"),
     include_relations: bool = Query(False, description="Incluir dados relacionados (profiles, space_event_type, space_festival_type)"),
-    interest_service: InterestService = Depends(get_interest_service),
+    interest_service: InterestService = Depends(get_read_interest_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter manifestações de interesse em um período (requer autenticação)"""
@@ -229,8 +255,8 @@ def get_interests_by_date_range(
             detail="Data final deve ser posterior à data inicial"
         )
     
-    interests = interest_service.get_interests_by_date_range(data_inicio, data_fim, include_relations=include_relations)
-    return convert_interests_list_to_response(interests, include_relations=include_relations)
+    interests = interest_service.get_interests_by_date_range(data_inicio, data_fim, include_relations=include_relations, page=page)
+    return convert_interests_list_to_response(interests, include_relations=include_relations, page=page)
 
 @router.put("/{interest_id}", response_model=InterestResponse)
 def update_interest(
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from app.core.auth import get_current_active_user
+from app.schemas.user import UserResponse
+from app.core.password_hasher import password_hasher
+from infrastructure.database.database import get_pool_metrics
+
+router = APIRouter()
+
+@router.get("/db-pool")
+def get_db_pool_metrics(current_user: UserResponse = Depends(get_current_active_user)):
+    """
+    Métricas dos pools de conexões do banco (requer autenticação)
+
+    Conexões em uso/ociosas/excedentes no momento e, desde o início do processo,
+    quantidade de checkouts, tempo de espera por conexão e timeouts. Os valores
+    são por processo (worker).
+    """
+    return get_pool_metrics()
+
+
+@router.get("/password-hasher")
+def get_password_hasher_metrics(current_user: UserResponse = Depends(get_current_active_user)):
+    """
+    Métricas do pool de processos de hash de senhas (requer autenticação)
+
+    Operações em andamento/na fila, rejeitadas por fila cheia (503) e tempos médios de
+    espera na fila e de execução do bcrypt, por processo (worker).
+    """
+    return password_hasher.stats()
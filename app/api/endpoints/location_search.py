@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
-from infrastructure.database.database import get_database_session
+from infrastructure.database.database import get_read_database_session
 from app.application.services.location_search_service import LocationSearchService
 from app.schemas.location_search import (
     LocationSearchResponse,
@@ -20,8 +20,8 @@ from app.core.location_utils import get_location_by_cep, get_location_by_city_st
 
 router = APIRouter()
 
-def get_location_search_service(db: Session = Depends(get_database_session)) -> LocationSearchService:
-    """Dependency para obter o serviço de busca por localização"""
+def get_location_search_service(db: Session = Depends(get_read_database_session)) -> LocationSearchService:
+    """Dependency para obter o serviço de busca por localização (somente leitura)"""
     artist_repository = ArtistRepositoryImpl(db)
     space_repository = SpaceRepositoryImpl(db)
     profile_repository = ProfileRepositoryImpl(db)
@@ -39,7 +39,7 @@ def get_location_search_service(db: Session = Depends(get_database_session)) ->
     )
 
 @router.get("/cep/{cep}")
-async def search_by_cep(cep: str):
+def search_by_cep(cep: str):
     """Buscar localização por CEP"""
     try:
         location = get_location_by_cep(cep)
@@ -50,7 +50,7 @@ async def search_by_cep(cep: str):
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/city/{city}/state/{state}")
-async def search_by_city_state(city: str, state: str):
+def search_by_city_state(city: str, state: str):
     """Buscar localização por cidade e estado"""
     try:
         location = get_location_by_city_state(city, state)
@@ -61,7 +61,7 @@ async def search_by_city_state(city: str, state: str):
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/coordinates")
-async def search_by_coordinates(
+def search_by_coordinates(
     lat: float = Query(..., description="Latitude"),
     lng: float = Query(..., description="Longitude")
 ):
@@ -75,11 +75,11 @@ async def search_by_coordinates(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/spaces-for-artist", response_model=LocationSearchResponse)
-async def search_spaces_for_artist(
+def search_spaces_for_artist(
     return_full_data: bool = Query(True, description="Retornar dados completos ou apenas IDs"),
     max_results: Optional[int] = Query(100, description="Limite máximo de resultados"),
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_database_session),
+    db: Session = Depends(get_read_database_session),
     location_service: LocationSearchService = Depends(get_location_search_service)
 ):
     """
@@ -119,11 +119,11 @@ async def search_spaces_for_artist(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/artists-for-space", response_model=LocationSearchResponse)
-async def search_artists_for_space(
+def search_artists_for_space(
     return_full_data: bool = Query(True, description="Retornar dados completos ou apenas IDs"),
     max_results: Optional[int] = Query(100, description="Limite máximo de resultados"),
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_database_session),
+    db: Session = Depends(get_read_database_session),
     location_service: LocationSearchService = Depends(get_location_search_service)
 ):
     """
@@ -163,10 +163,10 @@ async def search_artists_for_space(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.post("/spaces-for-artist", response_model=LocationSearchResponse)
-async def search_spaces_for_artist_post(
+def search_spaces_for_artist_post(
     request: LocationSearchRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_database_session),
+    db: Session = Depends(get_read_database_session),
     location_service: LocationSearchService = Depends(get_location_search_service)
 ):
     """
@@ -202,10 +202,10 @@ async def search_spaces_for_artist_post(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.post("/artists-for-space", response_model=LocationSearchResponse)
-async def search_artists_for_space_post(
+def search_artists_for_space_post(
     request: LocationSearchRequest,
     current_user: UserResponse = Depends(get_current_user),
-    db: Session = Depends(get_database_session),
+    db: Session = Depends(get_read_database_session),
     location_service: LocationSearchService = Depends(get_location_search_service)
 ):
     """
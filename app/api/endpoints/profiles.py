@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from typing import List
 from app.schemas.profile import ProfileCreate, ProfileResponse, ProfileUpdate
-from app.application.services.profile_service import ProfileService
-from app.application.dependencies import get_profile_service
+from app.application.services.profile_service import ProfileService, AsyncProfileService
+from app.application.dependencies import get_profile_service, get_legacy_page_request, get_async_profile_service
+from domain.repositories.pagination import Page, PageRequest
 from app.core.auth import get_current_active_user
 from app.schemas.user import UserResponse
 
@@ -26,23 +27,28 @@ def create_profile(
 
 @router.get("/", response_model=List[ProfileResponse])
 def get_profiles(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Paginação por OFFSET (obsoleto; ignorado se houver cursor)"),
+    page: PageRequest = Depends(get_legacy_page_request),
     profile_service: ProfileService = Depends(get_profile_service),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
-    """Listar todos os profiles (requer autenticação)"""
-    profiles = profile_service.get_profiles(skip=skip, limit=limit)
-    return profiles
+    """Listar todos os profiles (requer autenticação); o cursor da próxima página vem no header X-Next-Cursor"""
+    if skip and not page.cursor:
+        return profile_service.get_profiles(skip=skip, limit=page.limit)
+    result = Page.from_rows(profile_service.get_profiles(page=page), page)
+    if result.next_cursor:
+        response.headers["X-Next-Cursor"] = result.next_cursor
+    return result.items
 
 @router.get("/{profile_id}", response_model=ProfileResponse)
-def get_profile(
+async def get_profile(
     profile_id: int,
-    profile_service: ProfileService = Depends(get_profile_service),
+    profile_service: AsyncProfileService = Depends(get_async_profile_service),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter um profile específico (requer autenticação)"""
-    profile = profile_service.get_profile_by_id(profile_id)
+    profile = await profile_service.get_profile_by_id(profile_id)
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
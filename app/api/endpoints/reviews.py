@@ -2,23 +2,32 @@ from typing import List, Union
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from infrastructure.database.database import get_database_session
+from infrastructure.database.database import get_database_session, get_read_database_session
 from infrastructure.database.models.profile_model import ProfileModel
 from app.core.auth import get_current_active_user
-from app.application.services.review_service import ReviewService
+from app.core.config import settings
+from app.api.export import ExportFormat, export_response
+from app.application.services.review_service import ReviewService, AsyncReviewService
 from app.schemas.review import (
     ReviewCreate, ReviewUpdate, ReviewResponse, ReviewWithRelations,
-    ReviewListResponse, ReviewListWithRelations, ProfileAverageRating
+    ReviewListResponse, ReviewListWithRelations, ProfileAverageRating,
+    ProfileRatingSummaryList
 )
 from app.schemas.user import UserResponse
+from app.application.dependencies import get_page_request, get_async_review_service
+from domain.repositories.pagination import Page, PageRequest
 
 router = APIRouter()
 
 def get_review_service(db: Session = Depends(get_database_session)) -> ReviewService:
     return ReviewService(db)
 
+def get_read_review_service(db: Session = Depends(get_read_database_session)) -> ReviewService:
+    """Serviço sobre a sessão somente leitura (endpoints GET)"""
+    return ReviewService(db)
+
 @router.post("/", response_model=ReviewResponse, status_code=201)
-async def create_review(
+def create_review(
     review_data: ReviewCreate,
     current_user: UserResponse = Depends(get_current_active_user),
     service: ReviewService = Depends(get_review_service),
@@ -47,12 +56,22 @@ async def create_review(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
+@router.get("/export")
+def export_reviews(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Formato do arquivo (ndjson ou csv)"),
+    current_user: UserResponse = Depends(get_current_active_user),
+    service: ReviewService = Depends(get_read_review_service)
+):
+    """Exportar todas as avaliações em streaming (NDJSON ou CSV)"""
+    reviews = service.export_reviews(batch_size=settings.EXPORT_BATCH_SIZE)
+    return export_response(reviews, ReviewResponse, format, "reviews", chunk_size=settings.EXPORT_BATCH_SIZE)
+
 @router.get("/{review_id}", response_model=ReviewWithRelations)
-async def get_review(
+def get_review(
     review_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
     current_user: UserResponse = Depends(get_current_active_user),
-    service: ReviewService = Depends(get_review_service)
+    service: ReviewService = Depends(get_read_review_service)
 ):
     """Obter uma avaliação por ID"""
     try:
@@ -64,29 +83,33 @@ async def get_review(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/", response_model=ReviewListWithRelations)
-async def get_all_reviews(
+def get_all_reviews(
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
-    service: ReviewService = Depends(get_review_service)
+    service: ReviewService = Depends(get_read_review_service)
 ):
     """Obter todas as avaliações"""
     try:
-        reviews = service.get_all_reviews(include_relations)
-        return {"items": reviews}
+        reviews = service.get_all_reviews(include_relations, page=page)
+        result = Page.from_rows(reviews, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/profile/{profile_id}", response_model=ReviewListWithRelations)
-async def get_reviews_by_profile(
+def get_reviews_by_profile(
     profile_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
-    service: ReviewService = Depends(get_review_service)
+    service: ReviewService = Depends(get_read_review_service)
 ):
     """Obter todas as avaliações de um profile"""
     try:
-        reviews = service.get_reviews_by_profile_id(profile_id, include_relations)
-        return {"items": reviews}
+        reviews = service.get_reviews_by_profile_id(profile_id, include_relations, page=page)
+        result = Page.from_rows(reviews, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
@@ -94,84 +117,103 @@ async def get_reviews_by_profile(
 async def get_profile_average_rating(
     profile_id: int,
     current_user: UserResponse = Depends(get_current_active_user),
-    service: ReviewService = Depends(get_review_service)
+    service: AsyncReviewService = Depends(get_async_review_service)
 ):
     """Obter a média de avaliações de um profile"""
     try:
-        rating_data = service.get_average_rating_by_profile(profile_id)
-        return rating_data
+        return await service.get_average_rating_by_profile(profile_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
+
+@router.get("/profiles/ratings", response_model=ProfileRatingSummaryList)
+async def get_profiles_ratings(
+    profile_ids: List[int] = Query(..., description="IDs dos profiles"),
+    current_user: UserResponse = Depends(get_current_active_user),
+    service: AsyncReviewService = Depends(get_async_review_service)
+):
+    """Obter média, quantidade e distribuição das notas de vários profiles"""
+    try:
+        return {"items": await service.get_rating_summaries(profile_ids)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/space-event-type/{space_event_type_id}", response_model=ReviewListWithRelations)
-async def get_reviews_by_space_event_type(
+def get_reviews_by_space_event_type(
     space_event_type_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
-    service: ReviewService = Depends(get_review_service)
+    service: ReviewService = Depends(get_read_review_service)
 ):
     """Obter todas as avaliações de um space-event type"""
     try:
-        reviews = service.get_reviews_by_space_event_type_id(space_event_type_id, include_relations)
-        return {"items": reviews}
+        reviews = service.get_reviews_by_space_event_type_id(space_event_type_id, include_relations, page=page)
+        result = Page.from_rows(reviews, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/space-festival-type/{space_festival_type_id}", response_model=ReviewListWithRelations)
-async def get_reviews_by_space_festival_type(
+def get_reviews_by_space_festival_type(
     space_festival_type_id: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
-    service: ReviewService = Depends(get_review_service)
+    service: ReviewService = Depends(get_read_review_service)
 ):
     """Obter todas as avaliações de um space-festival type"""
     try:
-        reviews = service.get_reviews_by_space_festival_type_id(space_festival_type_id, include_relations)
-        return {"items": reviews}
+        reviews = service.get_reviews_by_space_festival_type_id(space_festival_type_id, include_relations, page=page)
+        result = Page.from_rows(reviews, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/rating/{nota}", response_model=ReviewListWithRelations)
-async def get_reviews_by_rating(
+def get_reviews_by_rating(
     nota: int,
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
-    service: ReviewService = Depends(get_review_service)
+    service: ReviewService = Depends(get_read_review_service)
 ):
     """Obter todas as avaliações com uma nota específica"""
     try:
         if nota < 1 or nota > 5:
             raise HTTPException(status_code=400, detail="Nota deve estar entre 1 e 5")
         
-        reviews = service.get_reviews_by_nota(nota, include_relations)
-        return {"items": reviews}
+        reviews = service.get_reviews_by_nota(nota, include_relations, page=page)
+        result = Page.from_rows(reviews, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.get("/date-range/", response_model=ReviewListWithRelations)
-async def get_reviews_by_date_range(
+def get_reviews_by_date_range(
     data_inicio: datetime = Query(..., description="Data de início (YYYY-MM-DD HH:MM:SS)"),
     data_fim: datetime = Query(..., description="Data de fim (YYYY-MM-DD HH:MM:SS)"),
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user),
-    service: ReviewService = Depends(get_review_service)
+    service: ReviewService = Depends(get_read_review_service)
 ):
     """Obter avaliações em um período"""
     try:
         if data_inicio >= data_fim:
             raise HTTPException(status_code=400, detail="Data de início deve ser anterior à data de fim")
         
-        reviews = service.get_reviews_by_date_range(data_inicio, data_fim, include_relations)
-        return {"items": reviews}
+        reviews = service.get_reviews_by_date_range(data_inicio, data_fim, include_relations, page=page)
+        result = Page.from_rows(reviews, page)
+        return {"items": result.items, "next_cursor": result.next_cursor}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.put("/{review_id}", response_model=ReviewResponse)
-async def update_review(
+def update_review(
     review_id: int,
     review_data: ReviewUpdate,
     current_user: UserResponse = Depends(get_current_active_user),
@@ -210,7 +252,7 @@ async def update_review(
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
 @router.delete("/{review_id}", status_code=200)
-async def delete_review(
+def delete_review(
     review_id: int,
     current_user: UserResponse = Depends(get_current_active_user),
     service: ReviewService = Depends(get_review_service)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
+from typing import List, Optional
 from app.schemas.space_event_type import (
     SpaceEventTypeCreate, 
     SpaceEventTypeUpdate,
@@ -8,7 +8,8 @@ from app.schemas.space_event_type import (
     SpaceEventTypeListResponse
 )
 from app.application.services.space_event_type_service import SpaceEventTypeService
-from app.application.dependencies import get_space_event_type_service
+from app.application.dependencies import get_space_event_type_service, get_page_request
+from domain.repositories.pagination import Page, PageRequest
 from app.core.auth import get_current_active_user
 from app.schemas.user import UserResponse
 
@@ -28,10 +29,11 @@ def convert_space_event_type_to_response(space_event_type):
         "created_at": space_event_type.created_at
     })
 
-def convert_space_event_types_list_to_response(space_event_types):
-    """Converter lista de relacionamentos para o schema de resposta"""
-    converted_items = [convert_space_event_type_to_response(item) for item in space_event_types]
-    return SpaceEventTypeListResponse(items=converted_items)
+def convert_space_event_types_list_to_response(space_event_types, page: Optional[PageRequest] = None):
+    """Converter lista (ou página) de relacionamentos para o schema de resposta"""
+    result = Page.from_rows(space_event_types, page) if page else Page(items=list(space_event_types))
+    converted_items = [convert_space_event_type_to_response(item) for item in result.items]
+    return SpaceEventTypeListResponse(items=converted_items, next_cursor=result.next_cursor)
 
 router = APIRouter()
 
@@ -54,42 +56,46 @@ def create_space_event_type(
 @router.get("/", response_model=SpaceEventTypeListResponse)
 def get_all_space_event_types(
     space_event_type_service: SpaceEventTypeService = Depends(get_space_event_type_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os relacionamentos (requer autenticação)"""
-    space_event_types = space_event_type_service.get_all_space_event_types()
-    return convert_space_event_types_list_to_response(space_event_types)
+    space_event_types = space_event_type_service.get_all_space_event_types(page=page)
+    return convert_space_event_types_list_to_response(space_event_types, page=page)
 
 @router.get("/space/{space_id}", response_model=SpaceEventTypeListResponse)
 def get_event_types_by_space(
     space_id: int,
     space_event_type_service: SpaceEventTypeService = Depends(get_space_event_type_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os tipos de eventos de um espaço (requer autenticação)"""
-    space_event_types = space_event_type_service.get_event_types_by_space(space_id)
-    return convert_space_event_types_list_to_response(space_event_types)
+    space_event_types = space_event_type_service.get_event_types_by_space(space_id, page=page)
+    return convert_space_event_types_list_to_response(space_event_types, page=page)
 
 @router.get("/event-type/{event_type_id}", response_model=SpaceEventTypeListResponse)
 def get_spaces_by_event_type(
     event_type_id: int,
     space_event_type_service: SpaceEventTypeService = Depends(get_space_event_type_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os espaços de um tipo de evento (requer autenticação)"""
-    space_event_types = space_event_type_service.get_spaces_by_event_type(event_type_id)
-    return convert_space_event_types_list_to_response(space_event_types)
+    space_event_types = space_event_type_service.get_spaces_by_event_type(event_type_id, page=page)
+    return convert_space_event_types_list_to_response(space_event_types, page=page)
 
 @router.get("/space/{space_id}/event-type/{event_type_id}", response_model=SpaceEventTypeListResponse)
 def get_space_event_types_by_space_and_event_type(
     space_id: int,
     event_type_id: int,
     space_event_type_service: SpaceEventTypeService = Depends(get_space_event_type_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter relacionamentos específicos entre espaço e tipo de evento (requer autenticação)"""
-    space_event_types = space_event_type_service.get_space_event_types_by_space_and_event_type(space_id, event_type_id)
-    return convert_space_event_types_list_to_response(space_event_types)
+    space_event_types = space_event_type_service.get_space_event_types_by_space_and_event_type(space_id, event_type_id, page=page)
+    return convert_space_event_types_list_to_response(space_event_types, page=page)
 
 @router.get("/{space_event_type_id}", response_model=SpaceEventTypeResponse)
 def get_space_event_type(
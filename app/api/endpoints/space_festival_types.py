@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
+from typing import List, Optional
 from app.schemas.space_festival_type import (
     SpaceFestivalTypeCreate, 
     SpaceFestivalTypeUpdate,
@@ -8,7 +8,8 @@ from app.schemas.space_festival_type import (
     SpaceFestivalTypeListResponse
 )
 from app.application.services.space_festival_type_service import SpaceFestivalTypeService
-from app.application.dependencies import get_space_festival_type_service
+from app.application.dependencies import get_space_festival_type_service, get_page_request
+from domain.repositories.pagination import Page, PageRequest
 from app.core.auth import get_current_active_user
 from app.schemas.user import UserResponse
 
@@ -28,10 +29,11 @@ def convert_space_festival_type_to_response(space_festival_type):
         "created_at": space_festival_type.created_at
     })
 
-def convert_space_festival_types_list_to_response(space_festival_types):
-    """Converter lista de relacionamentos para o schema de resposta"""
-    converted_items = [convert_space_festival_type_to_response(item) for item in space_festival_types]
-    return SpaceFestivalTypeListResponse(items=converted_items)
+def convert_space_festival_types_list_to_response(space_festival_types, page: Optional[PageRequest] = None):
+    """Converter lista (ou página) de relacionamentos para o schema de resposta"""
+    result = Page.from_rows(space_festival_types, page) if page else Page(items=list(space_festival_types))
+    converted_items = [convert_space_festival_type_to_response(item) for item in result.items]
+    return SpaceFestivalTypeListResponse(items=converted_items, next_cursor=result.next_cursor)
 
 router = APIRouter()
 
@@ -54,42 +56,46 @@ def create_space_festival_type(
 @router.get("/", response_model=SpaceFestivalTypeListResponse)
 def get_all_space_festival_types(
     space_festival_type_service: SpaceFestivalTypeService = Depends(get_space_festival_type_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os relacionamentos (requer autenticação)"""
-    space_festival_types = space_festival_type_service.get_all_space_festival_types()
-    return convert_space_festival_types_list_to_response(space_festival_types)
+    space_festival_types = space_festival_type_service.get_all_space_festival_types(page=page)
+    return convert_space_festival_types_list_to_response(space_festival_types, page=page)
 
 @router.get("/space/{space_id}", response_model=SpaceFestivalTypeListResponse)
 def get_festival_types_by_space(
     space_id: int,
     space_festival_type_service: SpaceFestivalTypeService = Depends(get_space_festival_type_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os tipos de festivais de um espaço (requer autenticação)"""
-    space_festival_types = space_festival_type_service.get_festival_types_by_space(space_id)
-    return convert_space_festival_types_list_to_response(space_festival_types)
+    space_festival_types = space_festival_type_service.get_festival_types_by_space(space_id, page=page)
+    return convert_space_festival_types_list_to_response(space_festival_types, page=page)
 
 @router.get("/festival-type/{festival_type_id}", response_model=SpaceFestivalTypeListResponse)
 def get_spaces_by_festival_type(
     festival_type_id: int,
     space_festival_type_service: SpaceFestivalTypeService = Depends(get_space_festival_type_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter todos os espaços de um tipo de festival (requer autenticação)"""
-    space_festival_types = space_festival_type_service.get_spaces_by_festival_type(festival_type_id)
-    return convert_space_festival_types_list_to_response(space_festival_types)
+    space_festival_types = space_festival_type_service.get_spaces_by_festival_type(festival_type_id, page=page)
+    return convert_space_festival_types_list_to_response(space_festival_types, page=page)
 
 @router.get("/space/{space_id}/festival-type/{festival_type_id}", response_model=SpaceFestivalTypeListResponse)
 def get_space_festival_types_by_space_and_festival_type(
     space_id: int,
     festival_type_id: int,
     space_festival_type_service: SpaceFestivalTypeService = Depends(get_space_festival_type_service),
+    page: PageRequest = Depends(get_page_request),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
     """Obter relacionamentos específicos entre espaço e tipo de festival (requer autenticação)"""
-    space_festival_types = space_festival_type_service.get_space_festival_types_by_space_and_festival_type(space_id, festival_type_id)
-    return convert_space_festival_types_list_to_response(space_festival_types)
+    space_festival_types = space_festival_type_service.get_space_festival_types_by_space_and_festival_type(space_id, festival_type_id, page=page)
+    return convert_space_festival_types_list_to_response(space_festival_types, page=page)
 
 @router.get("/{space_festival_type_id}", response_model=SpaceFestivalTypeResponse)
 def get_space_festival_type(
@@ -1,8 +1,9 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from app.schemas.space import SpaceCreate, SpaceUpdate, SpaceResponse, SpaceResponseWithRelations
 from app.application.services.space_service import SpaceService
-from app.application.dependencies import get_space_service
+from app.application.dependencies import get_space_service, get_legacy_page_request
+from domain.repositories.pagination import Page, PageRequest
 
 router = APIRouter()
 
@@ -23,13 +24,19 @@ def create_space(
 
 @router.get("/")
 def get_spaces(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Paginação por OFFSET (obsoleto; ignorado se houver cursor)"),
+    page: PageRequest = Depends(get_legacy_page_request),
     include_relations: bool = Query(False, description="Incluir dados relacionados"),
     space_service: SpaceService = Depends(get_space_service)
 ):
-    """Listar todos os espaços"""
-    return space_service.get_all_spaces(skip=skip, limit=limit, include_relations=include_relations)
+    """Listar todos os espaços; o cursor da próxima página vem no header X-Next-Cursor"""
+    if skip and not page.cursor:
+        return space_service.get_all_spaces(skip=skip, limit=page.limit, include_relations=include_relations)
+    result = Page.from_rows(space_service.get_all_spaces(include_relations=include_relations, page=page), page)
+    if result.next_cursor:
+        response.headers["X-Next-Cursor"] = result.next_cursor
+    return result.items
 
 @router.get("/{space_id}")
 def get_space(
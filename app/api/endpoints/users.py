@@ -1,23 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from typing import List
 from app.schemas.user import UserCreate, UserResponse, UserUpdate
 from app.schemas.auth import UserRegister
 from app.application.services.user_service import UserService
 from app.application.services.auth_service import AuthService
-from app.application.dependencies import get_user_service
+from app.application.dependencies import get_user_service, get_legacy_page_request
+from domain.repositories.pagination import Page, PageRequest
 from app.core.auth import get_current_active_user
 
 router = APIRouter()
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def create_user(
+async def create_user(
     user_data: UserRegister,
     user_service: UserService = Depends(get_user_service)
 ):
     """Criar um novo usuário"""
     try:
         auth_service = AuthService(user_service)
-        user = auth_service.register_user(user_data)
+        user = await auth_service.register_user(user_data)
         return user
     except ValueError as e:
         raise HTTPException(
@@ -34,14 +35,19 @@ def get_current_user_info(
 
 @router.get("/", response_model=List[UserResponse])
 def get_users(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Paginação por OFFSET (obsoleto; ignorado se houver cursor)"),
+    page: PageRequest = Depends(get_legacy_page_request),
     user_service: UserService = Depends(get_user_service),
     current_user: UserResponse = Depends(get_current_active_user)
 ):
-    """Listar todos os usuários (requer autenticação)"""
-    users = user_service.get_users(skip=skip, limit=limit)
-    return users
+    """Listar todos os usuários (requer autenticação); o cursor da próxima página vem no header X-Next-Cursor"""
+    if skip and not page.cursor:
+        return user_service.get_users(skip=skip, limit=page.limit)
+    result = Page.from_rows(user_service.get_users(page=page), page)
+    if result.next_cursor:
+        response.headers["X-Next-Cursor"] = result.next_cursor
+    return result.items
 
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user(
@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+def export_response(
+    rows: Iterable[Any],
+    schema: Type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+    chunk_size: int = 500,
+    convert: Optional[Callable[[Any], BaseModel]] = None
+) -> StreamingResponse:
+    """
+    Exporta as linhas em streaming, no formato NDJSON (um objeto JSON por linha) ou CSV
+
+    Cada linha é convertida para `schema` (o mesmo das listagens) e escrita assim que
+    lida; apenas o lote corrente fica em memória. A primeira linha (e, no CSV, o
+    cabeçalho) é enviada imediatamente; depois o corpo sai em blocos de `chunk_size` linhas.
+
+    Args:
+        rows: Iterador de entidades (ex.: `iter_all` dos repositórios)
+        schema: Schema de resposta de cada linha
+        export_format: ndjson ou csv
+        filename: Nome do arquivo sugerido ao cliente, sem extensão
+        chunk_size: Quantidade de linhas por bloco enviado
+        convert: Conversão entidade -> schema (padrão: `schema.model_validate`)
+    """
+    convert = convert or schema.model_validate
+    if export_format == ExportFormat.CSV:
+        body = _csv_lines(rows, schema, convert)
+    else:
+        body = _ndjson_lines(rows, convert)
+
+    return StreamingResponse(
+        _chunked(body, chunk_size),
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'}
+    )
+
+def _ndjson_lines(rows: Iterable[Any], convert: Callable[[Any], BaseModel]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(convert(row).model_dump(mode="json"), ensure_ascii=False) + "\n"
+
+def _csv_lines(rows: Iterable[Any], schema: Type[BaseModel], convert: Callable[[Any], BaseModel]) -> Iterator[str]:
+    columns = list(schema.model_fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values: List[Any]) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    yield line(columns)
+    for row in rows:
+        data = convert(row).model_dump(mode="json")
+        yield line([_csv_value(data.get(column)) for column in columns])
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+def _chunked(lines: Iterator[str], chunk_size: int) -> Iterator[bytes]:
+    """Agrupa as linhas em blocos; o primeiro bloco sai logo com a primeira linha"""
+    chunk: List[str] = []
+    first = True
+    for text in lines:
+        chunk.append(text)
+        if first or len(chunk) >= chunk_size:
+            yield "".join(chunk).encode("utf-8")
+            chunk = []
+            first = False
+    if chunk:
+        yield "".join(chunk).encode("utf-8")
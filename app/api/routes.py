@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.endpoints import users, auth, roles, profiles, artist_types, musical_styles, artists, artist_musical_styles, space_types, event_types, festival_types, spaces, space_event_types, space_festival_types, bookings, reviews, financials, interests, location_search
+from app.api.endpoints import users, auth, roles, profiles, artist_types, musical_styles, artists, artist_musical_styles, space_types, event_types, festival_types, spaces, space_event_types, space_festival_types, bookings, reviews, financials, interests, location_search, internal
 
 api_router = APIRouter()
 
@@ -22,4 +22,5 @@ api_router.include_router(bookings.router, prefix="/bookings", tags=["bookings"]
 api_router.include_router(reviews.router, prefix="/reviews", tags=["reviews"])
 api_router.include_router(financials.router, prefix="/financials", tags=["financials"])
 api_router.include_router(interests.router, prefix="/interests", tags=["interests"])
-api_router.include_router(location_search.router, prefix="/location-search", tags=["location-search"]) 
\ No newline at end of file
+api_router.include_router(location_search.router, prefix="/location-search", tags=["location-search"])
+api_router.include_router(internal.router, prefix="/internal", tags=["internal"], include_in_schema=False)
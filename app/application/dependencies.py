@@ -1,10 +1,10 @@
-from infrastructure.database.database import get_database_session
+from infrastructure.database.database import get_database_session, get_read_database_session, get_async_database_session
 from infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 from infrastructure.repositories.role_repository_impl import RoleRepositoryImpl
 from infrastructure.repositories.profile_repository_impl import ProfileRepositoryImpl
 from app.application.services.user_service import UserService
 from app.application.services.role_service import RoleService
-from app.application.services.profile_service import ProfileService
+from app.application.services.profile_service import ProfileService, AsyncProfileService
 from domain.repositories.artist_type_repository import ArtistTypeRepository
 from infrastructure.repositories.artist_type_repository_impl import ArtistTypeRepositoryImpl
 from app.application.services.artist_type_service import ArtistTypeService
@@ -41,7 +41,17 @@ from app.application.services.booking_service import BookingService
 from domain.repositories.interest_repository import InterestRepository
 from infrastructure.repositories.interest_repository_impl import InterestRepositoryImpl
 from app.application.services.interest_service import InterestService
-from fastapi import Depends
+from infrastructure.repositories.async_profile_repository_impl import AsyncProfileRepositoryImpl
+from infrastructure.repositories.async_artist_repository_impl import AsyncArtistRepositoryImpl
+from infrastructure.repositories.async_space_repository_impl import AsyncSpaceRepositoryImpl
+from infrastructure.repositories.async_booking_repository_impl import AsyncBookingRepositoryImpl
+from infrastructure.repositories.async_interest_repository_impl import AsyncInterestRepositoryImpl
+from infrastructure.repositories.async_review_repository_impl import AsyncReviewRepositoryImpl
+from app.application.services.review_service import AsyncReviewService
+from typing import Optional
+from fastapi import Depends, HTTPException, Query, status
+from app.core.config import settings
+from domain.repositories.pagination import PageRequest, decode_cursor
 
 def get_user_repository(db=Depends(get_database_session)):
     """Dependency para obter o repositório de usuários"""
@@ -152,4 +162,61 @@ def get_interest_service(
     interest_repository: InterestRepository = Depends(get_interest_repository),
     profile_repository = Depends(get_profile_repository)
 ) -> InterestService:
-    return InterestService(interest_repository, profile_repository) 
\ No newline at end of file
+    return InterestService(interest_repository, profile_repository) 
+
+def get_read_interest_service(db=Depends(get_read_database_session)) -> InterestService:
+    """Serviço de manifestações de interesse sobre a sessão somente leitura (endpoints GET)"""
+    return InterestService(InterestRepositoryImpl(db), ProfileRepositoryImpl(db))
+
+# Limit padrão das listagens que aceitavam skip/limit antes da paginação por cursor
+LEGACY_PAGE_LIMIT = 100
+
+def get_page_request(
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (next_cursor da resposta anterior)"),
+    limit: int = Query(settings.PAGINATION_DEFAULT_LIMIT, ge=1, description="Tamanho da página (reduzido a PAGINATION_MAX_LIMIT)")
+) -> PageRequest:
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return PageRequest(limit=min(limit, settings.PAGINATION_MAX_LIMIT), cursor=cursor)
+
+def get_legacy_page_request(
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (next_cursor ou header X-Next-Cursor da resposta anterior)"),
+    limit: int = Query(LEGACY_PAGE_LIMIT, ge=1, description="Tamanho da página (reduzido a PAGINATION_MAX_LIMIT)")
+) -> PageRequest:
+    """Paginação das listagens que já aceitavam skip/limit: mantém o limit padrão anterior"""
+    return get_page_request(cursor=cursor, limit=limit)
+
+# Repositórios assíncronos (AsyncSession), para endpoints async def de leitura
+
+def get_async_profile_repository(db=Depends(get_async_database_session)) -> AsyncProfileRepositoryImpl:
+    return AsyncProfileRepositoryImpl(db)
+
+def get_async_artist_repository(db=Depends(get_async_database_session)) -> AsyncArtistRepositoryImpl:
+    return AsyncArtistRepositoryImpl(db)
+
+def get_async_space_repository(db=Depends(get_async_database_session)) -> AsyncSpaceRepositoryImpl:
+    return AsyncSpaceRepositoryImpl(db)
+
+def get_async_booking_repository(db=Depends(get_async_database_session)) -> AsyncBookingRepositoryImpl:
+    return AsyncBookingRepositoryImpl(db)
+
+def get_async_interest_repository(db=Depends(get_async_database_session)) -> AsyncInterestRepositoryImpl:
+    return AsyncInterestRepositoryImpl(db)
+
+def get_async_review_repository(db=Depends(get_async_database_session)) -> AsyncReviewRepositoryImpl:
+    return AsyncReviewRepositoryImpl(db)
+
+# Serviços de leitura sobre os repositórios assíncronos
+
+def get_async_profile_service(
+    profile_repository: AsyncProfileRepositoryImpl = Depends(get_async_profile_repository)
+) -> AsyncProfileService:
+    return AsyncProfileService(profile_repository)
+
+def get_async_review_service(
+    review_repository: AsyncReviewRepositoryImpl = Depends(get_async_review_repository)
+) -> AsyncReviewService:
+    return AsyncReviewService(review_repository)
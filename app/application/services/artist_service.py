@@ -4,6 +4,7 @@ from domain.repositories.artist_repository import ArtistRepository
 from domain.repositories.profile_repository import ProfileRepository
 from app.schemas.artist import ArtistCreate, ArtistUpdate
 from infrastructure.database.models.artist_model import ArtistModel
+from domain.repositories.pagination import PageRequest
 
 class ArtistService:
     def __init__(self, artist_repository: ArtistRepository, profile_repository: ProfileRepository):
@@ -54,13 +55,13 @@ class ArtistService:
         """Obter artista por ID do profile"""
         return self.artist_repository.get_by_profile_id(profile_id, include_relations=include_relations)
 
-    def get_artists(self, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Artist, ArtistModel]]:
+    def get_artists(self, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Artist, ArtistModel]]:
         """Listar todos os artistas"""
-        return self.artist_repository.get_all(skip=skip, limit=limit, include_relations=include_relations)
+        return self.artist_repository.get_all(skip=skip, limit=limit, include_relations=include_relations, page=page)
 
-    def get_artists_by_type(self, artist_type_id: int, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Artist, ArtistModel]]:
+    def get_artists_by_type(self, artist_type_id: int, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Artist, ArtistModel]]:
         """Listar artistas por tipo"""
-        return self.artist_repository.get_by_artist_type(artist_type_id, skip=skip, limit=limit, include_relations=include_relations)
+        return self.artist_repository.get_by_artist_type(artist_type_id, skip=skip, limit=limit, include_relations=include_relations, page=page)
 
     def update_artist(self, artist_id: int, artist_data: ArtistUpdate) -> Artist:
         """Atualizar artista"""
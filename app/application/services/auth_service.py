@@ -1,25 +1,50 @@
 from typing import Optional
-from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token, verify_token, is_refresh_token
+from anyio import to_thread
+from app.core.config import settings
+from app.core.password_hasher import password_hasher
+from app.core.security import create_access_token, create_refresh_token, verify_token, is_refresh_token, get_token_id
 from app.application.services.user_service import UserService
 from app.schemas.auth import UserLogin, UserRegister, Token
 from app.schemas.user import UserCreate, UserResponse
+from infrastructure.database.database import SessionLocal
+from infrastructure.cache.token_revocation_store import (
+    TokenRevocationStore, InMemoryTokenRevocationStore, DatabaseTokenRevocationStore
+)
 
-# Blacklist global compartilhada entre todas as instâncias
-_token_blacklist = set()
+# Store de tokens revogados compartilhado entre todas as instâncias (criado no primeiro uso)
+_revocation_store: Optional[TokenRevocationStore] = None
+
+def get_token_revocation_store() -> TokenRevocationStore:
+    """Obter o store de tokens revogados configurado em TOKEN_REVOCATION_BACKEND"""
+    global _revocation_store
+    if _revocation_store is None:
+        if settings.TOKEN_REVOCATION_BACKEND == "database":
+            _revocation_store = DatabaseTokenRevocationStore(
+                SessionLocal, sync_interval_seconds=settings.TOKEN_REVOCATION_SYNC_SECONDS
+            )
+        else:
+            _revocation_store = InMemoryTokenRevocationStore()
+    return _revocation_store
 
 class AuthService:
-    def __init__(self, user_service: UserService):
+    def __init__(self, user_service: UserService, revocation_store: Optional[TokenRevocationStore] = None):
         self.user_service = user_service
+        self.revocation_store = revocation_store or get_token_revocation_store()
 
-    def authenticate_user(self, email: str, password: str) -> Optional[UserResponse]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[UserResponse]:
         """Autenticar usuário com email e senha"""
-        user = self.user_service.get_user_by_email_for_auth(email)
+        user = await to_thread.run_sync(self.user_service.get_user_by_email_for_auth, email)
         if not user:
             return None
         
-        if not verify_password(password, user.password):
+        valid, new_hash = await password_hasher.verify_and_update(password, user.password)
+        if not valid:
             return None
         
+        # Hash criado com outro custo: regravar com o custo configurado
+        if new_hash:
+            await to_thread.run_sync(self.user_service.upgrade_password_hash, user, new_hash)
+        
         # Retornar UserResponse sem senha
         return UserResponse(
             id=user.id,
@@ -30,10 +55,10 @@ class AuthService:
             updated_at=user.updated_at
         )
 
-    def register_user(self, user_data: UserRegister) -> UserResponse:
+    async def register_user(self, user_data: UserRegister) -> UserResponse:
         """Registrar novo usuário"""
         # Verificar se o email já existe
-        existing_user = self.user_service.get_user_by_email(user_data.email)
+        existing_user = await to_thread.run_sync(self.user_service.get_user_by_email, user_data.email)
         if existing_user:
             raise ValueError("Email já está em uso")
 
@@ -41,18 +66,22 @@ class AuthService:
         user_create = UserCreate(
             name=user_data.name,
             email=user_data.email,
-            password=get_password_hash(user_data.password),
+            password=await password_hasher.hash(user_data.password),
             is_active=user_data.is_active
         )
         
-        return self.user_service.create_user(user_create)
+        return await to_thread.run_sync(self.user_service.create_user, user_create)
 
-    def login_user(self, user_data: UserLogin) -> Token:
+    async def login_user(self, user_data: UserLogin) -> Token:
         """Fazer login do usuário"""
-        user = self.authenticate_user(user_data.email, user_data.password)
+        user = await self.authenticate_user(user_data.email, user_data.password)
         if not user:
             raise ValueError("Email ou senha incorretos")
         
+        return self.issue_tokens(user)
+
+    def issue_tokens(self, user: UserResponse) -> Token:
+        """Emitir os tokens de um usuário já autenticado"""
         if not user.is_active:
             raise ValueError("Usuário inativo")
 
@@ -66,36 +95,30 @@ class AuthService:
         )
 
     def logout_user(self, user_id: int) -> None:
-        """Fazer logout do usuário (adicionar token à blacklist)"""
-        # Em uma implementação mais robusta, você adicionaria o token atual à blacklist
-        # Por simplicidade, apenas retornamos sucesso
-        # Para implementar blacklist real, seria necessário:
-        # 1. Receber o token atual no endpoint
-        # 2. Adicionar à blacklist
-        # 3. Verificar blacklist no middleware de autenticação
+        """Fazer logout do usuário (a revogação do token atual é feita por revoke_token)"""
         pass
 
-    def is_token_blacklisted(self, token: str) -> bool:
-        """Verificar se token está na blacklist"""
-        global _token_blacklist
-        return token in _token_blacklist
+    def is_token_revoked(self, token: str, payload: dict) -> bool:
+        """Verificar se o token (já validado e decodificado em `payload`) foi revogado"""
+        return self.revocation_store.is_revoked(get_token_id(token, payload))
 
-    def add_token_to_blacklist(self, token: str) -> None:
-        """Adicionar token à blacklist"""
-        global _token_blacklist
-        _token_blacklist.add(token)
+    def revoke_token(self, token: str) -> None:
+        """Revogar o token até a sua expiração (tokens inválidos ou expirados são ignorados)"""
+        payload = verify_token(token)
+        if payload and payload.get("exp"):
+            self.revocation_store.revoke(get_token_id(token, payload), float(payload["exp"]))
 
     def refresh_access_token(self, refresh_token: str) -> Token:
         """Renovar token de acesso usando refresh token"""
-        # Verificar se refresh token está na blacklist
-        if self.is_token_blacklisted(refresh_token):
-            raise ValueError("Refresh token foi invalidado")
-        
         # Verificar refresh token
         payload = verify_token(refresh_token)
         if not payload or not is_refresh_token(payload):
             raise ValueError("Refresh token inválido")
         
+        # Verificar se refresh token foi revogado
+        if self.is_token_revoked(refresh_token, payload):
+            raise ValueError("Refresh token foi invalidado")
+        
         user_id = payload.get("sub")
         if not user_id:
             raise ValueError("Refresh token inválido")
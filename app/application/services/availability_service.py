@@ -0,0 +1,126 @@
+import bisect
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Sequence
+import numpy as np
+from domain.repositories.booking_repository import BookingRepository
+from domain.repositories.space_event_type_repository import SpaceEventTypeRepository
+from domain.repositories.space_festival_type_repository import SpaceFestivalTypeRepository
+from domain.entities.space_event_type import StatusEventType
+from domain.entities.space_festival_type import StatusFestivalType
+from domain.entities.booking import combine_date_and_time
+
+@dataclass(frozen=True)
+class AvailabilitySlot:
+    """Horário de um evento/festival de espaço: intervalo fechado [inicio, fim]"""
+    tipo: str  # "evento" ou "festival"
+    id: int
+    inicio: datetime
+    fim: datetime
+
+@dataclass
+class AvailabilityMatrix:
+    """
+    Disponibilidade de artistas (linhas) em horários (colunas)
+
+    `available[i, j]` é True se o artista `artist_ids[i]` não tem agendamento
+    sobreposto ao horário `slots[j]`.
+    """
+    artist_ids: List[int]
+    slots: List[AvailabilitySlot]
+    available: np.ndarray
+
+    def __post_init__(self):
+        self._rows = {artist_id: row for row, artist_id in enumerate(self.artist_ids)}
+
+    def is_available(self, artist_id: int, slot_index: int) -> bool:
+        """Verifica se o artista está livre em um horário"""
+        return bool(self.available[self._rows[artist_id], slot_index])
+
+    def is_fully_available(self, artist_id: int) -> bool:
+        """Verifica se o artista está livre em todos os horários"""
+        return bool(self.available[self._rows[artist_id]].all())
+
+    def fully_available_artist_ids(self) -> List[int]:
+        """IDs dos artistas livres em todos os horários"""
+        return [self.artist_ids[row] for row in np.flatnonzero(self.available.all(axis=1))]
+
+class AvailabilityService:
+    """Serviço de disponibilidade de artistas para os eventos/festivais dos espaços"""
+
+    def __init__(
+        self,
+        booking_repository: BookingRepository,
+        space_event_type_repository: SpaceEventTypeRepository,
+        space_festival_type_repository: SpaceFestivalTypeRepository
+    ):
+        self.booking_repository = booking_repository
+        self.space_event_type_repository = space_event_type_repository
+        self.space_festival_type_repository = space_festival_type_repository
+
+    def get_contracting_slots(self, space_id: int) -> List[AvailabilitySlot]:
+        """
+        Obtém os horários dos eventos e festivais do espaço com status CONTRATANDO
+
+        Como só o horário de início é conhecido, cada horário é um instante.
+        """
+        contracting_events = self.space_event_type_repository.get_by_space_id_and_status(
+            space_id, StatusEventType.CONTRATANDO
+        )
+        contracting_festivals = self.space_festival_type_repository.get_by_space_id_and_status(
+            space_id, StatusFestivalType.CONTRATANDO
+        )
+
+        slots = []
+        for tipo, items in (("evento", contracting_events), ("festival", contracting_festivals)):
+            for item in items:
+                inicio = combine_date_and_time(item.data, item.horario)
+                slots.append(AvailabilitySlot(tipo=tipo, id=item.id, inicio=inicio, fim=inicio))
+        return slots
+
+    def get_availability_matrix(self, artist_ids: Iterable[int], slots: Sequence[AvailabilitySlot]) -> AvailabilityMatrix:
+        """
+        Calcula a disponibilidade de cada artista em cada horário
+
+        Os agendamentos sobrepostos a algum horário são obtidos em uma única consulta;
+        depois, para cada agendamento, uma varredura sobre os horários ordenados por
+        início marca os horários que ele ocupa.
+
+        Args:
+            artist_ids: IDs dos artistas
+            slots: Horários a verificar
+
+        Returns:
+            Matriz de disponibilidade (artistas x horários)
+        """
+        artist_ids = list(dict.fromkeys(artist_ids))
+        slots = list(slots)
+        available = np.ones((len(artist_ids), len(slots)), dtype=bool)
+        if not artist_ids or not slots:
+            return AvailabilityMatrix(artist_ids=artist_ids, slots=slots, available=available)
+
+        bookings_by_artist = self.booking_repository.get_conflicting_bookings_bulk(
+            artist_ids, [(slot.inicio, slot.fim) for slot in slots]
+        )
+
+        # Horários ordenados por início; a maior duração limita o recuo da varredura
+        order = sorted(range(len(slots)), key=lambda index: slots[index].inicio)
+        starts = [slots[index].inicio for index in order]
+        max_duration = max((slot.fim - slot.inicio for slot in slots), default=timedelta(0))
+
+        rows: Dict[int, int] = {artist_id: row for row, artist_id in enumerate(artist_ids)}
+        for artist_id, bookings in bookings_by_artist.items():
+            row = rows.get(artist_id)
+            if row is None:
+                continue
+            for booking in bookings:
+                booking_inicio, booking_fim = booking.periodo
+                # Candidatos: horários que começam em [inicio - maior duração, fim]
+                first = bisect.bisect_left(starts, booking_inicio - max_duration)
+                last = bisect.bisect_right(starts, booking_fim)
+                for position in range(first, last):
+                    slot_index = order[position]
+                    if slots[slot_index].fim >= booking_inicio:
+                        available[row, slot_index] = False
+
+        return AvailabilityMatrix(artist_ids=artist_ids, slots=slots, available=available)
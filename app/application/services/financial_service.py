@@ -1,13 +1,20 @@
-from typing import List, Optional, Union, Any
+from typing import Callable, Dict, List, Optional, Union, Any, Iterator
 from sqlalchemy.orm import Session
+from app.core.config import settings
+from infrastructure.cache.ttl_cache import TTLCache
 from domain.entities.financial import Financial, TipoConta, TipoChavePix, PreferenciaTransferencia
 from domain.repositories.financial_repository import FinancialRepository
 from infrastructure.repositories.financial_repository_impl import FinancialRepositoryImpl
 from app.schemas.financial import FinancialCreate, FinancialUpdate, TipoContaEnum, TipoChavePixEnum, PreferenciaTransferenciaEnum
+from domain.repositories.pagination import PageRequest
 
 class FinancialService:
     """Serviço de aplicação para dados financeiros/bancários"""
     
+    # Cache curto dos resumos estatísticos, compartilhado entre requisições e
+    # invalidado a cada escrita feita pelo serviço
+    _summary_cache = TTLCache(maxsize=16, ttl_seconds=settings.FINANCIAL_STATS_CACHE_TTL_SECONDS)
+    
     def __init__(self, db: Session):
         self.db = db
         self.repository: FinancialRepository = FinancialRepositoryImpl(db)
@@ -26,39 +33,41 @@ class FinancialService:
             preferencia=PreferenciaTransferencia(financial_data.preferencia.value)
         )
         
-        return self.repository.create(financial)
+        created_financial = self.repository.create(financial)
+        self.invalidate_summary_cache()
+        return created_financial
     
     def get_financial_by_id(self, financial_id: int, include_relations: bool = False) -> Optional[Union[Financial, Any]]:
         """Obter um registro financeiro por ID"""
         return self.repository.get_by_id(financial_id, include_relations)
     
-    def get_financials_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_financials_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter todos os registros financeiros de um profile"""
-        return self.repository.get_by_profile_id(profile_id, include_relations)
+        return self.repository.get_by_profile_id(profile_id, include_relations, page=page)
     
-    def get_financials_by_banco(self, banco: str, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_financials_by_banco(self, banco: str, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter todos os registros financeiros de um banco específico"""
-        return self.repository.get_by_banco(banco, include_relations)
+        return self.repository.get_by_banco(banco, include_relations, page=page)
     
-    def get_financials_by_tipo_conta(self, tipo_conta: TipoContaEnum, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_financials_by_tipo_conta(self, tipo_conta: TipoContaEnum, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter registros financeiros por tipo de conta"""
-        return self.repository.get_by_tipo_conta(TipoConta(tipo_conta.value), include_relations)
+        return self.repository.get_by_tipo_conta(TipoConta(tipo_conta.value), include_relations, page=page)
     
-    def get_financials_by_tipo_chave_pix(self, tipo_chave_pix: TipoChavePixEnum, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_financials_by_tipo_chave_pix(self, tipo_chave_pix: TipoChavePixEnum, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter registros financeiros por tipo de chave PIX"""
-        return self.repository.get_by_tipo_chave_pix(TipoChavePix(tipo_chave_pix.value), include_relations)
+        return self.repository.get_by_tipo_chave_pix(TipoChavePix(tipo_chave_pix.value), include_relations, page=page)
     
     def get_financial_by_chave_pix(self, chave_pix: str, include_relations: bool = False) -> Optional[Union[Financial, Any]]:
         """Obter registro financeiro por chave PIX"""
         return self.repository.get_by_chave_pix(chave_pix, include_relations)
     
-    def get_financials_by_preferencia(self, preferencia: PreferenciaTransferenciaEnum, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_financials_by_preferencia(self, preferencia: PreferenciaTransferenciaEnum, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter registros financeiros por preferência de transferência"""
-        return self.repository.get_by_preferencia(PreferenciaTransferencia(preferencia.value), include_relations)
+        return self.repository.get_by_preferencia(PreferenciaTransferencia(preferencia.value), include_relations, page=page)
     
-    def get_financials_by_cpf_cnpj(self, cpf_cnpj: str, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_financials_by_cpf_cnpj(self, cpf_cnpj: str, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter registros financeiros por CPF/CNPJ"""
-        return self.repository.get_by_cpf_cnpj(cpf_cnpj, include_relations)
+        return self.repository.get_by_cpf_cnpj(cpf_cnpj, include_relations, page=page)
     
     def update_financial(self, financial_id: int, financial_data: FinancialUpdate) -> Optional[Financial]:
         """Atualizar um registro financeiro"""
@@ -80,15 +89,24 @@ class FinancialService:
             preferencia=PreferenciaTransferencia(financial_data.preferencia.value) if financial_data.preferencia is not None else existing_financial.preferencia
         )
         
-        return self.repository.update(financial_id, updated_financial)
+        result = self.repository.update(financial_id, updated_financial)
+        self.invalidate_summary_cache()
+        return result
     
     def delete_financial(self, financial_id: int) -> bool:
         """Deletar um registro financeiro"""
-        return self.repository.delete(financial_id)
+        deleted = self.repository.delete(financial_id)
+        if deleted:
+            self.invalidate_summary_cache()
+        return deleted
     
-    def get_all_financials(self, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_all_financials(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter todos os registros financeiros"""
-        return self.repository.get_all(include_relations)
+        return self.repository.get_all(include_relations, page=page)
+    
+    def export_financials(self, batch_size: int = 500) -> Iterator[Financial]:
+        """Percorrer todos os registros financeiros em lotes (exportação)"""
+        return self.repository.iter_all(batch_size=batch_size)
     
     def check_chave_pix_available(self, chave_pix: str, exclude_id: Optional[int] = None) -> bool:
         """Verificar se uma chave PIX está disponível"""
@@ -124,30 +142,33 @@ class FinancialService:
         
         return errors
     
-    def get_banks_summary(self) -> dict:
+    def get_banks_summary(self) -> Dict[str, int]:
         """Obter resumo de registros por banco"""
-        all_financials = self.repository.get_all()
-        banks_count = {}
-        
-        for financial in all_financials:
-            banco = financial.banco
-            if banco in banks_count:
-                banks_count[banco] += 1
-            else:
-                banks_count[banco] = 1
-        
-        return banks_count
+        return self._cached_summary("banks", self.repository.get_banks_summary)
     
-    def get_pix_types_summary(self) -> dict:
+    def get_pix_types_summary(self) -> Dict[str, int]:
         """Obter resumo de tipos de chave PIX"""
-        all_financials = self.repository.get_all()
-        pix_types_count = {}
-        
-        for financial in all_financials:
-            tipo_pix = financial.tipo_chave_pix.value
-            if tipo_pix in pix_types_count:
-                pix_types_count[tipo_pix] += 1
-            else:
-                pix_types_count[tipo_pix] = 1
-        
-        return pix_types_count 
\ No newline at end of file
+        return self._cached_summary("pix_types", self.repository.get_pix_types_summary)
+    
+    def get_preferencias_summary(self) -> Dict[str, int]:
+        """Obter resumo de preferências de transferência"""
+        return self._cached_summary("preferencias", self.repository.get_preferencias_summary)
+    
+    def get_tipos_conta_summary(self) -> Dict[str, int]:
+        """Obter resumo de tipos de conta"""
+        return self._cached_summary("tipos_conta", self.repository.get_tipos_conta_summary)
+    
+    def _cached_summary(self, key: str, compute: Callable[[], Dict[str, int]]) -> Dict[str, int]:
+        """Obter um resumo do cache ou calculá-lo no banco (cache desativado com TTL <= 0)"""
+        if settings.FINANCIAL_STATS_CACHE_TTL_SECONDS <= 0:
+            return compute()
+        summary = self._summary_cache.get(key)
+        if summary is None:
+            summary = compute()
+            self._summary_cache.set(key, summary)
+        return dict(summary)
+    
+    @classmethod
+    def invalidate_summary_cache(cls) -> None:
+        """Descartar os resumos estatísticos em cache"""
+        cls._summary_cache.clear()
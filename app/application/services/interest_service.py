@@ -1,9 +1,10 @@
-from typing import List, Optional, Union, Any
+from typing import List, Optional, Union, Any, Iterator
 from datetime import date
 from domain.repositories.interest_repository import InterestRepository
 from domain.repositories.profile_repository import ProfileRepository
 from domain.entities.interest import Interest, StatusInterest
 from app.schemas.interest import InterestCreate, InterestUpdate, InterestStatusUpdate
+from domain.repositories.pagination import PageRequest
 
 class InterestService:
     """Serviço de aplicação para manifestações de interesse"""
@@ -76,37 +77,37 @@ class InterestService:
         """Obter uma manifestação de interesse por ID"""
         return self.interest_repository.get_by_id(interest_id, include_relations=include_relations)
     
-    def get_interests_by_profile_interessado(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_interests_by_profile_interessado(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter todas as manifestações de interesse feitas por um profile"""
-        return self.interest_repository.get_by_profile_interessado(profile_id, include_relations=include_relations)
+        return self.interest_repository.get_by_profile_interessado(profile_id, include_relations=include_relations, page=page)
     
-    def get_interests_by_profile_interesse(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_interests_by_profile_interesse(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter todas as manifestações de interesse recebidas por um profile"""
-        return self.interest_repository.get_by_profile_interesse(profile_id, include_relations=include_relations)
+        return self.interest_repository.get_by_profile_interesse(profile_id, include_relations=include_relations, page=page)
     
-    def get_interests_by_status(self, status: StatusInterest, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_interests_by_status(self, status: StatusInterest, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse por status"""
-        return self.interest_repository.get_by_status(status, include_relations=include_relations)
+        return self.interest_repository.get_by_status(status, include_relations=include_relations, page=page)
     
-    def get_interests_by_space_event_type(self, space_event_type_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_interests_by_space_event_type(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse relacionadas a um space-event type"""
-        return self.interest_repository.get_by_space_event_type_id(space_event_type_id, include_relations=include_relations)
+        return self.interest_repository.get_by_space_event_type_id(space_event_type_id, include_relations=include_relations, page=page)
     
-    def get_interests_by_space_festival_type(self, space_festival_type_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_interests_by_space_festival_type(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse relacionadas a um space-festival type"""
-        return self.interest_repository.get_by_space_festival_type_id(space_festival_type_id, include_relations=include_relations)
+        return self.interest_repository.get_by_space_festival_type_id(space_festival_type_id, include_relations=include_relations, page=page)
     
-    def get_interests_by_date_range(self, data_inicio: date, data_fim: date, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_interests_by_date_range(self, data_inicio: date, data_fim: date, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse em um período"""
-        return self.interest_repository.get_by_date_range(data_inicio, data_fim, include_relations=include_relations)
+        return self.interest_repository.get_by_date_range(data_inicio, data_fim, include_relations=include_relations, page=page)
     
-    def get_interests_by_profile_and_status(self, profile_id: int, status: StatusInterest, is_interessado: bool = True, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_interests_by_profile_and_status(self, profile_id: int, status: StatusInterest, is_interessado: bool = True, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse de um profile filtradas por status"""
-        return self.interest_repository.get_by_profile_and_status(profile_id, status, is_interessado, include_relations=include_relations)
+        return self.interest_repository.get_by_profile_and_status(profile_id, status, is_interessado, include_relations=include_relations, page=page)
     
-    def get_pending_interests_for_profile(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_pending_interests_for_profile(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse pendentes para um profile"""
-        return self.interest_repository.get_pending_for_profile(profile_id, include_relations=include_relations)
+        return self.interest_repository.get_pending_for_profile(profile_id, include_relations=include_relations, page=page)
     
     def get_interest_statistics(self, profile_id: int) -> dict:
         """Obter estatísticas de interesse para um profile"""
@@ -213,6 +214,10 @@ class InterestService:
         
         return self.interest_repository.delete(interest_id)
     
-    def get_all_interests(self, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_all_interests(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter todas as manifestações de interesse"""
-        return self.interest_repository.get_all(include_relations=include_relations) 
\ No newline at end of file
+        return self.interest_repository.get_all(include_relations=include_relations, page=page)
+    
+    def export_interests(self, batch_size: int = 500) -> Iterator[Interest]:
+        """Percorrer todas as manifestações de interesse em lotes (exportação)"""
+        return self.interest_repository.iter_all(batch_size=batch_size)
@@ -6,9 +6,8 @@ from domain.repositories.profile_repository import ProfileRepository
 from domain.repositories.space_event_type_repository import SpaceEventTypeRepository
 from domain.repositories.space_festival_type_repository import SpaceFestivalTypeRepository
 from domain.repositories.booking_repository import BookingRepository
-from domain.entities.space_event_type import StatusEventType
-from domain.entities.space_festival_type import StatusFestivalType
 from app.core.location_utils import LocationUtils
+from app.application.services.availability_service import AvailabilityService
 from app.schemas.location_search import (
     LocationSearchResponse,
     SpaceLocationResult,
@@ -34,6 +33,9 @@ class LocationSearchService:
         self.space_event_type_repository = space_event_type_repository
         self.space_festival_type_repository = space_festival_type_repository
         self.booking_repository = booking_repository
+        self.availability_service = AvailabilityService(
+            booking_repository, space_event_type_repository, space_festival_type_repository
+        )
     
     def search_spaces_for_artist(
         self,
@@ -71,66 +73,85 @@ class LocationSearchService:
             
             artist_lat, artist_lng = artist_coords
             
-            # 3. Obter todos os profiles de espaços (role_id = 3)
-            space_profiles = self.profile_repository.get_by_role_id(role_id=3)
+            # Garantir que raio_atuacao seja float
+            raio_atuacao = float(artist.raio_atuacao) if artist.raio_atuacao is not None else 0.0
+            
+            # 3. Obter profiles de espaços (role_id = 3) dentro do raio via índice espacial,
+            # mais os profiles sem coordenadas cadastradas (resolvidas por cidade/UF ou CEP)
+            space_profiles = self.profile_repository.get_by_role_id_within_radius(
+                role_id=3, latitude=artist_lat, longitude=artist_lng, radius_km=raio_atuacao
+            )
+            space_profiles += self.profile_repository.get_by_role_id_without_coordinates(role_id=3)
             
             results = []
             total_count = 0
             
+            # 4. Obter coordenadas dos espaços (priorizando coordenadas do profile),
+            # consultando antes, em paralelo, os CEPs que dependem da ViaCEP
+            LocationUtils.prefetch_viacep(self._ceps_requiring_viacep(space_profiles))
+            located_profiles = []
             for space_profile in space_profiles:
-                # 4. Obter coordenadas do espaço (priorizando coordenadas do profile)
                 space_coords = LocationUtils.get_coordinates_from_profile(space_profile)
-                if not space_coords:
-                    continue
-                
-                space_lat, space_lng = space_coords
-                
-                # 5. Calcular distância
-                distance = LocationUtils.calculate_distance(
-                    artist_lat, artist_lng, space_lat, space_lng
-                )
-                
-                # 6. Verificar se está dentro do raio de atuação
-                # Garantir que raio_atuacao seja float
-                raio_atuacao = float(artist.raio_atuacao) if artist.raio_atuacao is not None else 0.0
-                if distance <= raio_atuacao:
-                    # 7. Verificar se o espaço tem eventos/festivais com status CONTRATANDO
-                    spaces = self.space_repository.get_by_profile_id(space_profile.id)
-                    if spaces:
-                        space = spaces[0]  # Pegar o primeiro espaço do profile
-                        has_contracting_events = self._check_contracting_events(db, space.id)
-                        
-                        if has_contracting_events:
-                            if return_full_data:
-                                result = SpaceLocationResult(
-                                    id=space.id,
-                                    profile_id=space.profile_id,
-                                    space_type_id=space.space_type_id,
-                                    acesso=space.acesso,
-                                    valor_hora=space.valor_hora,
-                                    valor_couvert=space.valor_couvert,
-                                    publico_estimado=space.publico_estimado,
-                                    distance_km=distance,
-                                    profile=ProfileLocationResult(
-                                        id=space_profile.id,
-                                        full_name=space_profile.full_name,
-                                        artistic_name=space_profile.artistic_name,
-                                        cep=space_profile.cep,
-                                        cidade=space_profile.cidade,
-                                        uf=space_profile.uf
-                                    )
-                                )
-                            else:
-                                result = SpaceLocationResult(
-                                    id=space.id,
-                                    distance_km=distance
+                if space_coords:
+                    located_profiles.append((space_profile, space_coords))
+            
+            # 5. Calcular distâncias em lote
+            distances, in_radius = LocationUtils.calculate_distances(
+                artist_lat,
+                artist_lng,
+                [coords[0] for _, coords in located_profiles],
+                [coords[1] for _, coords in located_profiles],
+                raio_atuacao
+            )
+            
+            # 6. Obter, em uma única query, os espaços no raio com eventos/festivais CONTRATANDO
+            space_profile_ids_in_radius = [
+                space_profile.id
+                for (space_profile, _), is_in_radius in zip(located_profiles, in_radius.tolist())
+                if is_in_radius
+            ]
+            contracting_spaces = {}
+            for space in self.space_repository.get_contracting_by_profile_ids(space_profile_ids_in_radius):
+                # Pegar o primeiro espaço do profile
+                contracting_spaces.setdefault(space.profile_id, space)
+            
+            for (space_profile, _), distance, is_in_radius in zip(
+                located_profiles, distances.tolist(), in_radius.tolist()
+            ):
+                # 7. Verificar se está dentro do raio de atuação e se o espaço está contratando
+                if is_in_radius:
+                    space = contracting_spaces.get(space_profile.id)
+                    if space:
+                        if return_full_data:
+                            result = SpaceLocationResult(
+                                id=space.id,
+                                profile_id=space.profile_id,
+                                space_type_id=space.space_type_id,
+                                acesso=space.acesso,
+                                valor_hora=space.valor_hora,
+                                valor_couvert=space.valor_couvert,
+                                publico_estimado=space.publico_estimado,
+                                distance_km=distance,
+                                profile=ProfileLocationResult(
+                                    id=space_profile.id,
+                                    full_name=space_profile.full_name,
+                                    artistic_name=space_profile.artistic_name,
+                                    cep=space_profile.cep,
+                                    cidade=space_profile.cidade,
+                                    uf=space_profile.uf
                                 )
-                            
-                            results.append(result)
-                            total_count += 1
-                            
-                            if max_results and total_count >= max_results:
-                                break
+                            )
+                        else:
+                            result = SpaceLocationResult(
+                                id=space.id,
+                                distance_km=distance
+                            )
+                        
+                        results.append(result)
+                        total_count += 1
+                        
+                        if max_results and total_count >= max_results:
+                            break
             
             return LocationSearchResponse(
                 results=results,
@@ -179,38 +200,60 @@ class LocationSearchService:
             
             space_lat, space_lng = space_coords
             
-            # 3. Obter todos os profiles de artistas (role_id = 2)
-            artist_profiles = self.profile_repository.get_by_role_id(role_id=2)
+            # 3. Obter, em uma única query, artistas (role_id = 2) com seus profiles dentro do
+            # bounding box do maior raio de atuação cadastrado, mais os sem coordenadas
+            max_raio_atuacao = self.artist_repository.get_max_raio_atuacao()
+            artists_with_profiles = self.artist_repository.get_with_profiles_near(
+                latitude=space_lat, longitude=space_lng, radius_km=max_raio_atuacao
+            )
+            
+            # Eventos e festivais do espaço com status CONTRATANDO (carregados uma única vez)
+            contracting_slots = self.availability_service.get_contracting_slots(space.id)
             
             results = []
             total_count = 0
             
-            for artist_profile in artist_profiles:
-                # 4. Obter dados do artista
-                artist = self.artist_repository.get_by_profile_id(artist_profile.id)
-                if not artist:
-                    continue
-                
-                # 5. Obter coordenadas do artista (priorizando coordenadas do profile)
+            LocationUtils.prefetch_viacep(
+                self._ceps_requiring_viacep(artist_profile for _, artist_profile in artists_with_profiles)
+            )
+            located_artists = []
+            for artist, artist_profile in artists_with_profiles:
+                # 4. Obter coordenadas do artista (priorizando coordenadas do profile)
                 artist_coords = LocationUtils.get_coordinates_from_profile(artist_profile)
-                if not artist_coords:
-                    continue
-                
-                artist_lat, artist_lng = artist_coords
-                
-                # 6. Calcular distância
-                distance = LocationUtils.calculate_distance(
-                    space_lat, space_lng, artist_lat, artist_lng
-                )
-                
+                if artist_coords:
+                    located_artists.append((artist_profile, artist, artist_coords))
+            
+            # 5. Calcular distâncias em lote contra o raio de atuação de cada artista
+            # Garantir que raio_atuacao seja float
+            raios_atuacao = [
+                float(artist.raio_atuacao) if artist.raio_atuacao is not None else 0.0
+                for _, artist, _ in located_artists
+            ]
+            distances, in_radius = LocationUtils.calculate_distances(
+                space_lat,
+                space_lng,
+                [coords[0] for _, _, coords in located_artists],
+                [coords[1] for _, _, coords in located_artists],
+                raios_atuacao
+            )
+            
+            # 6. Calcular a disponibilidade de todos os artistas no raio (uma única query)
+            artist_ids_in_radius = [
+                artist.id
+                for (_, artist, _), is_in_radius in zip(located_artists, in_radius.tolist())
+                if is_in_radius
+            ]
+            availability = self.availability_service.get_availability_matrix(
+                artist_ids_in_radius, contracting_slots
+            )
+            
+            for (artist_profile, artist, _), raio_atuacao, distance, is_in_radius in zip(
+                located_artists, raios_atuacao, distances.tolist(), in_radius.tolist()
+            ):
                 # 7. Verificar se está dentro do raio de atuação do artista
-                # Garantir que raio_atuacao seja float
-                raio_atuacao = float(artist.raio_atuacao) if artist.raio_atuacao is not None else 0.0
-                if distance <= raio_atuacao:
+                if is_in_radius:
                     # 8. Verificar se o artista não tem agendamentos conflitantes
-                    is_available = self._check_artist_availability(
-                        db, artist.id, space.id
-                    )
+                    is_available = availability.is_fully_available(artist.id)
                     
                     if is_available:
                         if return_full_data:
@@ -253,61 +296,16 @@ class LocationSearchService:
         except Exception as e:
             raise Exception(f"Erro na busca de artistas para espaço: {str(e)}")
     
-    def _check_contracting_events(self, db: Session, space_id: int) -> bool:
-        """
-        Verifica se um espaço tem eventos ou festivais com status CONTRATANDO
-        """
-        # Verificar space_event_types
-        event_types = self.space_event_type_repository.get_by_space_id_and_status(
-            space_id, StatusEventType.CONTRATANDO
-        )
-        
-        if event_types:
-            return True
-        
-        # Verificar space_festival_types
-        festival_types = self.space_festival_type_repository.get_by_space_id_and_status(
-            space_id, StatusFestivalType.CONTRATANDO
-        )
-        
-        return len(festival_types) > 0
-    
-    def _check_artist_availability(
-        self,
-        db: Session,
-        artist_id: int,
-        space_id: int
-    ) -> bool:
+    @staticmethod
+    def _ceps_requiring_viacep(profiles) -> List[str]:
         """
-        Verifica se um artista está disponível para um espaço específico
-        (não tem agendamentos conflitantes)
+        Obtém os CEPs dos profiles sem coordenadas e sem cidade/UF, que só podem ser
+        resolvidos pela ViaCEP
         """
-        # Obter eventos e festivais do espaço com status CONTRATANDO
-        contracting_events = self.space_event_type_repository.get_by_space_id_and_status(
-            space_id, StatusEventType.CONTRATANDO
-        )
-        
-        contracting_festivals = self.space_festival_type_repository.get_by_space_id_and_status(
-            space_id, StatusFestivalType.CONTRATANDO
-        )
-        
-        # Verificar conflitos para cada evento/festival
-        for event in contracting_events:
-            conflicting_bookings = self.booking_repository.get_conflicting_bookings(
-                artist_id=artist_id,
-                data=event.data,
-                horario=event.horario
-            )
-            if conflicting_bookings:
-                return False
-        
-        for festival in contracting_festivals:
-            conflicting_bookings = self.booking_repository.get_conflicting_bookings(
-                artist_id=artist_id,
-                data=festival.data,
-                horario=festival.horario
-            )
-            if conflicting_bookings:
-                return False
-        
-        return True 
\ No newline at end of file
+        return [
+            profile.cep
+            for profile in profiles
+            if (profile.latitude is None or profile.longitude is None)
+            and not (profile.cidade and profile.uf)
+            and profile.cep
+        ]
@@ -1,8 +1,14 @@
-from typing import List, Optional
-from domain.entities.profile import Profile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from domain.entities.profile import Profile, CoordinatesSource
 from domain.repositories.profile_repository import ProfileRepository
 from domain.repositories.role_repository import RoleRepository
+from infrastructure.repositories.async_profile_repository_impl import AsyncProfileRepositoryImpl
 from app.schemas.profile import ProfileCreate, ProfileUpdate, ProfileResponse
+from app.core.config import settings
+from app.core.location_utils import LocationUtils
+from domain.repositories.pagination import PageRequest
 
 class ProfileService:
     def __init__(self, profile_repository: ProfileRepository, role_repository: RoleRepository):
@@ -36,6 +42,12 @@ class ProfileService:
             longitude=profile_data.longitude
         )
 
+        # Coordenadas informadas têm prioridade; senão, geocodificar o endereço
+        if profile.latitude is not None and profile.longitude is not None:
+            profile.coordinates_source = CoordinatesSource.MANUAL.value
+        else:
+            self._geocode(profile)
+
         # Salvar no repositório
         created_profile = self.profile_repository.create(profile)
         
@@ -58,13 +70,14 @@ class ProfileService:
             whatsapp=created_profile.whatsapp,
             latitude=created_profile.latitude,
             longitude=created_profile.longitude,
+            coordinates_source=created_profile.coordinates_source,
             created_at=created_profile.created_at,
             updated_at=created_profile.updated_at
         )
 
-    def get_profiles(self, skip: int = 0, limit: int = 100) -> List[ProfileResponse]:
+    def get_profiles(self, skip: int = 0, limit: int = 100, page: Optional[PageRequest] = None) -> List[ProfileResponse]:
         """Listar profiles com paginação"""
-        profiles = self.profile_repository.get_all(skip=skip, limit=limit)
+        profiles = self.profile_repository.get_all(skip=skip, limit=limit, page=page)
         return [
             ProfileResponse(
                 id=profile.id,
@@ -84,6 +97,7 @@ class ProfileService:
                 whatsapp=profile.whatsapp,
                 latitude=profile.latitude,
                 longitude=profile.longitude,
+                coordinates_source=profile.coordinates_source,
                 created_at=profile.created_at,
                 updated_at=profile.updated_at
             )
@@ -114,6 +128,7 @@ class ProfileService:
             whatsapp=profile.whatsapp,
             latitude=profile.latitude,
             longitude=profile.longitude,
+            coordinates_source=profile.coordinates_source,
             created_at=profile.created_at,
             updated_at=profile.updated_at
         )
@@ -141,6 +156,7 @@ class ProfileService:
             whatsapp=profile.whatsapp,
             latitude=profile.latitude,
             longitude=profile.longitude,
+            coordinates_source=profile.coordinates_source,
             created_at=profile.created_at,
             updated_at=profile.updated_at
         )
@@ -166,6 +182,7 @@ class ProfileService:
                 whatsapp=profile.whatsapp,
                 latitude=profile.latitude,
                 longitude=profile.longitude,
+                coordinates_source=profile.coordinates_source,
                 created_at=profile.created_at,
                 updated_at=profile.updated_at
             )
@@ -185,6 +202,8 @@ class ProfileService:
                 raise ValueError("Role não encontrado")
             profile.role_id = profile_data.role_id
 
+        address = (profile.cep, profile.cidade, profile.uf)
+
         # Atualizar campos fornecidos
         if profile_data.full_name is not None:
             profile.full_name = profile_data.full_name
@@ -215,6 +234,14 @@ class ProfileService:
         if profile_data.longitude is not None:
             profile.longitude = profile_data.longitude
 
+        # Coordenadas informadas têm prioridade; senão, geocodificar se o endereço
+        # mudou (coordenadas antigas ficaram obsoletas) ou se ainda não há coordenadas
+        if profile_data.latitude is not None or profile_data.longitude is not None:
+            if profile.latitude is not None and profile.longitude is not None:
+                profile.coordinates_source = CoordinatesSource.MANUAL.value
+        elif (profile.cep, profile.cidade, profile.uf) != address or profile.latitude is None or profile.longitude is None:
+            self._geocode(profile)
+
         # Salvar alterações
         updated_profile = self.profile_repository.update(profile)
         
@@ -235,10 +262,104 @@ class ProfileService:
             whatsapp=updated_profile.whatsapp,
             latitude=updated_profile.latitude,
             longitude=updated_profile.longitude,
+            coordinates_source=updated_profile.coordinates_source,
             created_at=updated_profile.created_at,
             updated_at=updated_profile.updated_at
         )
 
     def delete_profile(self, profile_id: int) -> bool:
         """Deletar profile"""
-        return self.profile_repository.delete(profile_id) 
\ No newline at end of file
+        return self.profile_repository.delete(profile_id)
+
+    def geocode_missing_coordinates(
+        self,
+        batch_size: int = 500,
+        max_workers: int = 8,
+        chunk_size: int = 100,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Geocodificar os profiles existentes sem coordenadas (backfill)
+
+        Os profiles são lidos em lotes por ID, resolvidos em paralelo (threads) e
+        gravados com UPDATEs em massa de até `chunk_size` linhas.
+
+        Args:
+            batch_size: Quantidade de profiles lidos por lote
+            max_workers: Threads usadas na resolução
+            chunk_size: Quantidade de linhas por UPDATE em massa
+            progress: Callback chamado com as estatísticas parciais após cada lote
+
+        Returns:
+            Estatísticas: processados, resolvidos, não resolvidos (com seus IDs),
+            duração e vazão (profiles por segundo)
+        """
+        stats: Dict[str, Any] = {"processed": 0, "resolved": 0, "failed": 0, "failed_ids": []}
+        started_at = time.perf_counter()
+        after_id = 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                profiles = self.profile_repository.get_without_coordinates(limit=batch_size, after_id=after_id)
+                if not profiles:
+                    break
+
+                updates = []
+                for profile, resolved in zip(profiles, executor.map(self._resolve_address, profiles)):
+                    stats["processed"] += 1
+                    if resolved:
+                        updates.append((profile.id, *resolved))
+                    else:
+                        stats["failed"] += 1
+                        stats["failed_ids"].append(profile.id)
+
+                for start in range(0, len(updates), chunk_size):
+                    stats["resolved"] += self.profile_repository.bulk_update_coordinates(
+                        updates[start:start + chunk_size]
+                    )
+
+                after_id = profiles[-1].id
+                self._update_throughput(stats, started_at)
+                if progress:
+                    progress(stats)
+
+        self._update_throughput(stats, started_at)
+        return stats
+
+    @staticmethod
+    def _resolve_address(profile: Profile) -> Optional[Tuple[float, float, str]]:
+        """Geocodificar o endereço de um profile, sem propagar erros"""
+        try:
+            return LocationUtils.resolve_address_coordinates(profile.cidade, profile.uf, profile.cep)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _update_throughput(stats: Dict[str, Any], started_at: float) -> None:
+        elapsed = time.perf_counter() - started_at
+        stats["elapsed_seconds"] = elapsed
+        stats["profiles_per_second"] = stats["processed"] / elapsed if elapsed > 0 else 0.0
+
+    def _geocode(self, profile: Profile) -> None:
+        """Preencher latitude/longitude a partir do endereço do profile, registrando a origem"""
+        if not settings.PROFILE_GEOCODE_ON_WRITE:
+            return
+
+        resolved = LocationUtils.resolve_address_coordinates(profile.cidade, profile.uf, profile.cep)
+        if resolved:
+            profile.latitude, profile.longitude, profile.coordinates_source = resolved
+        else:
+            profile.latitude = profile.longitude = profile.coordinates_source = None
+
+class AsyncProfileService:
+    """Leitura de profiles pelo repositório assíncrono (endpoints async def)"""
+
+    def __init__(self, profile_repository: AsyncProfileRepositoryImpl):
+        self.profile_repository = profile_repository
+
+    async def get_profile_by_id(self, profile_id: int) -> Optional[ProfileResponse]:
+        """Obter profile por ID"""
+        profile = await self.profile_repository.get_by_id(profile_id)
+        if not profile:
+            return None
+        return ProfileResponse.model_validate(profile)
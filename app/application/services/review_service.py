@@ -1,11 +1,23 @@
-from typing import List, Optional, Union, Any
+from typing import List, Optional, Union, Any, Iterator
 from datetime import datetime
 from sqlalchemy.orm import Session
-from domain.entities.review import Review
+from domain.entities.review import Review, ProfileRatingSummary
 from domain.repositories.review_repository import ReviewRepository
 from infrastructure.repositories.review_repository_impl import ReviewRepositoryImpl
+from infrastructure.repositories.async_review_repository_impl import AsyncReviewRepositoryImpl
 from infrastructure.repositories.profile_repository_impl import ProfileRepositoryImpl
 from app.schemas.review import ReviewCreate, ReviewUpdate
+from domain.repositories.pagination import PageRequest
+
+def _average_rating_response(summary: ProfileRatingSummary) -> dict:
+    return {
+        "profile_id": summary.profile_id,
+        "average_rating": summary.average_rating,
+        "total_reviews": summary.total_reviews
+    }
+
+def _rating_summary_response(summary: ProfileRatingSummary) -> dict:
+    return {**_average_rating_response(summary), "distribuicao": summary.distribuicao}
 
 class ReviewService:
     """Serviço de aplicação para avaliações/reviews"""
@@ -55,25 +67,25 @@ class ReviewService:
         """Obter uma avaliação por ID"""
         return self.repository.get_by_id(review_id, include_relations)
     
-    def get_reviews_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_reviews_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações de um profile"""
-        return self.repository.get_by_profile_id(profile_id, include_relations)
+        return self.repository.get_by_profile_id(profile_id, include_relations, page=page)
     
-    def get_reviews_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_reviews_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações de um space-event type"""
-        return self.repository.get_by_space_event_type_id(space_event_type_id, include_relations)
+        return self.repository.get_by_space_event_type_id(space_event_type_id, include_relations, page=page)
     
-    def get_reviews_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_reviews_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações de um space-festival type"""
-        return self.repository.get_by_space_festival_type_id(space_festival_type_id, include_relations)
+        return self.repository.get_by_space_festival_type_id(space_festival_type_id, include_relations, page=page)
     
-    def get_reviews_by_nota(self, nota: int, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_reviews_by_nota(self, nota: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações com uma nota específica"""
-        return self.repository.get_by_nota(nota, include_relations)
+        return self.repository.get_by_nota(nota, include_relations, page=page)
     
-    def get_reviews_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_reviews_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter avaliações em um período"""
-        return self.repository.get_by_date_range(data_inicio, data_fim, include_relations)
+        return self.repository.get_by_date_range(data_inicio, data_fim, include_relations, page=page)
     
     def update_review(self, review_id: int, review_data: ReviewUpdate) -> Optional[Review]:
         """Atualizar uma avaliação"""
@@ -98,20 +110,22 @@ class ReviewService:
         """Deletar uma avaliação"""
         return self.repository.delete(review_id)
     
-    def get_all_reviews(self, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_all_reviews(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações"""
-        return self.repository.get_all(include_relations)
+        return self.repository.get_all(include_relations, page=page)
+    
+    def export_reviews(self, batch_size: int = 500) -> Iterator[Review]:
+        """Percorrer todas as avaliações em lotes (exportação)"""
+        return self.repository.iter_all(batch_size=batch_size)
     
     def get_average_rating_by_profile(self, profile_id: int) -> dict:
         """Obter a média de avaliações de um profile"""
-        average = self.repository.get_average_rating_by_profile(profile_id)
-        reviews = self.repository.get_by_profile_id(profile_id)
-        
-        return {
-            "profile_id": profile_id,
-            "average_rating": average,
-            "total_reviews": len(reviews)
-        }
+        return _average_rating_response(self.repository.get_rating_summary(profile_id))
+    
+    def get_rating_summaries(self, profile_ids: List[int]) -> List[dict]:
+        """Obter média, quantidade e distribuição das notas de vários profiles"""
+        summaries = self.repository.get_rating_summaries(list(dict.fromkeys(profile_ids)))
+        return [_rating_summary_response(summary) for summary in summaries.values()]
     
     def validate_business_rules(self, review_data: ReviewCreate) -> List[str]:
         """Validar regras de negócio específicas"""
@@ -296,4 +310,19 @@ class ReviewService:
             return None
             
         except Exception:
-            return None 
\ No newline at end of file
+            return None
+
+class AsyncReviewService:
+    """Leitura do resumo de avaliações pelo repositório assíncrono (endpoints async def)"""
+    
+    def __init__(self, repository: AsyncReviewRepositoryImpl):
+        self.repository = repository
+    
+    async def get_average_rating_by_profile(self, profile_id: int) -> dict:
+        """Obter a média de avaliações de um profile"""
+        return _average_rating_response(await self.repository.get_rating_summary(profile_id))
+    
+    async def get_rating_summaries(self, profile_ids: List[int]) -> List[dict]:
+        """Obter média, quantidade e distribuição das notas de vários profiles"""
+        summaries = await self.repository.get_rating_summaries(list(dict.fromkeys(profile_ids)))
+        return [_rating_summary_response(summary) for summary in summaries.values()]
@@ -2,6 +2,7 @@ from typing import List, Optional
 from domain.repositories.space_event_type_repository import SpaceEventTypeRepository
 from domain.entities.space_event_type import SpaceEventType, StatusEventType
 from app.schemas.space_event_type import SpaceEventTypeCreate, SpaceEventTypeUpdate
+from domain.repositories.pagination import PageRequest
 
 class SpaceEventTypeService:
     """Serviço de aplicação para o relacionamento N:N entre Spaces e Event Types"""
@@ -29,17 +30,17 @@ class SpaceEventTypeService:
         """Obter um relacionamento por ID"""
         return self.space_event_type_repository.get_by_id(space_event_type_id)
     
-    def get_event_types_by_space(self, space_id: int) -> List[SpaceEventType]:
+    def get_event_types_by_space(self, space_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os tipos de eventos de um espaço"""
-        return self.space_event_type_repository.get_by_space_id(space_id)
+        return self.space_event_type_repository.get_by_space_id(space_id, page=page)
     
-    def get_spaces_by_event_type(self, event_type_id: int) -> List[SpaceEventType]:
+    def get_spaces_by_event_type(self, event_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os espaços de um tipo de evento"""
-        return self.space_event_type_repository.get_by_event_type_id(event_type_id)
+        return self.space_event_type_repository.get_by_event_type_id(event_type_id, page=page)
     
-    def get_space_event_types_by_space_and_event_type(self, space_id: int, event_type_id: int) -> List[SpaceEventType]:
+    def get_space_event_types_by_space_and_event_type(self, space_id: int, event_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter relacionamentos específicos entre espaço e tipo de evento"""
-        return self.space_event_type_repository.get_by_space_and_event_type(space_id, event_type_id)
+        return self.space_event_type_repository.get_by_space_and_event_type(space_id, event_type_id, page=page)
     
     def update_space_event_type(self, space_event_type_id: int, space_event_type_data: SpaceEventTypeUpdate) -> Optional[SpaceEventType]:
         """Atualizar um relacionamento"""
@@ -81,6 +82,6 @@ class SpaceEventTypeService:
         """Deletar todos os relacionamentos de um tipo de evento"""
         return self.space_event_type_repository.delete_by_event_type_id(event_type_id)
     
-    def get_all_space_event_types(self) -> List[SpaceEventType]:
+    def get_all_space_event_types(self, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os relacionamentos"""
-        return self.space_event_type_repository.get_all() 
\ No newline at end of file
+        return self.space_event_type_repository.get_all(page=page) 
\ No newline at end of file
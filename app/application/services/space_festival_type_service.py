@@ -2,6 +2,7 @@ from typing import List, Optional
 from domain.repositories.space_festival_type_repository import SpaceFestivalTypeRepository
 from domain.entities.space_festival_type import SpaceFestivalType, StatusFestivalType
 from app.schemas.space_festival_type import SpaceFestivalTypeCreate, SpaceFestivalTypeUpdate
+from domain.repositories.pagination import PageRequest
 
 class SpaceFestivalTypeService:
     """Serviço de aplicação para o relacionamento N:N entre Spaces e Festival Types"""
@@ -29,17 +30,17 @@ class SpaceFestivalTypeService:
         """Obter um relacionamento por ID"""
         return self.space_festival_type_repository.get_by_id(space_festival_type_id)
     
-    def get_festival_types_by_space(self, space_id: int) -> List[SpaceFestivalType]:
+    def get_festival_types_by_space(self, space_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os tipos de festivais de um espaço"""
-        return self.space_festival_type_repository.get_by_space_id(space_id)
+        return self.space_festival_type_repository.get_by_space_id(space_id, page=page)
     
-    def get_spaces_by_festival_type(self, festival_type_id: int) -> List[SpaceFestivalType]:
+    def get_spaces_by_festival_type(self, festival_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os espaços de um tipo de festival"""
-        return self.space_festival_type_repository.get_by_festival_type_id(festival_type_id)
+        return self.space_festival_type_repository.get_by_festival_type_id(festival_type_id, page=page)
     
-    def get_space_festival_types_by_space_and_festival_type(self, space_id: int, festival_type_id: int) -> List[SpaceFestivalType]:
+    def get_space_festival_types_by_space_and_festival_type(self, space_id: int, festival_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter relacionamentos específicos entre espaço e tipo de festival"""
-        return self.space_festival_type_repository.get_by_space_and_festival_type(space_id, festival_type_id)
+        return self.space_festival_type_repository.get_by_space_and_festival_type(space_id, festival_type_id, page=page)
     
     def update_space_festival_type(self, space_festival_type_id: int, space_festival_type_data: SpaceFestivalTypeUpdate) -> Optional[SpaceFestivalType]:
         """Atualizar um relacionamento"""
@@ -81,6 +82,6 @@ class SpaceFestivalTypeService:
         """Deletar todos os relacionamentos de um tipo de festival"""
         return self.space_festival_type_repository.delete_by_festival_type_id(festival_type_id)
     
-    def get_all_space_festival_types(self) -> List[SpaceFestivalType]:
+    def get_all_space_festival_types(self, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os relacionamentos"""
-        return self.space_festival_type_repository.get_all() 
\ No newline at end of file
+        return self.space_festival_type_repository.get_all(page=page) 
\ No newline at end of file
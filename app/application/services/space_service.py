@@ -2,6 +2,7 @@ from typing import List, Optional, Union, TYPE_CHECKING
 from domain.entities.space import Space
 from domain.repositories.space_repository import SpaceRepository
 from domain.repositories.profile_repository import ProfileRepository
+from domain.repositories.pagination import PageRequest
 
 if TYPE_CHECKING:
     from infrastructure.database.models.space_model import SpaceModel
@@ -63,9 +64,9 @@ class SpaceService:
         """Buscar espaços por tipo de festival"""
         return self.space_repository.get_by_festival_type_id(festival_type_id, include_relations=include_relations)
 
-    def get_all_spaces(self, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Space, "SpaceModel"]]:
+    def get_all_spaces(self, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Space, "SpaceModel"]]:
         """Listar todos os espaços"""
-        return self.space_repository.get_all(skip=skip, limit=limit, include_relations=include_relations)
+        return self.space_repository.get_all(skip=skip, limit=limit, include_relations=include_relations, page=page)
 
     def update_space(self, space_id: int, space_data: dict) -> Space:
         """Atualizar um espaço"""
@@ -3,6 +3,7 @@ from domain.entities.user import User
 from domain.repositories.user_repository import UserRepository
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from infrastructure.database.models.user_model import UserModel
+from domain.repositories.pagination import PageRequest
 
 class UserService:
     def __init__(self, user_repository: UserRepository):
@@ -36,9 +37,9 @@ class UserService:
             updated_at=created_user.updated_at
         )
 
-    def get_users(self, skip: int = 0, limit: int = 100) -> List[UserResponse]:
+    def get_users(self, skip: int = 0, limit: int = 100, page: Optional[PageRequest] = None) -> List[UserResponse]:
         """Listar usuários com paginação"""
-        users = self.user_repository.get_all(skip=skip, limit=limit)
+        users = self.user_repository.get_all(skip=skip, limit=limit, page=page)
         return [
             UserResponse(
                 id=user.id,
@@ -85,6 +86,10 @@ class UserService:
         """Obter usuário por email para autenticação (inclui senha)"""
         return self.user_repository.get_by_email(email)
 
+    def upgrade_password_hash(self, user: User, password_hash: str) -> bool:
+        """Gravar o hash da senha recalculado com o custo atual (após login bem-sucedido)"""
+        return self.user_repository.update_password(user.id, password_hash, current_password=user.password)
+
     def update_user(self, user_id: int, user_data: UserUpdate) -> Optional[UserResponse]:
         """Atualizar usuário"""
         user = self.user_repository.get_by_id(user_id)
@@ -1,9 +1,11 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.core.config import settings
 from app.core.security import verify_token, is_access_token
 from app.application.services.user_service import UserService
 from app.application.dependencies import get_user_service
 from app.application.services.auth_service import AuthService
+from infrastructure.cache.principal_cache import cache_principal, get_cached_principal
 
 security = HTTPBearer()
 
@@ -16,17 +18,14 @@ def get_current_user(
     user_service: UserService = Depends(get_user_service),
     auth_service: AuthService = Depends(get_auth_service)
 ):
-    """Obter usuário atual baseado no token JWT"""
+    """
+    Obter usuário atual baseado no token JWT
+
+    O usuário fica em cache por AUTH_PRINCIPAL_CACHE_TTL_SECONDS: com o cache quente a
+    autenticação não consulta o banco (a sessão das dependências nem obtém conexão).
+    """
     token = credentials.credentials
     
-    # Verificar se token está na blacklist
-    if auth_service.is_token_blacklisted(token):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token foi invalidado (logout)",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
     # Verificar token
     payload = verify_token(token)
     if not payload:
@@ -44,6 +43,14 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Verificar se token foi revogado (logout)
+    if auth_service.is_token_revoked(token, payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token foi invalidado (logout)",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     # Obter usuário
     user_id = payload.get("sub")
     if user_id is None:
@@ -53,6 +60,10 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    user = get_cached_principal(int(user_id))
+    if user is not None:
+        return user
+    
     user = user_service.get_user_by_id(int(user_id))
     if user is None:
         raise HTTPException(
@@ -61,6 +72,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    cache_principal(user.id, user, settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
     return user
 
 def get_current_active_user(current_user = Depends(get_current_user)):
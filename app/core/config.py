@@ -1,19 +1,34 @@
 import os
+import re
 import subprocess
 from datetime import timedelta
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def get_version_from_file() -> Optional[str]:
+    """Lê VERSION de version.py (sem executá-lo), a fonte da versão do projeto"""
+    try:
+        with open(os.path.join(_PROJECT_ROOT, "version.py"), encoding="utf-8") as version_file:
+            match = re.search(r"^VERSION\s*=\s*[\"']([^\"']+)[\"']", version_file.read(), re.MULTILINE)
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
 def get_git_version():
-    """Obtém a versão atual do Git baseada na tag mais recente"""
+    """Obtém a versão atual do Git baseada na tag mais recente (fallback de desenvolvimento)"""
     try:
         # Tenta obter a tag mais recente
         result = subprocess.run(
             ["git", "describe", "--tags", "--abbrev=0"],
             capture_output=True,
             text=True,
-            cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            cwd=_PROJECT_ROOT,
+            timeout=2
         )
         if result.returncode == 0:
             version = result.stdout.strip()
@@ -30,7 +45,8 @@ def get_git_version():
             ["git", "rev-parse", "--short", "HEAD"],
             capture_output=True,
             text=True,
-            cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            cwd=_PROJECT_ROOT,
+            timeout=2
         )
         if result.returncode == 0:
             return f"dev-{result.stdout.strip()}"
@@ -40,10 +56,19 @@ def get_git_version():
     # Fallback final
     return "0.1.0"
 
+@lru_cache(maxsize=None)
+def get_app_version() -> str:
+    """
+    Versão da aplicação, resolvida no primeiro uso e memorizada
+
+    Ordem: variável APP_VERSION, VERSION de version.py e, só sem ambos (ex.: checkout
+    parcial em desenvolvimento), as tags do Git.
+    """
+    return os.getenv("APP_VERSION") or get_version_from_file() or get_git_version()
+
 class Settings:
     # Configurações da aplicação
     APP_NAME: str = os.getenv("APP_NAME", "eShow API")
-    APP_VERSION: str = os.getenv("APP_VERSION", get_git_version())
     DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
     
     # Configurações do banco de dados
@@ -54,6 +79,54 @@ class Settings:
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+    # Cache do usuário autenticado por id em get_current_user (0 desativa); invalidado
+    # ao alterar/excluir o usuário no mesmo processo
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+    # Tokens revogados (logout): "memory" (por processo) ou "database" (tabela
+    # revoked_tokens, compartilhada entre workers e sincronizada a cada N segundos)
+    TOKEN_REVOCATION_BACKEND: str = os.getenv("TOKEN_REVOCATION_BACKEND", "memory").lower()
+    TOKEN_REVOCATION_SYNC_SECONDS: float = float(os.getenv("TOKEN_REVOCATION_SYNC_SECONDS", "5"))
+    
+    # Configurações de cache de coordenadas (cidade/UF)
+    COORDINATES_CACHE_MAX_SIZE: int = int(os.getenv("COORDINATES_CACHE_MAX_SIZE", "10000"))
+    COORDINATES_CACHE_TTL_SECONDS: float = float(os.getenv("COORDINATES_CACHE_TTL_SECONDS", "86400"))
+    # Carregar a tabela de municípios em memória na inicialização
+    CEP_GAZETTEER_PRELOAD: bool = os.getenv("CEP_GAZETTEER_PRELOAD", "False").lower() == "true"
+    
+    # Configurações da API ViaCEP
+    VIACEP_BASE_URL: str = os.getenv("VIACEP_BASE_URL", "https://viacep.com.br/ws")
+    VIACEP_TIMEOUT_SECONDS: float = float(os.getenv("VIACEP_TIMEOUT_SECONDS", "5"))
+    VIACEP_MAX_CONNECTIONS: int = int(os.getenv("VIACEP_MAX_CONNECTIONS", "10"))
+    VIACEP_CACHE_TTL_SECONDS: float = float(os.getenv("VIACEP_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+    VIACEP_NEGATIVE_CACHE_TTL_SECONDS: float = float(os.getenv("VIACEP_NEGATIVE_CACHE_TTL_SECONDS", str(24 * 3600)))
+    VIACEP_CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("VIACEP_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    VIACEP_CIRCUIT_RESET_SECONDS: float = float(os.getenv("VIACEP_CIRCUIT_RESET_SECONDS", "30"))
+    
+    # Geocodificar (cidade/UF ou CEP) os profiles sem coordenadas ao criar/atualizar
+    PROFILE_GEOCODE_ON_WRITE: bool = os.getenv("PROFILE_GEOCODE_ON_WRITE", "True").lower() == "true"
+    
+    # Cache dos resumos estatísticos de dados financeiros (0 desativa)
+    FINANCIAL_STATS_CACHE_TTL_SECONDS: float = float(os.getenv("FINANCIAL_STATS_CACHE_TTL_SECONDS", "30"))
+    
+    # Paginação por cursor das listagens
+    PAGINATION_DEFAULT_LIMIT: int = int(os.getenv("PAGINATION_DEFAULT_LIMIT", "50"))
+    PAGINATION_MAX_LIMIT: int = int(os.getenv("PAGINATION_MAX_LIMIT", "200"))
+    
+    # Exportação em streaming (linhas lidas do banco por lote)
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+    
+    # Threads para endpoints/dependências síncronos (def); manter <= conexões do pool do banco
+    THREADPOOL_MAX_WORKERS: int = int(os.getenv("THREADPOOL_MAX_WORKERS", "40"))
+    
+    # Pool de processos do bcrypt (login/registro) e limite de operações em andamento/fila
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+    # Custo do bcrypt (log2 das iterações); hashes com outro custo são refeitos no login
+    PASSWORD_BCRYPT_ROUNDS: int = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+    
+    @property
+    def APP_VERSION(self) -> str:
+        return get_app_version()
     
     @property
     def ACCESS_TOKEN_EXPIRE_DELTA(self) -> timedelta:
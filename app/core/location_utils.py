@@ -1,11 +1,19 @@
-import requests
 import math
+import numpy as np
 import unicodedata
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Sequence, Union
 import logging
 import time
+from app.core.config import settings
+from domain.entities.profile import CoordinatesSource
+from concurrent.futures import ThreadPoolExecutor
+from infrastructure.cache.ttl_cache import TTLCache
 from infrastructure.database.database import SessionLocal
+from infrastructure.external.cep_lookup_store import CepLookupStore
+from infrastructure.external.circuit_breaker import CircuitBreaker
+from infrastructure.external.viacep_client import ViaCepClient
 from infrastructure.repositories.cep_coordinates_repository_impl import CepCoordinatesRepositoryImpl
+from infrastructure.spatial.cep_gazetteer import CepGazetteer
 
 logger = logging.getLogger(__name__)
 
@@ -63,8 +71,83 @@ def get_location_by_coordinates(lat: float, lng: float) -> Optional[Dict[str, An
 class LocationUtils:
     """Utilitário para cálculos de localização e distância"""
     
-    # Cache simples para evitar requisições repetidas
-    _coordinates_cache = {}
+    # Cache (cidade normalizada, UF) -> coordenadas, limitado e com expiração
+    _coordinates_cache = TTLCache(
+        maxsize=settings.COORDINATES_CACHE_MAX_SIZE,
+        ttl_seconds=settings.COORDINATES_CACHE_TTL_SECONDS
+    )
+    
+    # Cliente da ViaCEP compartilhado (pool de conexões, cache e disjuntor)
+    _viacep_client = ViaCepClient(
+        base_url=settings.VIACEP_BASE_URL,
+        timeout_seconds=settings.VIACEP_TIMEOUT_SECONDS,
+        max_connections=settings.VIACEP_MAX_CONNECTIONS,
+        positive_ttl_seconds=settings.VIACEP_CACHE_TTL_SECONDS,
+        negative_ttl_seconds=settings.VIACEP_NEGATIVE_CACHE_TTL_SECONDS,
+        store=CepLookupStore(
+            SessionLocal,
+            positive_ttl_seconds=settings.VIACEP_CACHE_TTL_SECONDS,
+            negative_ttl_seconds=settings.VIACEP_NEGATIVE_CACHE_TTL_SECONDS
+        ),
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=settings.VIACEP_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout_seconds=settings.VIACEP_CIRCUIT_RESET_SECONDS
+        )
+    )
+    
+    # Cópia em memória da tabela de municípios (None = consultar o banco)
+    _gazetteer: Optional[CepGazetteer] = None
+    
+    @staticmethod
+    def preload_gazetteer() -> bool:
+        """
+        Carrega todos os municípios em memória, substituindo a cópia anterior
+        
+        Returns:
+            True se a carga foi realizada, False em caso de erro (mantém o banco como fonte)
+        """
+        try:
+            repository, db = LocationUtils._get_cep_repository()
+            try:
+                LocationUtils._gazetteer = repository.load_gazetteer()
+            finally:
+                db.close()
+            logger.info(f"{len(LocationUtils._gazetteer)} municípios carregados em memória")
+            return True
+        except Exception as e:
+            LocationUtils._gazetteer = None
+            logger.error(f"Erro ao carregar municípios em memória: {str(e)}")
+            return False
+    
+    @staticmethod
+    def _on_cep_coordinates_changed(cidade: str, uf: str) -> None:
+        """Listener de alterações de municípios: invalida o cache e recarrega a cópia em memória"""
+        if LocationUtils._gazetteer is not None:
+            LocationUtils.preload_gazetteer()
+        LocationUtils.invalidate_coordinates_cache(cidade, uf)
+    
+    @staticmethod
+    def invalidate_coordinates_cache(cidade: Optional[str] = None, uf: Optional[str] = None) -> None:
+        """
+        Invalida o cache de coordenadas
+        
+        Como a busca parcial só retorna cidades da mesma UF, uma alteração em um
+        município invalida todas as entradas da sua UF. Sem UF, o cache é esvaziado.
+        
+        Args:
+            cidade: Nome da cidade alterada (não utilizado; mantido pela assinatura do listener)
+            uf: Sigla da UF alterada
+        """
+        if not uf:
+            LocationUtils._coordinates_cache.clear()
+            return
+        uf_clean = uf.strip().upper()
+        LocationUtils._coordinates_cache.invalidate_where(lambda key: key[1] == uf_clean)
+    
+    @staticmethod
+    def get_coordinates_cache_stats() -> Dict[str, Any]:
+        """Obtém estatísticas (acertos, falhas, remoções) do cache de coordenadas"""
+        return LocationUtils._coordinates_cache.stats()
     
     @staticmethod
     def _normalize_text(text: str) -> str:
@@ -128,6 +211,31 @@ class LocationUtils:
             logger.error(f"Erro ao obter coordenadas do profile {profile.id}: {str(e)}")
             return None
     
+    @staticmethod
+    def resolve_address_coordinates(cidade: Optional[str], uf: Optional[str], cep: Optional[str]) -> Optional[Tuple[float, float, str]]:
+        """
+        Geocodifica o endereço de um profile (sem usar latitude/longitude já gravadas)
+        
+        Args:
+            cidade, uf: Município do profile
+            cep: CEP do profile, usado se a cidade/UF não for encontrada
+            
+        Returns:
+            Tuple com (latitude, longitude, origem) - origem é um valor de
+            CoordinatesSource - ou None se não conseguir obter
+        """
+        if cidade and uf:
+            coordinates = LocationUtils.get_coordinates_from_cidade_uf(cidade, uf)
+            if coordinates:
+                return (coordinates[0], coordinates[1], CoordinatesSource.CIDADE_UF.value)
+        
+        if cep:
+            coordinates = LocationUtils._get_coordinates_from_viacep(cep)
+            if coordinates:
+                return (coordinates[0], coordinates[1], CoordinatesSource.VIACEP.value)
+        
+        return None
+    
     @staticmethod
     def _get_coordinates_from_viacep(cep: str) -> Optional[Tuple[float, float]]:
         """
@@ -140,43 +248,43 @@ class LocationUtils:
             Tuple com (latitude, longitude) ou None se não conseguir obter
         """
         try:
-            # Limpar CEP (remover hífen)
-            cep_clean = cep.replace('-', '').replace(' ', '')
-            
-            # URL da API ViaCEP
-            url = f"https://viacep.com.br/ws/{cep_clean}/json/"
-            
-            # Fazer requisição com timeout
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Verificar se não há erro
-            if 'erro' in data and data['erro']:
-                logger.warning(f"CEP {cep} não encontrado na API ViaCEP")
-                return None
-            
-            # Extrair coordenadas (ViaCEP não retorna coordenadas diretamente)
-            # Vamos usar a cidade/UF para buscar na base local
-            if 'localidade' in data and 'uf' in data:
-                cidade = data['localidade']
-                uf = data['uf']
-                coordinates = LocationUtils.get_coordinates_from_cidade_uf(cidade, uf)
-                if coordinates:
-                    logger.info(f"Coordenadas obtidas via ViaCEP + base local para {cidade}/{uf}: {coordinates}")
-                    return coordinates
-            
-            logger.warning(f"ViaCEP não retornou dados suficientes para CEP {cep}")
-            return None
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Erro na requisição para ViaCEP (CEP {cep}): {str(e)}")
-            return None
+            data = LocationUtils._viacep_client.lookup(cep)
+            return LocationUtils._coordinates_from_viacep_data(cep, data)
         except Exception as e:
             logger.error(f"Erro ao processar resposta da ViaCEP (CEP {cep}): {str(e)}")
             return None
     
+    @staticmethod
+    def _coordinates_from_viacep_data(cep: str, data: Optional[Dict[str, str]]) -> Optional[Tuple[float, float]]:
+        """Converte a cidade/UF retornada pela ViaCEP em coordenadas (base local)"""
+        if not data:
+            logger.warning(f"CEP {cep} não encontrado na API ViaCEP")
+            return None
+        
+        # ViaCEP não retorna coordenadas diretamente: usar a cidade/UF na base local
+        coordinates = LocationUtils.get_coordinates_from_cidade_uf(data['cidade'], data['uf'])
+        if coordinates:
+            logger.info(f"Coordenadas obtidas via ViaCEP + base local para {data['cidade']}/{data['uf']}: {coordinates}")
+        return coordinates
+    
+    @staticmethod
+    def prefetch_viacep(ceps) -> None:
+        """
+        Consulta em paralelo os CEPs na ViaCEP para aquecer o cache do cliente
+        
+        Usado antes de laços que resolvem vários profiles, para que CEPs ainda não
+        consultados não sejam resolvidos um a um dentro do laço.
+        
+        Args:
+            ceps: CEPs a consultar (duplicados e vazios são ignorados)
+        """
+        pending = {cep for cep in ceps if ViaCepClient.clean_cep(cep)}
+        if not pending:
+            return
+        client = LocationUtils._viacep_client
+        with ThreadPoolExecutor(max_workers=min(len(pending), client.max_connections)) as executor:
+            list(executor.map(client.lookup, pending))
+    
     @staticmethod
     def get_coordinates_from_cidade_uf(cidade: str, uf: str) -> Optional[Tuple[float, float]]:
         """
@@ -195,16 +303,17 @@ class LocationUtils:
             uf_clean = uf.strip().upper()
             
             # Verificar cache primeiro
-            cache_key = f"{cidade_clean}_{uf_clean}"
-            if cache_key in LocationUtils._coordinates_cache:
-                return LocationUtils._coordinates_cache[cache_key]
+            cache_key = (cidade_clean, uf_clean)
+            coordinates = LocationUtils._coordinates_cache.get(cache_key)
+            if coordinates is not None:
+                return coordinates
             
             # Buscar na base de dados local
             coordinates = LocationUtils._get_coordinates_from_local_db(cidade_clean, uf_clean)
             
             # Armazenar no cache
             if coordinates:
-                LocationUtils._coordinates_cache[cache_key] = coordinates
+                LocationUtils._coordinates_cache.set(cache_key, coordinates)
                 logger.info(f"Coordenadas obtidas para {cidade}/{uf}: {coordinates}")
             
             return coordinates
@@ -216,6 +325,15 @@ class LocationUtils:
     @staticmethod
     def _get_coordinates_from_local_db(cidade: str, uf: str) -> Optional[Tuple[float, float]]:
         """Obtém coordenadas da base de dados local"""
+        gazetteer = LocationUtils._gazetteer
+        if gazetteer is not None:
+            cep_coords = gazetteer.get_by_cidade_uf(cidade, uf)
+            if not cep_coords:
+                # Busca parcial restrita à UF
+                cidades_similares = gazetteer.search_by_cidade(cidade, uf=uf, limit=1)
+                cep_coords = cidades_similares[0] if cidades_similares else None
+            return cep_coords.coordinates if cep_coords else None
+        
         try:
             repository, db = LocationUtils._get_cep_repository()
             
@@ -245,6 +363,44 @@ class LocationUtils:
             logger.warning(f"Erro ao buscar coordenadas na base de dados para {cidade}/{uf}: {str(e)}")
             return None
     
+    # Raio da Terra em quilômetros
+    EARTH_RADIUS_KM = 6371.0
+    
+    @staticmethod
+    def calculate_distances(
+        origin_lat: float,
+        origin_lng: float,
+        latitudes: Union[Sequence[float], np.ndarray],
+        longitudes: Union[Sequence[float], np.ndarray],
+        radius_km: Union[float, Sequence[float], np.ndarray] = math.inf
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula em lote (vetorizado com NumPy) a distância de Haversine entre uma origem
+        e vários candidatos
+        
+        Args:
+            origin_lat, origin_lng: Coordenadas da origem
+            latitudes, longitudes: Coordenadas dos candidatos (mesmo tamanho)
+            radius_km: Raio único ou um raio por candidato
+            
+        Returns:
+            Tuple com (distâncias em km, máscara booleana dos candidatos dentro do raio)
+        """
+        lat_rad = np.radians(np.asarray(latitudes, dtype=np.float64))
+        lng_rad = np.radians(np.asarray(longitudes, dtype=np.float64))
+        origin_lat_rad = math.radians(origin_lat)
+        origin_lng_rad = math.radians(origin_lng)
+        
+        # Fórmula de Haversine
+        a = (
+            np.sin((lat_rad - origin_lat_rad) / 2) ** 2
+            + math.cos(origin_lat_rad) * np.cos(lat_rad) * np.sin((lng_rad - origin_lng_rad) / 2) ** 2
+        )
+        a = np.clip(a, 0.0, 1.0)
+        distances = LocationUtils.EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        
+        return distances, distances <= np.asarray(radius_km, dtype=np.float64)
+    
     @staticmethod
     def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
@@ -257,27 +413,8 @@ class LocationUtils:
         Returns:
             Distância em quilômetros
         """
-        # Raio da Terra em quilômetros
-        R = 6371.0
-        
-        # Converter graus para radianos
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-        
-        # Diferenças nas coordenadas
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-        
-        # Fórmula de Haversine
-        a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        # Distância em quilômetros
-        distance = R * c
-        
-        return distance
+        distances, _ = LocationUtils.calculate_distances(lat1, lon1, (lat2,), (lon2,))
+        return float(distances[0])
     
     @staticmethod
     def get_nearby_cities(latitude: float, longitude: float, radius_km: float = 50) -> list:
@@ -292,31 +429,18 @@ class LocationUtils:
             Lista de cidades próximas com suas coordenadas
         """
         try:
+            gazetteer = LocationUtils._gazetteer
+            if gazetteer is not None:
+                nearby_cities = gazetteer.get_nearby_cities_with_distance(latitude, longitude, radius_km)
+                return LocationUtils._format_nearby_cities(nearby_cities)
+            
             repository, db = LocationUtils._get_cep_repository()
             
             try:
-                nearby_cities = repository.get_nearby_cities(latitude, longitude, radius_km)
-                
-                # Calcular distância para cada cidade
-                result = []
-                for city in nearby_cities:
-                    distance = LocationUtils.calculate_distance(
-                        latitude, longitude, 
-                        city.latitude, city.longitude
-                    )
-                    
-                    result.append({
-                        'cidade': city.cidade,
-                        'uf': city.uf,
-                        'latitude': city.latitude,
-                        'longitude': city.longitude,
-                        'distancia_km': round(distance, 2)
-                    })
-                
-                # Ordenar por distância
-                result.sort(key=lambda x: x['distancia_km'])
+                # Cidades já vêm filtradas pelo raio e ordenadas por distância
+                nearby_cities = repository.get_nearby_cities_with_distance(latitude, longitude, radius_km)
                 
-                return result
+                return LocationUtils._format_nearby_cities(nearby_cities)
                 
             finally:
                 db.close()
@@ -325,6 +449,20 @@ class LocationUtils:
             logger.error(f"Erro ao buscar cidades próximas: {str(e)}")
             return []
     
+    @staticmethod
+    def _format_nearby_cities(nearby_cities) -> list:
+        """Converte (coordenadas, distancia_km) para o formato de resposta"""
+        return [
+            {
+                'cidade': city.cidade,
+                'uf': city.uf,
+                'latitude': city.latitude,
+                'longitude': city.longitude,
+                'distancia_km': round(distance, 2)
+            }
+            for city, distance in nearby_cities
+        ]
+    
     @staticmethod
     def search_cities_by_name(cidade: str, limit: int = 10) -> list:
         """
@@ -338,6 +476,19 @@ class LocationUtils:
             Lista de cidades encontradas
         """
         try:
+            gazetteer = LocationUtils._gazetteer
+            if gazetteer is not None:
+                cities = gazetteer.search_by_cidade(LocationUtils._normalize_text(cidade), limit=limit)
+                return [
+                    {
+                        'cidade': city.cidade,
+                        'uf': city.uf,
+                        'latitude': city.latitude,
+                        'longitude': city.longitude
+                    }
+                    for city in cities
+                ]
+            
             repository, db = LocationUtils._get_cep_repository()
             
             try:
@@ -359,4 +510,7 @@ class LocationUtils:
                 
         except Exception as e:
             logger.error(f"Erro ao buscar cidades por nome: {str(e)}")
-            return [] 
\ No newline at end of file
+            return [] 
+
+# Invalidar o cache de coordenadas quando o repositório alterar um município
+CepCoordinatesRepositoryImpl.add_change_listener(LocationUtils._on_cep_coordinates_changed)
@@ -0,0 +1,194 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password, verify_and_update_password
+
+class PasswordHasherBusyError(RuntimeError):
+    """Fila do pool de hash de senhas cheia"""
+    pass
+
+def _timed_call(func: Callable[..., Any], *args: Any):
+    """Executado no processo do pool: resultado e instantes de início/fim (relógio de parede)"""
+    started_at = time.time()
+    result = func(*args)
+    return result, started_at, time.time()
+
+class LatencyHistogram:
+    """Histograma de duração por faixas fixas (ms), com percentis estimados pelo limite da faixa"""
+
+    BUCKETS_MS = (10, 25, 50, 100, 150, 200, 300, 500, 750, 1000, 2000)
+
+    def __init__(self):
+        self._counts: List[int] = [0] * (len(self.BUCKETS_MS) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        index = next((i for i, bound in enumerate(self.BUCKETS_MS) if ms <= bound), len(self.BUCKETS_MS))
+        self._counts[index] += 1
+        self._count += 1
+        self._total_ms += ms
+        self._max_ms = max(self._max_ms, ms)
+
+    def percentile(self, fraction: float) -> float:
+        """Limite superior da faixa que contém o percentil (o máximo, na última faixa)"""
+        if not self._count:
+            return 0.0
+        target = fraction * self._count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return float(self.BUCKETS_MS[index]) if index < len(self.BUCKETS_MS) else round(self._max_ms, 3)
+        return round(self._max_ms, 3)
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={bound}" for bound in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}"]
+        return {
+            "count": self._count,
+            "avg_ms": round(self._total_ms / self._count, 3) if self._count else 0.0,
+            "max_ms": round(self._max_ms, 3),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets_ms": dict(zip(labels, self._counts)),
+        }
+
+class PasswordHasher:
+    """
+    Hash e verificação de senhas (bcrypt) em um pool de processos dedicado
+
+    O bcrypt é CPU puro (~100–300 ms por operação): fora do processo da API ele não
+    ocupa o event loop, o threadpool dos endpoints nem o GIL. No máximo `max_pending`
+    operações ficam em andamento ou na fila; acima disso a chamada falha na hora com
+    PasswordHasherBusyError (o endpoint responde 503) em vez de acumular espera.
+
+    Os processos não são criados por fork do servidor (que já tem threads): usam o
+    método forkserver (spawn onde ele não existe). O pool é criado na inicialização
+    da aplicação (ou no primeiro uso) e recriado se um processo morrer. A duração de
+    cada hash/verificação (só o bcrypt, sem a fila) vai para histogramas por operação,
+    usados para escolher um PASSWORD_BCRYPT_ROUNDS compatível com o p99 do login.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        if max_workers <= 0 or max_pending <= 0:
+            raise ValueError("max_workers e max_pending devem ser maiores que zero")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._max_pending_seen = 0
+        self._completed = 0
+        self._rejected = 0
+        self._failed = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._rehashed = 0
+        self._histograms = {"hash": LatencyHistogram(), "verify": LatencyHistogram()}
+
+    async def hash(self, password: str) -> str:
+        """Gerar o hash da senha"""
+        return await self._submit("hash", get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verificar a senha contra o hash"""
+        return await self._submit("verify", verify_password, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verificar a senha e, se o hash usar outro custo, obter o novo hash
+
+        Returns:
+            (senha correta, novo hash ou None se o atual já usa o custo configurado)
+        """
+        valid, new_hash = await self._submit("verify", verify_and_update_password, password, hashed_password)
+        if new_hash:
+            with self._lock:
+                self._rehashed += 1
+        return valid, new_hash
+
+    async def _submit(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusyError("Muitas operações de senha em andamento; tente novamente")
+            self._pending += 1
+            self._max_pending_seen = max(self._max_pending_seen, self._pending)
+            executor = self._get_executor()
+
+        submitted_at = time.time()
+        try:
+            result, started_at, finished_at = await asyncio.wrap_future(executor.submit(_timed_call, func, *args))
+        except BrokenProcessPool:
+            with self._lock:
+                self._failed += 1
+                if self._executor is executor:
+                    self._executor = None
+            raise
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+        queue_wait = max(started_at - submitted_at, 0.0)
+        with self._lock:
+            self._completed += 1
+            self._queue_wait_total += queue_wait
+            self._queue_wait_max = max(self._queue_wait_max, queue_wait)
+            self._histograms[operation].observe(finished_at - started_at)
+        return result
+
+    def start(self) -> None:
+        """Criar o pool de processos antes da primeira requisição"""
+        with self._lock:
+            self._get_executor()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(start_method)
+            )
+        return self._executor
+
+    def stats(self) -> Dict[str, Any]:
+        """Ocupação da fila e tempos de espera/execução desde o início do processo"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "max_pending_seen": self._max_pending_seen,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "failed": self._failed,
+                "queue_wait_avg_ms": round(self._queue_wait_total * 1000 / self._completed, 3) if self._completed else 0.0,
+                "queue_wait_max_ms": round(self._queue_wait_max * 1000, 3),
+                "bcrypt_rounds": settings.PASSWORD_BCRYPT_ROUNDS,
+                "rehashed": self._rehashed,
+                "duration": {operation: histogram.snapshot() for operation, histogram in self._histograms.items()},
+            }
+
+    def shutdown(self) -> None:
+        """Encerrar os processos do pool, aguardando as operações em andamento (no máximo max_pending)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
@@ -1,16 +1,22 @@
+import hashlib
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-# Configuração para hash de senhas
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Configuração para hash de senhas; hashes com outro custo são refeitos no login
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verificar se a senha está correta"""
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verificar a senha e, se o hash usar outro custo/esquema, gerar o novo hash (senão None)"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     """Gerar hash da senha"""
     return pwd_context.hash(password)
@@ -23,7 +29,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + settings.ACCESS_TOKEN_EXPIRE_DELTA
     
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -35,7 +41,7 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     else:
         expire = datetime.utcnow() + settings.REFRESH_TOKEN_EXPIRE_DELTA
     
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -47,6 +53,10 @@ def verify_token(token: str) -> Optional[dict]:
     except JWTError:
         return None
 
+def get_token_id(token: str, payload: dict) -> str:
+    """Identificador do token para revogação: claim jti (ou hash, em tokens emitidos sem jti)"""
+    return payload.get("jti") or hashlib.sha256(token.encode("utf-8")).hexdigest()
+
 def is_access_token(payload: dict) -> bool:
     """Verificar se é um token de acesso"""
     return payload.get("type") == "access"
@@ -1,8 +1,12 @@
-from fastapi import FastAPI
+from anyio import to_thread
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from app.api.routes import api_router
 from app.core.config import settings
+from app.core.location_utils import LocationUtils
+from app.core.password_hasher import PasswordHasherBusyError, password_hasher
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -25,6 +29,37 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Incluir rotas da API
 app.include_router(api_router, prefix="/api/v1")
 
+@app.on_event("startup")
+async def configure_threadpool():
+    """
+    Limita o threadpool que executa os endpoints e dependências síncronos (def)
+
+    Endpoints que acessam o banco (sessões síncronas) ou serviços externos são
+    declarados com `def`; `async def` fica para o que não bloqueia o event loop.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy(request: Request, exc: PasswordHasherBusyError):
+    """Fila do pool de hash de senhas cheia (login/registro): tentar novamente em seguida"""
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
+@app.on_event("startup")
+def start_password_hasher():
+    """Cria o pool de hash de senhas antes das primeiras requisições"""
+    password_hasher.start()
+
+@app.on_event("shutdown")
+def shutdown_password_hasher():
+    """Encerra os processos do pool de hash de senhas"""
+    password_hasher.shutdown()
+
+@app.on_event("startup")
+def preload_cep_gazetteer():
+    """Carrega os municípios em memória, se habilitado"""
+    if settings.CEP_GAZETTEER_PRELOAD:
+        LocationUtils.preload_gazetteer()
+
 @app.get("/")
 async def root():
     return {"message": "Bem-vindo à eShow API - Arquitetura Hexagonal"}
@@ -153,11 +153,13 @@ class ArtistResponseWithRelations(ArtistResponse):
 class ArtistListResponse(BaseModel):
     """Schema para resposta dinâmica de lista de artistas"""
     items: List[ArtistResponse]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
 class ArtistListResponseWithRelations(BaseModel):
     """Schema para resposta dinâmica de lista de artistas com relacionamentos"""
     items: List[ArtistResponseWithRelations]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True} 
\ No newline at end of file
@@ -197,11 +197,13 @@ class BookingWithRelations(BookingResponse):
 class BookingListResponse(BaseModel):
     """Schema para resposta de lista de bookings"""
     items: List[BookingResponse]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
 class BookingListWithRelations(BaseModel):
     """Schema para resposta de lista de bookings com dados relacionados"""
     items: List[BookingWithRelations]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True} 
\ No newline at end of file
@@ -233,11 +233,13 @@ class FinancialWithRelations(FinancialResponse):
 class FinancialListResponse(BaseModel):
     """Schema para resposta de lista de financials"""
     items: List[FinancialResponse]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
 class FinancialListWithRelations(BaseModel):
     """Schema para resposta de lista de financials com dados relacionados"""
     items: List[FinancialWithRelations]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True} 
\ No newline at end of file
@@ -248,12 +248,14 @@ class InterestWithRelations(InterestResponse):
 class InterestListResponse(BaseModel):
     """Schema para resposta de lista de interesses"""
     items: List[InterestResponse]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
 class InterestListWithRelations(BaseModel):
     """Schema para resposta de lista de interesses com dados relacionados"""
     items: List[InterestWithRelations]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
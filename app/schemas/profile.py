@@ -43,6 +43,7 @@ class ProfileUpdate(BaseModel):
 class ProfileResponse(ProfileBase):
     id: int
     user_id: Optional[int] = None
+    coordinates_source: Optional[str] = Field(None, description="Origem das coordenadas (MANUAL, CIDADE_UF ou VIACEP)")
     created_at: datetime
     updated_at: datetime
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_validator
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 # Schemas relacionados
@@ -115,12 +115,14 @@ class ReviewWithRelations(ReviewResponse):
 class ReviewListResponse(BaseModel):
     """Schema para resposta de lista de reviews"""
     items: List[ReviewResponse]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
 
     model_config = {"from_attributes": True}
 
 class ReviewListWithRelations(BaseModel):
     """Schema para resposta de lista de reviews com dados relacionados"""
     items: List[ReviewWithRelations]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
 
     model_config = {"from_attributes": True}
 
@@ -130,4 +132,12 @@ class ProfileAverageRating(BaseModel):
     average_rating: Optional[float]
     total_reviews: int
 
-    model_config = {"from_attributes": True} 
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+class ProfileRatingSummaryResponse(ProfileAverageRating):
+    """Schema para o resumo das avaliações de um profile, com a distribuição das notas"""
+    distribuicao: Dict[int, int]
+
+class ProfileRatingSummaryList(BaseModel):
+    """Schema para lista de resumos de avaliações"""
+    items: List[ProfileRatingSummaryResponse]
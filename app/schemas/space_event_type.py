@@ -125,12 +125,14 @@ class SpaceEventTypeWithRelations(SpaceEventTypeResponse):
 class SpaceEventTypeListResponse(BaseModel):
     """Schema para resposta de lista de relacionamentos"""
     items: List[SpaceEventTypeResponse]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
 class SpaceEventTypeListWithRelations(BaseModel):
     """Schema para resposta de lista de relacionamentos com dados relacionados"""
     items: List[SpaceEventTypeWithRelations]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
@@ -125,12 +125,14 @@ class SpaceFestivalTypeWithRelations(SpaceFestivalTypeResponse):
 class SpaceFestivalTypeListResponse(BaseModel):
     """Schema para resposta de lista de relacionamentos"""
     items: List[SpaceFestivalTypeResponse]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
 class SpaceFestivalTypeListWithRelations(BaseModel):
     """Schema para resposta de lista de relacionamentos com dados relacionados"""
     items: List[SpaceFestivalTypeWithRelations]
+    next_cursor: Optional[str] = None  # Cursor da próxima página (None na última)
     
     model_config = {"from_attributes": True}
 
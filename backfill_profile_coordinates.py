@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Script para preencher latitude/longitude dos profiles existentes
+
+Resolve em paralelo (cidade/UF na base local e, em último caso, CEP via ViaCEP)
+os profiles sem coordenadas e grava os resultados com UPDATEs em massa.
+
+Uso:
+    python backfill_profile_coordinates.py [--workers 8] [--batch-size 500] [--chunk-size 100]
+"""
+import argparse
+import sys
+from infrastructure.database.database import SessionLocal
+from infrastructure.repositories.profile_repository_impl import ProfileRepositoryImpl
+from infrastructure.repositories.role_repository_impl import RoleRepositoryImpl
+from app.application.services.profile_service import ProfileService
+
+def print_progress(stats):
+    print(
+        f"🔄 {stats['processed']} processados | {stats['resolved']} resolvidos | "
+        f"{stats['failed']} sem coordenadas | {stats['profiles_per_second']:.1f} profiles/s"
+    )
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Preencher coordenadas dos profiles existentes")
+    parser.add_argument("--workers", type=int, default=8, help="Threads usadas na resolução (padrão: 8)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Profiles lidos por lote (padrão: 500)")
+    parser.add_argument("--chunk-size", type=int, default=100, help="Linhas por UPDATE em massa (padrão: 100)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = ProfileService(ProfileRepositoryImpl(db), RoleRepositoryImpl(db))
+        print("📍 Preenchendo coordenadas dos profiles...")
+        stats = service.geocode_missing_coordinates(
+            batch_size=args.batch_size,
+            max_workers=args.workers,
+            chunk_size=args.chunk_size,
+            progress=print_progress
+        )
+    finally:
+        db.close()
+
+    print(f"✅ {stats['resolved']} de {stats['processed']} profiles atualizados em {stats['elapsed_seconds']:.2f}s "
+          f"({stats['profiles_per_second']:.1f} profiles/s)")
+    if stats["failed_ids"]:
+        print(f"⚠️  {stats['failed']} profiles sem coordenadas resolvidas: {stats['failed_ids']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
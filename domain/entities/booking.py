@@ -1,6 +1,20 @@
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, time
+from typing import Optional, Tuple, Union
+
+def combine_date_and_time(data: Union[datetime, date], horario: str) -> datetime:
+    """
+    Combina a data (dia) com um horário "HH:MM" em um único instante
+    
+    Horários inválidos são tratados como 00:00.
+    """
+    try:
+        hours, minutes = map(int, horario.strip().split(':')[:2])
+        horario_time = time(hours, minutes)
+    except (AttributeError, ValueError):
+        horario_time = time(0, 0)
+    dia = data.date() if isinstance(data, datetime) else data
+    return datetime.combine(dia, horario_time)
 
 @dataclass
 class Booking:
@@ -18,6 +32,14 @@ class Booking:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    @property
+    def periodo(self) -> Tuple[datetime, datetime]:
+        """Intervalo (início, fim) do agendamento, combinando datas e horários"""
+        return (
+            combine_date_and_time(self.data_inicio, self.horario_inicio),
+            combine_date_and_time(self.data_fim, self.horario_fim)
+        )
+    
     def __post_init__(self):
         if self.profile_id <= 0:
             raise ValueError("ID do profile deve ser maior que zero")
@@ -1,6 +1,13 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
+class CoordinatesSource(Enum):
+    """Origem (e qualidade) das coordenadas de um profile"""
+    MANUAL = "MANUAL"          # Informadas pelo usuário (ponto exato)
+    CIDADE_UF = "CIDADE_UF"    # Centro do município, pela cidade/UF do profile
+    VIACEP = "VIACEP"          # Centro do município, pela cidade/UF retornada pela ViaCEP para o CEP
+
 class Profile:
     def __init__(
         self,
@@ -20,6 +27,7 @@ class Profile:
         whatsapp: Optional[str] = None,
         latitude: Optional[float] = None,
         longitude: Optional[float] = None,
+        coordinates_source: Optional[str] = None,
         id: Optional[int] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
@@ -41,5 +49,6 @@ class Profile:
         self.whatsapp = whatsapp
         self.latitude = latitude
         self.longitude = longitude
+        self.coordinates_source = coordinates_source
         self.created_at = created_at or datetime.now()
         self.updated_at = updated_at or datetime.now() 
\ No newline at end of file
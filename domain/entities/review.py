@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 class Review:
     """Entidade de domínio para avaliações/reviews"""
@@ -83,4 +83,27 @@ class Review:
     
     def __repr__(self):
         return (f"Review(id={self.id}, profile_id={self.profile_id}, "
-                f"nota={self.nota}, data_hora='{self.data_hora}')") 
\ No newline at end of file
+                f"nota={self.nota}, data_hora='{self.data_hora}')")
+
+class ProfileRatingSummary:
+    """Resumo das avaliações recebidas por um profile (quantidade, soma e histograma das notas)"""
+    
+    def __init__(
+        self,
+        profile_id: int,
+        total_reviews: int = 0,
+        soma_notas: int = 0,
+        distribuicao: Optional[Dict[int, int]] = None
+    ):
+        self.profile_id = profile_id
+        self.total_reviews = total_reviews
+        self.soma_notas = soma_notas
+        self.distribuicao = {nota: 0 for nota in range(1, 6)}
+        self.distribuicao.update(distribuicao or {})
+    
+    @property
+    def average_rating(self) -> Optional[float]:
+        """Média das notas (None se o profile não tiver avaliações)"""
+        if not self.total_reviews:
+            return None
+        return round(self.soma_notas / self.total_reviews, 2)
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 from domain.entities.artist import Artist
+from domain.entities.profile import Profile
+from domain.repositories.pagination import PageRequest
 
 class ArtistRepository(ABC):
     @abstractmethod
@@ -19,15 +21,25 @@ class ArtistRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Artist, 'ArtistModel']]:
+    def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Artist, 'ArtistModel']]:
         """Listar todos os artistas"""
         pass
 
     @abstractmethod
-    def get_by_artist_type(self, artist_type_id: int, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Artist, 'ArtistModel']]:
+    def get_by_artist_type(self, artist_type_id: int, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Artist, 'ArtistModel']]:
         """Listar artistas por tipo"""
         pass
 
+    @abstractmethod
+    def get_max_raio_atuacao(self) -> float:
+        """Obter o maior raio de atuação entre todos os artistas"""
+        pass
+
+    @abstractmethod
+    def get_with_profiles_near(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[Artist, Profile]]:
+        """Obter artistas com seus profiles dentro do bounding box do raio (ou sem coordenadas)"""
+        pass
+
     @abstractmethod
     def update(self, artist: Artist) -> Artist:
         """Atualizar artista"""
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union, Any
+from typing import List, Optional, Union, Any, Dict, Sequence, Tuple, Iterator
 from datetime import datetime
 from domain.entities.booking import Booking
+from domain.repositories.pagination import PageRequest
 
 class BookingRepository(ABC):
     """Interface do repositório para agendamentos/reservas"""
@@ -17,32 +18,32 @@ class BookingRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Booking, Any]]:
+    def get_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
         """Obter todos os agendamentos de um profile"""
         pass
     
     @abstractmethod
-    def get_by_space_id(self, space_id: int, include_relations: bool = False) -> List[Union[Booking, Any]]:
+    def get_by_space_id(self, space_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
         """Obter todos os agendamentos de um espaço"""
         pass
     
     @abstractmethod
-    def get_by_artist_id(self, artist_id: int, include_relations: bool = False) -> List[Union[Booking, Any]]:
+    def get_by_artist_id(self, artist_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
         """Obter todos os agendamentos de um artista"""
         pass
     
     @abstractmethod
-    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False) -> List[Union[Booking, Any]]:
+    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
         """Obter todos os agendamentos de um space-event type"""
         pass
     
     @abstractmethod
-    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False) -> List[Union[Booking, Any]]:
+    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
         """Obter todos os agendamentos de um space-festival type"""
         pass
     
     @abstractmethod
-    def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False) -> List[Union[Booking, Any]]:
+    def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
         """Obter agendamentos em um período"""
         pass
     
@@ -57,11 +58,26 @@ class BookingRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self, include_relations: bool = False) -> List[Union[Booking, Any]]:
+    def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
         """Obter todos os agendamentos"""
         pass
     
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> Iterator[Booking]:
+        """Percorrer todos os agendamentos em lotes, sem carregar a tabela inteira na memória"""
+        pass
+    
     @abstractmethod
     def get_conflicting_bookings(self, artist_id: int, data: datetime, horario: str) -> List[Union[Booking, Any]]:
         """Obter agendamentos conflitantes para um artista em uma data/horário específicos"""
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_conflicting_bookings_bulk(self, artist_ids: Sequence[int], slots: Sequence[Tuple[datetime, datetime]]) -> Dict[int, List[Booking]]:
+        """Obter, em uma única consulta, os agendamentos de vários artistas que se sobrepõem a vários intervalos (início, fim)"""
+        pass
+    
+    @abstractmethod
+    def get_space_conflicting_bookings_bulk(self, space_ids: Sequence[int], slots: Sequence[Tuple[datetime, datetime]]) -> Dict[int, List[Booking]]:
+        """Obter, em uma única consulta, os agendamentos de vários espaços que se sobrepõem a vários intervalos (início, fim)"""
+        pass
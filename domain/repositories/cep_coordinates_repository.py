@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from domain.entities.cep_coordinates import CepCoordinates
 
 class CepCoordinatesRepository(ABC):
@@ -42,5 +42,10 @@ class CepCoordinatesRepository(ABC):
     
     @abstractmethod
     def get_nearby_cities(self, latitude: float, longitude: float, radius_km: float = 50) -> List[CepCoordinates]:
-        """Busca cidades próximas usando fórmula de Haversine"""
+        """Busca cidades próximas usando fórmula de Haversine, ordenadas por distância"""
+        pass
+    
+    @abstractmethod
+    def get_nearby_cities_with_distance(self, latitude: float, longitude: float, radius_km: float = 50) -> List[Tuple[CepCoordinates, float]]:
+        """Busca cidades próximas com a distância em km, ordenadas por distância"""
         pass 
\ No newline at end of file
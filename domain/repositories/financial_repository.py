@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any, Iterator
 from domain.entities.financial import Financial, TipoConta, TipoChavePix, PreferenciaTransferencia
+from domain.repositories.pagination import PageRequest
 
 class FinancialRepository(ABC):
     """Interface do repositório para dados financeiros/bancários"""
@@ -16,22 +17,22 @@ class FinancialRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter todos os registros financeiros de um profile"""
         pass
     
     @abstractmethod
-    def get_by_banco(self, banco: str, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_by_banco(self, banco: str, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter todos os registros financeiros de um banco específico"""
         pass
     
     @abstractmethod
-    def get_by_tipo_conta(self, tipo_conta: TipoConta, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_by_tipo_conta(self, tipo_conta: TipoConta, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter registros financeiros por tipo de conta"""
         pass
     
     @abstractmethod
-    def get_by_tipo_chave_pix(self, tipo_chave_pix: TipoChavePix, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_by_tipo_chave_pix(self, tipo_chave_pix: TipoChavePix, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter registros financeiros por tipo de chave PIX"""
         pass
     
@@ -41,12 +42,12 @@ class FinancialRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_preferencia(self, preferencia: PreferenciaTransferencia, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_by_preferencia(self, preferencia: PreferenciaTransferencia, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter registros financeiros por preferência de transferência"""
         pass
     
     @abstractmethod
-    def get_by_cpf_cnpj(self, cpf_cnpj: str, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_by_cpf_cnpj(self, cpf_cnpj: str, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter registros financeiros por CPF/CNPJ"""
         pass
     
@@ -61,11 +62,36 @@ class FinancialRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self, include_relations: bool = False) -> List[Union[Financial, Any]]:
+    def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, Any]]:
         """Obter todos os registros financeiros"""
         pass
     
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> Iterator[Financial]:
+        """Percorrer todos os registros financeiros em lotes, sem carregar a tabela inteira na memória"""
+        pass
+    
     @abstractmethod
     def check_chave_pix_exists(self, chave_pix: str, exclude_id: Optional[int] = None) -> bool:
         """Verificar se uma chave PIX já existe (para garantir unicidade)"""
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_banks_summary(self) -> Dict[str, int]:
+        """Obter a quantidade de registros por banco"""
+        pass
+    
+    @abstractmethod
+    def get_pix_types_summary(self) -> Dict[str, int]:
+        """Obter a quantidade de registros por tipo de chave PIX"""
+        pass
+    
+    @abstractmethod
+    def get_preferencias_summary(self) -> Dict[str, int]:
+        """Obter a quantidade de registros por preferência de transferência"""
+        pass
+    
+    @abstractmethod
+    def get_tipos_conta_summary(self) -> Dict[str, int]:
+        """Obter a quantidade de registros por tipo de conta"""
+        pass
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union, Any
+from typing import List, Optional, Union, Any, Iterator
 from datetime import datetime, date
 from domain.entities.interest import Interest, StatusInterest
+from domain.repositories.pagination import PageRequest
 
 class InterestRepository(ABC):
     """Interface do repositório para manifestações de interesse"""
@@ -17,37 +18,37 @@ class InterestRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_profile_interessado(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_by_profile_interessado(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter todas as manifestações de interesse feitas por um profile"""
         pass
     
     @abstractmethod
-    def get_by_profile_interesse(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_by_profile_interesse(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter todas as manifestações de interesse recebidas por um profile"""
         pass
     
     @abstractmethod
-    def get_by_status(self, status: StatusInterest, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_by_status(self, status: StatusInterest, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse por status"""
         pass
     
     @abstractmethod
-    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse relacionadas a um space-event type"""
         pass
     
     @abstractmethod
-    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse relacionadas a um space-festival type"""
         pass
     
     @abstractmethod
-    def get_by_date_range(self, data_inicio: date, data_fim: date, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_by_date_range(self, data_inicio: date, data_fim: date, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse em um período"""
         pass
     
     @abstractmethod
-    def get_by_profile_and_status(self, profile_id: int, status: StatusInterest, is_interessado: bool = True, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_by_profile_and_status(self, profile_id: int, status: StatusInterest, is_interessado: bool = True, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse de um profile filtradas por status
         
         Args:
@@ -59,7 +60,7 @@ class InterestRepository(ABC):
         pass
     
     @abstractmethod
-    def get_pending_for_profile(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_pending_for_profile(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter manifestações de interesse pendentes para um profile (recebidas e aguardando confirmação)"""
         pass
     
@@ -79,6 +80,11 @@ class InterestRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self, include_relations: bool = False) -> List[Union[Interest, Any]]:
+    def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
         """Obter todas as manifestações de interesse"""
+        pass
+    
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> Iterator[Interest]:
+        """Percorrer todas as manifestações de interesse em lotes, sem carregar a tabela inteira na memória"""
         pass 
\ No newline at end of file
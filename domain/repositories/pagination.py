@@ -0,0 +1,56 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Gera o cursor opaco que aponta para depois do registro (created_at, id)"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Lê um cursor gerado por `encode_cursor`
+    
+    Raises:
+        ValueError: cursor malformado
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise ValueError("Cursor de paginação inválido") from e
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Pedido de uma página: até `limit` registros depois do `cursor` (ordem por created_at, id)"""
+    limit: int = 50
+    cursor: Optional[str] = None
+    
+    def __post_init__(self):
+        if self.limit <= 0:
+            raise ValueError("Tamanho da página deve ser maior que zero")
+
+@dataclass
+class Page(Generic[T]):
+    """Uma página de registros e o cursor da próxima (None na última página)"""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any], page_request: PageRequest) -> "Page":
+        """
+        Monta a página a partir das linhas lidas pelo repositório
+        
+        O repositório lê `limit + 1` linhas; a linha excedente indica que há próxima página.
+        """
+        items = list(rows[:page_request.limit])
+        next_cursor = None
+        if len(rows) > page_request.limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return cls(items=items, next_cursor=next_cursor)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from domain.entities.profile import Profile
+from domain.repositories.pagination import PageRequest
 
 class ProfileRepository(ABC):
     @abstractmethod
@@ -18,13 +19,33 @@ class ProfileRepository(ABC):
         """Obter profiles por role_id"""
         pass
     
+    @abstractmethod
+    def get_by_role_id_within_radius(self, role_id: int, latitude: float, longitude: float, radius_km: float) -> List[Profile]:
+        """Obter profiles de um role com coordenadas dentro de um raio, ordenados por distância"""
+        pass
+    
+    @abstractmethod
+    def get_by_role_id_without_coordinates(self, role_id: int) -> List[Profile]:
+        """Obter profiles de um role sem latitude/longitude cadastradas"""
+        pass
+    
+    @abstractmethod
+    def get_without_coordinates(self, limit: int = 100, after_id: int = 0) -> List[Profile]:
+        """Obter profiles sem latitude/longitude, em ordem de ID, a partir de after_id"""
+        pass
+    
+    @abstractmethod
+    def bulk_update_coordinates(self, updates: List[Tuple[int, float, float, str]]) -> int:
+        """Gravar em massa as coordenadas resolvidas: (profile_id, latitude, longitude, origem)"""
+        pass
+    
     @abstractmethod
     def get_by_user_id(self, user_id: int) -> Optional[Profile]:
         """Obter profile por user_id"""
         pass
     
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Profile]:
+    def get_all(self, skip: int = 0, limit: int = 100, page: Optional[PageRequest] = None) -> List[Profile]:
         """Listar todos os profiles com paginação"""
         pass
     
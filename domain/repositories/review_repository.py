@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union, Any
+from typing import Dict, List, Optional, Sequence, Union, Any, Iterator
 from datetime import datetime
-from domain.entities.review import Review
+from domain.entities.review import Review, ProfileRatingSummary
+from domain.repositories.pagination import PageRequest
 
 class ReviewRepository(ABC):
     """Interface do repositório para avaliações/reviews"""
@@ -17,27 +18,27 @@ class ReviewRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações de um profile"""
         pass
     
     @abstractmethod
-    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações de um space-event type"""
         pass
     
     @abstractmethod
-    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações de um space-festival type"""
         pass
     
     @abstractmethod
-    def get_by_nota(self, nota: int, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_by_nota(self, nota: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações com uma nota específica"""
         pass
     
     @abstractmethod
-    def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter avaliações em um período"""
         pass
     
@@ -52,11 +53,26 @@ class ReviewRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self, include_relations: bool = False) -> List[Union[Review, Any]]:
+    def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
         """Obter todas as avaliações"""
         pass
     
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> Iterator[Review]:
+        """Percorrer todas as avaliações em lotes, sem carregar a tabela inteira na memória"""
+        pass
+    
     @abstractmethod
     def get_average_rating_by_profile(self, profile_id: int) -> Optional[float]:
         """Obter a média de avaliações de um profile"""
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_rating_summary(self, profile_id: int) -> ProfileRatingSummary:
+        """Obter o resumo (quantidade, média e distribuição) das avaliações de um profile"""
+        pass
+    
+    @abstractmethod
+    def get_rating_summaries(self, profile_ids: Sequence[int]) -> Dict[int, ProfileRatingSummary]:
+        """Obter o resumo das avaliações de vários profiles"""
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.entities.space_event_type import SpaceEventType, StatusEventType
+from domain.repositories.pagination import PageRequest
 
 class SpaceEventTypeRepository(ABC):
     """Interface do repositório para o relacionamento N:N entre Spaces e Event Types"""
@@ -16,17 +17,17 @@ class SpaceEventTypeRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_space_id(self, space_id: int) -> List[SpaceEventType]:
+    def get_by_space_id(self, space_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os tipos de eventos de um espaço"""
         pass
     
     @abstractmethod
-    def get_by_event_type_id(self, event_type_id: int) -> List[SpaceEventType]:
+    def get_by_event_type_id(self, event_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os espaços de um tipo de evento"""
         pass
     
     @abstractmethod
-    def get_by_space_and_event_type(self, space_id: int, event_type_id: int) -> List[SpaceEventType]:
+    def get_by_space_and_event_type(self, space_id: int, event_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter relacionamentos específicos entre espaço e tipo de evento"""
         pass
     
@@ -56,7 +57,7 @@ class SpaceEventTypeRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self) -> List[SpaceEventType]:
+    def get_all(self, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os relacionamentos"""
         pass
     
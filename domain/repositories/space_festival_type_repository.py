@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.entities.space_festival_type import SpaceFestivalType, StatusFestivalType
+from domain.repositories.pagination import PageRequest
 
 class SpaceFestivalTypeRepository(ABC):
     """Interface do repositório para o relacionamento N:N entre Spaces e Festival Types"""
@@ -16,17 +17,17 @@ class SpaceFestivalTypeRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_space_id(self, space_id: int) -> List[SpaceFestivalType]:
+    def get_by_space_id(self, space_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os tipos de festivais de um espaço"""
         pass
     
     @abstractmethod
-    def get_by_festival_type_id(self, festival_type_id: int) -> List[SpaceFestivalType]:
+    def get_by_festival_type_id(self, festival_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os espaços de um tipo de festival"""
         pass
     
     @abstractmethod
-    def get_by_space_and_festival_type(self, space_id: int, festival_type_id: int) -> List[SpaceFestivalType]:
+    def get_by_space_and_festival_type(self, space_id: int, festival_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter relacionamentos específicos entre espaço e tipo de festival"""
         pass
     
@@ -56,7 +57,7 @@ class SpaceFestivalTypeRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self) -> List[SpaceFestivalType]:
+    def get_all(self, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os relacionamentos"""
         pass
     
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Union, TYPE_CHECKING
 from domain.entities.space import Space
+from domain.repositories.pagination import PageRequest
 
 if TYPE_CHECKING:
     from infrastructure.database.models.space_model import SpaceModel
@@ -31,7 +32,11 @@ class SpaceRepository(ABC):
         pass
 
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Space, "SpaceModel"]]:
+    def get_contracting_by_profile_ids(self, profile_ids: List[int]) -> List[Space]:
+        pass
+
+    @abstractmethod
+    def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Space, "SpaceModel"]]:
         pass
 
     @abstractmethod
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.entities.user import User
+from domain.repositories.pagination import PageRequest
 
 class UserRepository(ABC):
     """Interface do repositório de usuários"""
@@ -21,7 +22,7 @@ class UserRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+    def get_all(self, skip: int = 0, limit: int = 100, page: Optional[PageRequest] = None) -> List[User]:
         """Listar todos os usuários com paginação"""
         pass
     
@@ -30,6 +31,11 @@ class UserRepository(ABC):
         """Atualizar usuário"""
         pass
     
+    @abstractmethod
+    def update_password(self, user_id: int, password: str, current_password: str) -> bool:
+        """Trocar o hash da senha, se o atual ainda for `current_password`"""
+        pass
+    
     @abstractmethod
     def delete(self, user_id: int) -> bool:
         """Deletar usuário por ID"""
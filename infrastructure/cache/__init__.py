@@ -0,0 +1,4 @@
+# Módulo de caches em memória
+from .ttl_cache import TTLCache
+from .principal_cache import cache_principal, get_cached_principal, invalidate_principal
+from .token_revocation_store import TokenRevocationStore, InMemoryTokenRevocationStore, DatabaseTokenRevocationStore
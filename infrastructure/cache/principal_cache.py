@@ -0,0 +1,21 @@
+from typing import Any, Optional
+from infrastructure.cache.ttl_cache import TTLCache
+
+# Usuário autenticado (principal) por id, consultado a cada requisição autenticada.
+# O TTL é informado em cada `set` (AUTH_PRINCIPAL_CACHE_TTL_SECONDS); a invalidação
+# explícita vale só para o processo atual, então o TTL limita por quanto tempo os
+# demais workers ainda enxergam um usuário alterado ou desativado
+principal_cache = TTLCache(maxsize=10000)
+
+def get_cached_principal(user_id: int) -> Optional[Any]:
+    """Obter o principal em cache do usuário (None se ausente/expirado)"""
+    return principal_cache.get(user_id)
+
+def cache_principal(user_id: int, principal: Any, ttl_seconds: float) -> None:
+    """Armazenar o principal do usuário (ttl_seconds <= 0 não armazena)"""
+    if ttl_seconds > 0:
+        principal_cache.set(user_id, principal, ttl_seconds=ttl_seconds)
+
+def invalidate_principal(user_id: int) -> bool:
+    """Remover o principal do usuário do cache (após alteração ou exclusão)"""
+    return principal_cache.invalidate(user_id)
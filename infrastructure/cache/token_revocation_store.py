@@ -0,0 +1,151 @@
+import heapq
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+from sqlalchemy.orm import Session
+from infrastructure.database.models.revoked_token_model import RevokedTokenModel
+
+logger = logging.getLogger(__name__)
+
+class TokenRevocationStore(ABC):
+    """
+    Tokens JWT revogados, identificados pelo claim jti
+
+    Cada revogação vale até o exp do token; depois disso o próprio token já é
+    recusado na validação e o registro é descartado.
+    """
+
+    @abstractmethod
+    def revoke(self, jti: str, expires_at: float) -> None:
+        """Revogar o token `jti` até `expires_at` (timestamp Unix, claim exp)"""
+        pass
+
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool:
+        """Verificar se o token foi revogado"""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Remover as revogações de tokens já expirados"""
+        pass
+
+class InMemoryTokenRevocationStore(TokenRevocationStore):
+    """
+    Revogações em memória, restritas ao processo atual
+
+    A consulta é um acesso a dicionário (O(1)); um heap ordenado por exp remove as
+    revogações vencidas a cada nova revogação, então a memória fica limitada aos
+    tokens revogados ainda válidos.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._expires_at: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._evict(now)
+            if expires_at <= now or self._expires_at.get(jti, 0) >= expires_at:
+                return
+            self._expires_at[jti] = expires_at
+            heapq.heappush(self._heap, (expires_at, jti))
+
+    def is_revoked(self, jti: str) -> bool:
+        expires_at = self._expires_at.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            return self._evict(time.time())
+
+    def _evict(self, now: float) -> int:
+        evicted = 0
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._heap)
+            if self._expires_at.get(jti) == expires_at:
+                del self._expires_at[jti]
+                evicted += 1
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+class DatabaseTokenRevocationStore(TokenRevocationStore):
+    """
+    Revogações persistidas na tabela revoked_tokens, compartilhadas entre processos
+
+    As consultas são atendidas por uma cópia em memória (InMemoryTokenRevocationStore),
+    sincronizada com a tabela no máximo a cada `sync_interval_seconds`: uma revogação
+    feita em outro processo passa a valer aqui em até esse intervalo (0 = sincronizar a
+    cada consulta). Cada operação usa uma sessão própria.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], sync_interval_seconds: float = 5):
+        self.session_factory = session_factory
+        self.sync_interval_seconds = sync_interval_seconds
+        self._local = InMemoryTokenRevocationStore()
+        self._sync_lock = threading.Lock()
+        self._synced_at = float("-inf")
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        self._local.revoke(jti, expires_at)
+        db = self.session_factory()
+        try:
+            db.merge(RevokedTokenModel(jti=jti, expires_at=datetime.fromtimestamp(expires_at, timezone.utc)))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        # Revogações são raras (logout): a limpeza da tabela acompanha cada uma
+        self.purge_expired()
+
+    def is_revoked(self, jti: str) -> bool:
+        if time.monotonic() - self._synced_at >= self.sync_interval_seconds:
+            self.sync()
+        return self._local.is_revoked(jti)
+
+    def sync(self) -> None:
+        """Trazer para a memória as revogações ainda válidas da tabela"""
+        # Uma thread sincroniza por vez; as demais seguem com a cópia atual
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        db = self.session_factory()
+        try:
+            rows = db.query(RevokedTokenModel.jti, RevokedTokenModel.expires_at).filter(
+                RevokedTokenModel.expires_at > datetime.now(timezone.utc)
+            ).all()
+            for jti, expires_at in rows:
+                if expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=timezone.utc)
+                self._local.revoke(jti, expires_at.timestamp())
+        except Exception as e:
+            logger.warning(f"Erro ao sincronizar tokens revogados: {str(e)}")
+        finally:
+            # Também após erro: com o banco fora do ar a próxima tentativa espera o
+            # intervalo, em vez de cada consulta repetir a query
+            self._synced_at = time.monotonic()
+            db.close()
+            self._sync_lock.release()
+
+    def purge_expired(self) -> int:
+        purged = self._local.purge_expired()
+        db = self.session_factory()
+        try:
+            db.query(RevokedTokenModel).filter(
+                RevokedTokenModel.expires_at <= datetime.now(timezone.utc)
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Erro ao remover tokens revogados expirados: {str(e)}")
+        finally:
+            db.close()
+        return purged
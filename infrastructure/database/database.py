@@ -1,36 +1,32 @@
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from typing import Any, Dict, Optional
 import os
 from dotenv import load_dotenv
+from infrastructure.database.engine import EngineSettings, create_async_database_engine, create_database_engine, get_pool_status
 
 load_dotenv()
 
 # Configuração do banco de dados
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./eshow.db")
+# SQLite em desenvolvimento; PostgreSQL em produção. Pool e PRAGMAs: variáveis DB_*
+ENGINE_SETTINGS = EngineSettings.from_env()
 
-# Para SQLite (desenvolvimento)
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        pool_size=20,
-        max_overflow=30,
-        pool_timeout=60,
-        pool_recycle=3600
-    )
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_database_engine(DATABASE_URL, ENGINE_SETTINGS)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Engine somente leitura (GETs de busca, avaliações e manifestações de interesse).
+# Usa DATABASE_READ_URL (ex.: réplica) se definida; no SQLite é um pool próprio sobre
+# o mesmo arquivo, que com WAL (DB_SQLITE_PROFILE=production) lê em paralelo com as
+# escritas. Em outros bancos sem DATABASE_READ_URL reaproveita o engine principal.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", "").strip() or None
+
+if DATABASE_READ_URL or DATABASE_URL.startswith("sqlite"):
+    read_engine = create_database_engine(DATABASE_READ_URL or DATABASE_URL, ENGINE_SETTINGS, read_only=True)
 else:
-    # Para PostgreSQL (produção)
-    engine = create_engine(
-        DATABASE_URL,
-        pool_size=20,
-        max_overflow=30,
-        pool_timeout=60,
-        pool_recycle=3600
-    )
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    read_engine = engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 Base = declarative_base()
 
@@ -43,4 +39,64 @@ def get_database_session():
         db.rollback()
         raise
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+def get_read_database_session():
+    """Obter sessão somente leitura do banco de dados (endpoints que apenas consultam)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def get_async_database_url(database_url: str = DATABASE_URL) -> str:
+    """URL do driver assíncrono correspondente (aiosqlite/asyncpg), salvo se ASYNC_DATABASE_URL for definida"""
+    async_url = os.getenv("ASYNC_DATABASE_URL")
+    if async_url:
+        return async_url
+    scheme, _, rest = database_url.partition("://")
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    if scheme.startswith("postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    return database_url
+
+# Engine assíncrono: criado sob demanda, para que processos que só usam o acesso
+# síncrono (scripts, migrações) não dependam do driver assíncrono
+_async_engine: Optional[AsyncEngine] = None
+_async_session_local: Optional[async_sessionmaker] = None
+
+def get_async_engine() -> AsyncEngine:
+    """Obter o engine assíncrono (criado no primeiro uso)"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_database_engine(get_async_database_url(), ENGINE_SETTINGS)
+    return _async_engine
+
+def get_async_session_local() -> async_sessionmaker:
+    """Obter a fábrica de sessões assíncronas"""
+    global _async_session_local
+    if _async_session_local is None:
+        _async_session_local = async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_session_local
+
+async def get_async_database_session():
+    """Obter sessão assíncrona do banco de dados (endpoints async def)"""
+    async with get_async_session_local()() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Métricas dos pools de conexões (o assíncrono só aparece depois de criado)"""
+    metrics = {"sync": get_pool_status(engine)}
+    if read_engine is not engine:
+        metrics["read"] = get_pool_status(read_engine)
+    if _async_engine is not None:
+        metrics["async"] = get_pool_status(_async_engine.sync_engine)
+    return metrics
@@ -0,0 +1,228 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+def _env_optional(name: str) -> Optional[str]:
+    value = os.getenv(name, "").strip()
+    return value or None
+
+# Perfis de ajuste do SQLite; valores DB_SQLITE_* definidos explicitamente têm precedência
+SQLITE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    # Nó único em produção: WAL (leitores não bloqueiam o escritor e vice-versa),
+    # fsync apenas nos checkpoints, 256 MB de mmap, 64 MB de cache por conexão e
+    # espera de até 5 s pelo lock de escrita em vez de falhar com "database is locked"
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,
+        "cache_size": -65536,
+        "busy_timeout": 5000,
+    },
+}
+
+@dataclass(frozen=True)
+class EngineSettings:
+    """
+    Configuração do engine e do pool de conexões
+
+    Lida das variáveis de ambiente DB_* (ver env.example). Os PRAGMAs do SQLite vêm
+    do perfil (DB_SQLITE_PROFILE) e dos valores definidos; o statement timeout só
+    vale para PostgreSQL.
+    """
+    pool_size: int = 20
+    max_overflow: int = 30
+    pool_timeout: float = 60
+    pool_recycle: int = 3600
+    pool_pre_ping: bool = False
+    statement_timeout_ms: int = 0
+    sqlite_journal_mode: Optional[str] = None
+    sqlite_synchronous: Optional[str] = None
+    sqlite_mmap_size: Optional[int] = None
+    sqlite_cache_size: Optional[int] = None
+    sqlite_busy_timeout_ms: Optional[int] = None
+    sqlite_profile: str = "default"
+
+    def __post_init__(self):
+        if self.sqlite_profile not in SQLITE_PROFILES:
+            raise ValueError(f"Perfil do SQLite desconhecido: {self.sqlite_profile} (opções: {', '.join(SQLITE_PROFILES)})")
+
+    @classmethod
+    def from_env(cls) -> "EngineSettings":
+        mmap_size = _env_optional("DB_SQLITE_MMAP_SIZE")
+        cache_size = _env_optional("DB_SQLITE_CACHE_SIZE")
+        busy_timeout = _env_optional("DB_SQLITE_BUSY_TIMEOUT_MS")
+        return cls(
+            pool_size=_env_int("DB_POOL_SIZE", cls.pool_size),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", cls.max_overflow),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", str(cls.pool_timeout))),
+            pool_recycle=_env_int("DB_POOL_RECYCLE", cls.pool_recycle),
+            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "False").lower() == "true",
+            statement_timeout_ms=_env_int("DB_STATEMENT_TIMEOUT_MS", cls.statement_timeout_ms),
+            sqlite_journal_mode=_env_optional("DB_SQLITE_JOURNAL_MODE"),
+            sqlite_synchronous=_env_optional("DB_SQLITE_SYNCHRONOUS"),
+            sqlite_mmap_size=int(mmap_size) if mmap_size else None,
+            sqlite_cache_size=int(cache_size) if cache_size else None,
+            sqlite_busy_timeout_ms=int(busy_timeout) if busy_timeout else None,
+            sqlite_profile=os.getenv("DB_SQLITE_PROFILE", "default").strip().lower() or "default"
+        )
+
+    def sqlite_pragmas(self, read_only: bool = False) -> Dict[str, Any]:
+        """
+        PRAGMAs a executar em cada nova conexão SQLite
+
+        Em conexões somente leitura o journal_mode (persistente, definido pelo
+        escritor) não é alterado e `query_only` impede escritas.
+        """
+        explicit = {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "mmap_size": self.sqlite_mmap_size,
+            "cache_size": self.sqlite_cache_size,
+            "busy_timeout": self.sqlite_busy_timeout_ms,
+        }
+        pragmas = dict(SQLITE_PROFILES[self.sqlite_profile])
+        pragmas.update({name: value for name, value in explicit.items() if value is not None})
+        if read_only:
+            pragmas.pop("journal_mode", None)
+            pragmas["query_only"] = "ON"
+        return pragmas
+
+class PoolMetrics:
+    """Contadores de uso de um pool de conexões (checkouts, espera e timeouts)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_seconds = 0.0
+        self.wait_max_seconds = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_seconds += wait_seconds
+            self.wait_max_seconds = max(self.wait_max_seconds, wait_seconds)
+
+    def record_timeout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_max_seconds = max(self.wait_max_seconds, wait_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total_seconds * 1000, 3),
+                "wait_avg_ms": round(self.wait_total_seconds * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max_seconds * 1000, 3),
+            }
+
+class _InstrumentedPoolMixin:
+    """Mede o tempo de obtenção de cada conexão (inclusive a espera por uma livre)"""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+        self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # dispose() recria o pool; as métricas continuam as mesmas
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def _engine_options(url: str, settings: EngineSettings, poolclass, read_only: bool = False) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "poolclass": poolclass,
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_timeout": settings.pool_timeout,
+        "pool_recycle": settings.pool_recycle,
+        "pool_pre_ping": settings.pool_pre_ping,
+    }
+    if url.startswith("sqlite") and "aiosqlite" not in url:
+        options["connect_args"] = {"check_same_thread": False}
+    elif url.startswith("postgresql"):
+        server_settings = {}
+        if settings.statement_timeout_ms > 0:
+            server_settings["statement_timeout"] = str(settings.statement_timeout_ms)
+        if read_only:
+            server_settings["default_transaction_read_only"] = "on"
+        if server_settings and "asyncpg" in url:
+            options["connect_args"] = {"server_settings": server_settings}
+        elif server_settings:
+            options["connect_args"] = {"options": " ".join(f"-c {name}={value}" for name, value in server_settings.items())}
+    return options
+
+def _instrument(engine: Engine, settings: EngineSettings, read_only: bool = False) -> None:
+    engine.pool.metrics = PoolMetrics()
+    pragmas = settings.sqlite_pragmas(read_only=read_only)
+    if engine.dialect.name == "sqlite" and pragmas:
+        @event.listens_for(engine, "connect")
+        def apply_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+def create_database_engine(url: str, settings: Optional[EngineSettings] = None, read_only: bool = False) -> Engine:
+    """
+    Criar o engine síncrono com pool instrumentado e PRAGMAs do SQLite
+
+    Com `read_only=True` as conexões recusam escritas (SQLite: PRAGMA query_only;
+    PostgreSQL: default_transaction_read_only).
+    """
+    settings = settings or EngineSettings.from_env()
+    engine = create_engine(url, **_engine_options(url, settings, InstrumentedQueuePool, read_only))
+    _instrument(engine, settings, read_only)
+    return engine
+
+def create_async_database_engine(url: str, settings: Optional[EngineSettings] = None) -> AsyncEngine:
+    """Criar o engine assíncrono com a mesma configuração do síncrono"""
+    settings = settings or EngineSettings.from_env()
+    engine = create_async_engine(url, **_engine_options(url, settings, InstrumentedAsyncAdaptedQueuePool))
+    _instrument(engine.sync_engine, settings)
+    return engine
+
+def get_pool_status(engine: Engine) -> Dict[str, Any]:
+    """Estado atual do pool (conexões em uso, ociosas e excedentes) e métricas acumuladas"""
+    pool = engine.pool
+    status: Dict[str, Any] = {"backend": engine.dialect.name, "pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -16,4 +16,7 @@ from .booking_model import BookingModel
 from .review_model import ReviewModel
 from .financial_model import FinancialModel
 from .interest_model import InterestModel
-from .cep_coordinates_model import CepCoordinatesModel 
\ No newline at end of file
+from .cep_coordinates_model import CepCoordinatesModel
+from .cep_lookup_model import CepLookupModel
+from .profile_rating_summary_model import ProfileRatingSummaryModel
+from .revoked_token_model import RevokedTokenModel
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from infrastructure.database.database import Base
+from domain.entities.booking import combine_date_and_time
 
 class BookingModel(Base):
     """Modelo para representar agendamentos/reservas"""
@@ -17,6 +18,9 @@ class BookingModel(Base):
     artist_id = Column(Integer, ForeignKey("artists.id"), nullable=True)  # Para agendamento de espaço
     space_event_type_id = Column(Integer, ForeignKey("space_event_types.id"), nullable=True)  # Para eventos
     space_festival_type_id = Column(Integer, ForeignKey("space_festival_types.id"), nullable=True)  # Para festivais
+    # Intervalo normalizado (data + horário) usado nas verificações de conflito
+    periodo_inicio = Column(DateTime, nullable=True)
+    periodo_fim = Column(DateTime, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -27,5 +31,18 @@ class BookingModel(Base):
     space_event_type = relationship("SpaceEventTypeModel", foreign_keys=[space_event_type_id])
     space_festival_type = relationship("SpaceFestivalTypeModel", foreign_keys=[space_festival_type_id])
 
+    # Índices para consultas de sobreposição de intervalos por artista e por espaço
+    __table_args__ = (
+        Index('idx_bookings_artist_periodo', 'artist_id', 'periodo_inicio', 'periodo_fim'),
+        Index('idx_bookings_space_periodo', 'space_id', 'periodo_inicio', 'periodo_fim'),
+    )
+
     def __repr__(self):
-        return f"<BookingModel(id={self.id}, profile_id={self.profile_id}, data_inicio='{self.data_inicio}', data_fim='{self.data_fim}')>" 
\ No newline at end of file
+        return f"<BookingModel(id={self.id}, profile_id={self.profile_id}, data_inicio='{self.data_inicio}', data_fim='{self.data_fim}')>"
+
+@event.listens_for(BookingModel, "before_insert")
+@event.listens_for(BookingModel, "before_update")
+def set_booking_periodo(mapper, connection, target: BookingModel) -> None:
+    """Derivar o intervalo (periodo_inicio, periodo_fim) das datas e horários a cada escrita pelo ORM"""
+    target.periodo_inicio = combine_date_and_time(target.data_inicio, target.horario_inicio)
+    target.periodo_fim = combine_date_and_time(target.data_fim, target.horario_fim)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy.sql import func
+from infrastructure.database.database import Base
+
+class CepLookupModel(Base):
+    """Modelo para o cache persistente de consultas de CEP (ViaCEP)"""
+    
+    __tablename__ = "cep_lookups"
+    
+    # CEP limpo (apenas os 8 dígitos)
+    cep = Column(String(8), primary_key=True)
+    
+    # False = CEP inexistente (cache negativo)
+    found = Column(Boolean, nullable=False)
+    cidade = Column(String(100), nullable=True)
+    uf = Column(String(2), nullable=True)
+    
+    # Momento da consulta, usado para expirar o registro
+    fetched_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
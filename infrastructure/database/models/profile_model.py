@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from infrastructure.database.database import Base
@@ -23,6 +23,8 @@ class ProfileModel(Base):
     whatsapp = Column(String(20), nullable=True)
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
+    # Origem das coordenadas (CoordinatesSource); NULL enquanto não resolvidas
+    coordinates_source = Column(String(20), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -30,6 +32,11 @@ class ProfileModel(Base):
     artist = relationship("ArtistModel", back_populates="profile", uselist=False)
     spaces = relationship("SpaceModel", back_populates="profile")
 
+    # Índice para o pré-filtro por bounding box nas buscas por localização
+    __table_args__ = (
+        Index('idx_profiles_role_lat_lng', 'role_id', 'latitude', 'longitude'),
+    )
+
 # Importação tardia para evitar importação circular
 from infrastructure.database.models.user_model import UserModel
 ProfileModel.user = relationship("UserModel") 
\ No newline at end of file
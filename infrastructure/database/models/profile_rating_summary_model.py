@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from infrastructure.database.database import Base
+
+class ProfileRatingSummaryModel(Base):
+    """Modelo para o resumo das avaliações recebidas por um profile (mantido a cada escrita em reviews)"""
+    
+    __tablename__ = "profile_rating_summaries"
+    
+    profile_id = Column(Integer, ForeignKey("profiles.id"), primary_key=True)
+    total_reviews = Column(Integer, nullable=False, default=0)
+    soma_notas = Column(Integer, nullable=False, default=0)
+    
+    # Histograma das notas (1 a 5)
+    nota_1 = Column(Integer, nullable=False, default=0)
+    nota_2 = Column(Integer, nullable=False, default=0)
+    nota_3 = Column(Integer, nullable=False, default=0)
+    nota_4 = Column(Integer, nullable=False, default=0)
+    nota_5 = Column(Integer, nullable=False, default=0)
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ProfileRatingSummaryModel(profile_id={self.profile_id}, total_reviews={self.total_reviews}, soma_notas={self.soma_notas})>"
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from infrastructure.database.database import Base
+
+class RevokedTokenModel(Base):
+    """Modelo para os tokens JWT revogados (logout), compartilhados entre processos"""
+    
+    __tablename__ = "revoked_tokens"
+    
+    # Claim jti do token
+    jti = Column(String(64), primary_key=True)
+    
+    # Claim exp do token: depois disso o registro pode ser removido
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
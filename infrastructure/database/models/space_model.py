@@ -25,6 +25,8 @@ class SpaceModel(Base):
     tiktok = Column(String, nullable=True)
     youtube = Column(String, nullable=True)
     facebook = Column(String, nullable=True)
+    # Quantidade de eventos/festivais com status CONTRATANDO (mantida pelos repositórios)
+    contracting_events_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
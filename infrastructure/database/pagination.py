@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Any, Iterator, List, Optional
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Query
+from domain.repositories.pagination import PageRequest, decode_cursor
+
+def paginate(query: Query, model: Any, page: Optional[PageRequest] = None) -> List[Any]:
+    """
+    Executa a query com paginação por chave (keyset), ordenada por (created_at, id)
+    
+    Lê `page.limit + 1` linhas a partir do cursor (a excedente sinaliza a próxima página;
+    ver `Page.from_rows`). O custo não cresce com a profundidade, ao contrário de OFFSET.
+    Sem `page`, retorna todas as linhas com a ordem original da query.
+    """
+    if page is None:
+        return query.all()
+    
+    sort_key = model.created_at
+    sqlite = query.session.get_bind().dialect.name == "sqlite"
+    if sqlite:
+        # No SQLite as datas são texto, com ou sem frações de segundo conforme a origem
+        # (CURRENT_TIMESTAMP ou ORM); normalizar para comparar e ordenar de forma consistente
+        sort_key = func.strftime("%Y-%m-%d %H:%M:%f", model.created_at)
+    
+    query = query.order_by(None).order_by(sort_key, model.id)
+    if page.cursor:
+        cursor_created_at, cursor_id = decode_cursor(page.cursor)
+        value = _sqlite_sort_value(cursor_created_at) if sqlite else cursor_created_at
+        query = query.filter(or_(
+            sort_key > value,
+            and_(sort_key == value, model.id > cursor_id)
+        ))
+    
+    return query.limit(page.limit + 1).all()
+
+def _sqlite_sort_value(value: datetime) -> str:
+    """Mesmo formato de strftime('%Y-%m-%d %H:%M:%f') (milissegundos)"""
+    return value.strftime("%Y-%m-%d %H:%M:%S.") + f"{value.microsecond // 1000:03d}"
+
+def stream(query: Query, model: Any, batch_size: int = 500) -> Iterator[Any]:
+    """
+    Percorre todas as linhas da query, ordenadas por id, em lotes de `batch_size`
+    
+    Usa `yield_per` (cursor do lado do servidor quando o driver oferece), de modo que
+    apenas um lote fica em memória por vez, independentemente do tamanho da tabela.
+    """
+    return iter(query.order_by(None).order_by(model.id).yield_per(batch_size))
@@ -0,0 +1,4 @@
+# Módulo de clientes de serviços externos
+from .circuit_breaker import CircuitBreaker
+from .cep_lookup_store import CepLookupStore
+from .viacep_client import ViaCepClient
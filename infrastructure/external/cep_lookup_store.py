@@ -0,0 +1,72 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional, Tuple
+from sqlalchemy.orm import Session
+from infrastructure.database.models.cep_lookup_model import CepLookupModel
+
+logger = logging.getLogger(__name__)
+
+class CepLookupStore:
+    """
+    Cache persistente (tabela cep_lookups) dos resultados de consulta de CEP
+
+    Guarda tanto CEPs encontrados quanto inexistentes (cache negativo), cada
+    um com seu prazo de validade. Cada operação usa uma sessão própria.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        positive_ttl_seconds: float = 30 * 24 * 3600,
+        negative_ttl_seconds: float = 24 * 3600
+    ):
+        self.session_factory = session_factory
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def get(self, cep: str) -> Optional[Tuple[bool, Optional[Dict[str, str]]]]:
+        """
+        Obtém o resultado armazenado de um CEP limpo
+
+        Returns:
+            None se ausente/expirado; senão (encontrado, {"cep", "cidade", "uf"} ou None)
+        """
+        db = self.session_factory()
+        try:
+            model = db.query(CepLookupModel).filter(CepLookupModel.cep == cep).first()
+            if not model:
+                return None
+
+            fetched_at = model.fetched_at
+            if fetched_at.tzinfo is None:
+                fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+            ttl = self.positive_ttl_seconds if model.found else self.negative_ttl_seconds
+            if datetime.now(timezone.utc) - fetched_at > timedelta(seconds=ttl):
+                return None
+
+            if not model.found:
+                return (False, None)
+            return (True, {"cep": model.cep, "cidade": model.cidade, "uf": model.uf})
+        except Exception as e:
+            logger.warning(f"Erro ao ler cache persistente do CEP {cep}: {str(e)}")
+            return None
+        finally:
+            db.close()
+
+    def set(self, cep: str, result: Optional[Dict[str, str]]) -> None:
+        """Armazena o resultado de um CEP (None = CEP inexistente)"""
+        db = self.session_factory()
+        try:
+            db.merge(CepLookupModel(
+                cep=cep,
+                found=result is not None,
+                cidade=result["cidade"] if result else None,
+                uf=result["uf"] if result else None,
+                fetched_at=datetime.now(timezone.utc)
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Erro ao gravar cache persistente do CEP {cep}: {str(e)}")
+        finally:
+            db.close()
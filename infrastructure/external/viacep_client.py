@@ -0,0 +1,276 @@
+import asyncio
+import logging
+import re
+import threading
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple
+import httpx
+from anyio import to_thread
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.external.cep_lookup_store import CepLookupStore
+from infrastructure.external.circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+# Marca um CEP inexistente no cache em memória
+_NOT_FOUND = object()
+
+class ViaCepClient:
+    """
+    Cliente da API ViaCEP (CEP -> cidade/UF)
+
+    - Pool de conexões compartilhado (httpx), com variante síncrona e assíncrona;
+    - cache em memória e, opcionalmente, persistente (CepLookupStore), guardando
+      também CEPs inexistentes (cache negativo);
+    - consultas simultâneas ao mesmo CEP são agrupadas em uma única requisição;
+    - disjuntor: após falhas seguidas, as consultas deixam de ir à rede por um tempo.
+
+    Falhas de rede ou de servidor não são armazenadas em cache.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://viacep.com.br/ws",
+        timeout_seconds: float = 5.0,
+        max_connections: int = 10,
+        cache_maxsize: int = 10000,
+        positive_ttl_seconds: float = 30 * 24 * 3600,
+        negative_ttl_seconds: float = 24 * 3600,
+        store: Optional[CepLookupStore] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.store = store
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._cache = TTLCache(maxsize=cache_maxsize, ttl_seconds=positive_ttl_seconds)
+
+        self._lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Consultas em andamento: CEP -> Future (threads) / (loop, CEP) -> Future (asyncio)
+        self._inflight: Dict[str, Future] = {}
+        self._async_inflight: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+        self._requests = 0
+
+    @staticmethod
+    def clean_cep(cep: Optional[str]) -> Optional[str]:
+        """Mantém apenas os dígitos do CEP; retorna None se não tiver 8 dígitos"""
+        if not cep:
+            return None
+        cep_clean = re.sub(r"\D", "", cep)
+        return cep_clean if len(cep_clean) == 8 else None
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections
+        )
+
+    def _get_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(timeout=self.timeout_seconds, limits=self._limits())
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        # O cliente assíncrono fica preso ao loop em que foi criado
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout_seconds, limits=self._limits())
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _url(self, cep_clean: str) -> str:
+        return f"{self.base_url}/{cep_clean}/json/"
+
+    def _from_cache(self, cep_clean: str) -> Tuple[bool, Optional[Dict[str, str]]]:
+        """Retorna (encontrado_no_cache, resultado)"""
+        cached = self._cache.get(cep_clean)
+        if cached is _NOT_FOUND:
+            return True, None
+        if cached is not None:
+            return True, cached
+        return False, None
+
+    def _from_store(self, cep_clean: str) -> Tuple[bool, Optional[Dict[str, str]]]:
+        stored = self.store.get(cep_clean) if self.store else None
+        if stored is None:
+            return False, None
+        _, result = stored
+        self._remember(cep_clean, result, persist=False)
+        return True, result
+
+    def _remember(self, cep_clean: str, result: Optional[Dict[str, str]], persist: bool = True) -> None:
+        if result is None:
+            self._cache.set(cep_clean, _NOT_FOUND, ttl_seconds=self.negative_ttl_seconds)
+        else:
+            self._cache.set(cep_clean, result)
+        if persist and self.store:
+            self.store.set(cep_clean, result)
+
+    def _parse_response(self, cep_clean: str, response: httpx.Response) -> Optional[Dict[str, str]]:
+        """
+        Interpreta a resposta da ViaCEP
+
+        Returns:
+            {"cep", "cidade", "uf"} ou None (CEP inexistente)
+
+        Raises:
+            httpx.HTTPError: resposta de erro do servidor (não deve ir para o cache)
+        """
+        if response.status_code == 400:
+            # Formato de CEP rejeitado pela API
+            return None
+        response.raise_for_status()
+        data = response.json()
+        if data.get("erro") or not data.get("localidade") or not data.get("uf"):
+            return None
+        return {"cep": cep_clean, "cidade": data["localidade"], "uf": data["uf"]}
+
+    def lookup(self, cep: str) -> Optional[Dict[str, str]]:
+        """
+        Consulta um CEP (síncrono)
+
+        Returns:
+            {"cep", "cidade", "uf"} ou None se o CEP não existir ou não puder ser consultado
+        """
+        cep_clean = self.clean_cep(cep)
+        if not cep_clean:
+            return None
+
+        hit, result = self._from_cache(cep_clean)
+        if hit:
+            return result
+
+        with self._lock:
+            future = self._inflight.get(cep_clean)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[cep_clean] = future
+
+        if not is_leader:
+            # Outra thread já está consultando este CEP
+            return future.result()
+
+        result = None
+        try:
+            result = self._fetch(cep_clean)
+        finally:
+            with self._lock:
+                self._inflight.pop(cep_clean, None)
+            future.set_result(result)
+        return result
+
+    def _fetch(self, cep_clean: str) -> Optional[Dict[str, str]]:
+        hit, result = self._from_store(cep_clean)
+        if hit:
+            return result
+
+        if not self.circuit_breaker.allow_request():
+            logger.warning(f"Circuito da ViaCEP aberto; CEP {cep_clean} não consultado")
+            return None
+
+        try:
+            with self._lock:
+                self._requests += 1
+            response = self._get_client().get(self._url(cep_clean))
+            result = self._parse_response(cep_clean, response)
+        except (httpx.HTTPError, ValueError) as e:
+            self.circuit_breaker.record_failure()
+            logger.error(f"Erro na requisição para ViaCEP (CEP {cep_clean}): {str(e)}")
+            return None
+        except BaseException:
+            # Qualquer outra saída (inclusive cancelamento) também encerra a chamada de
+            # teste do meio-aberto; sem isso o circuito ficaria meio-aberto para sempre
+            self.circuit_breaker.record_failure()
+            raise
+
+        self.circuit_breaker.record_success()
+        self._remember(cep_clean, result)
+        return result
+
+    async def lookup_async(self, cep: str) -> Optional[Dict[str, str]]:
+        """Consulta um CEP (assíncrono); mesmo contrato de `lookup`"""
+        cep_clean = self.clean_cep(cep)
+        if not cep_clean:
+            return None
+
+        hit, result = self._from_cache(cep_clean)
+        if hit:
+            return result
+
+        loop = asyncio.get_running_loop()
+        key = (loop, cep_clean)
+        future = self._async_inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._async_inflight[key] = future
+        result = None
+        try:
+            result = await self._fetch_async(cep_clean)
+        finally:
+            self._async_inflight.pop(key, None)
+            future.set_result(result)
+        return result
+
+    async def _fetch_async(self, cep_clean: str) -> Optional[Dict[str, str]]:
+        if self.store:
+            hit, result = await to_thread.run_sync(self._from_store, cep_clean)
+            if hit:
+                return result
+
+        if not self.circuit_breaker.allow_request():
+            logger.warning(f"Circuito da ViaCEP aberto; CEP {cep_clean} não consultado")
+            return None
+
+        try:
+            with self._lock:
+                self._requests += 1
+            response = await self._get_async_client().get(self._url(cep_clean))
+            result = self._parse_response(cep_clean, response)
+        except (httpx.HTTPError, ValueError) as e:
+            self.circuit_breaker.record_failure()
+            logger.error(f"Erro na requisição para ViaCEP (CEP {cep_clean}): {str(e)}")
+            return None
+        except BaseException:
+            # Qualquer outra saída (inclusive cancelamento) também encerra a chamada de
+            # teste do meio-aberto; sem isso o circuito ficaria meio-aberto para sempre
+            self.circuit_breaker.record_failure()
+            raise
+
+        self.circuit_breaker.record_success()
+        if self.store:
+            await to_thread.run_sync(self._remember, cep_clean, result)
+        else:
+            self._remember(cep_clean, result)
+        return result
+
+    def stats(self) -> Dict[str, object]:
+        """Obtém estatísticas do cliente (requisições, cache e estado do circuito)"""
+        return {
+            "requests": self._requests,
+            "circuit_state": self.circuit_breaker.state,
+            "cache": self._cache.stats()
+        }
+
+    def close(self) -> None:
+        """Fecha o pool de conexões síncrono"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """Fecha o pool de conexões assíncrono"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
@@ -1,9 +1,16 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session, joinedload
 from domain.entities.artist import Artist
+from domain.entities.profile import Profile
 from domain.repositories.artist_repository import ArtistRepository
 from infrastructure.database.models.artist_model import ArtistModel
+from infrastructure.database.models.profile_model import ProfileModel
+from infrastructure.repositories.profile_repository_impl import ProfileRepositoryImpl
+from infrastructure.spatial.geo import bounding_box
 import json
+from infrastructure.database.pagination import paginate
+from domain.repositories.pagination import PageRequest
 
 class ArtistRepositoryImpl(ArtistRepository):
     def __init__(self, db: Session):
@@ -72,7 +79,7 @@ class ArtistRepositoryImpl(ArtistRepository):
         else:
             return self._to_entity(db_artist)
 
-    def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Artist, ArtistModel]]:
+    def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Artist, ArtistModel]]:
         """Listar todos os artistas"""
         query = self.db.query(ArtistModel)
         if include_relations:
@@ -80,7 +87,7 @@ class ArtistRepositoryImpl(ArtistRepository):
                 joinedload(ArtistModel.profile),
                 joinedload(ArtistModel.artist_type)
             )
-        db_artists = query.offset(skip).limit(limit).all()
+        db_artists = paginate(query, ArtistModel, page) if page else query.offset(skip).limit(limit).all()
         
         # Se include_relations=True, retornar os modelos do banco diretamente
         if include_relations:
@@ -88,7 +95,7 @@ class ArtistRepositoryImpl(ArtistRepository):
         else:
             return [self._to_entity(db_artist) for db_artist in db_artists]
 
-    def get_by_artist_type(self, artist_type_id: int, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Artist, ArtistModel]]:
+    def get_by_artist_type(self, artist_type_id: int, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Artist, ArtistModel]]:
         """Listar artistas por tipo"""
         query = self.db.query(ArtistModel)
         if include_relations:
@@ -96,9 +103,8 @@ class ArtistRepositoryImpl(ArtistRepository):
                 joinedload(ArtistModel.profile),
                 joinedload(ArtistModel.artist_type)
             )
-        db_artists = query.filter(
-            ArtistModel.artist_type_id == artist_type_id
-        ).offset(skip).limit(limit).all()
+        query = query.filter(ArtistModel.artist_type_id == artist_type_id)
+        db_artists = paginate(query, ArtistModel, page) if page else query.offset(skip).limit(limit).all()
         
         # Se include_relations=True, retornar os modelos do banco diretamente
         if include_relations:
@@ -106,6 +112,40 @@ class ArtistRepositoryImpl(ArtistRepository):
         else:
             return [self._to_entity(db_artist) for db_artist in db_artists]
 
+    def get_max_raio_atuacao(self) -> float:
+        """Obter o maior raio de atuação entre todos os artistas"""
+        max_raio = self.db.query(func.max(ArtistModel.raio_atuacao)).scalar()
+        return float(max_raio) if max_raio is not None else 0.0
+
+    def get_with_profiles_near(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[Artist, Profile]]:
+        """
+        Obter artistas com seus profiles em uma única query
+
+        Retorna os artistas cujo profile (role ARTISTA) está dentro do bounding box do
+        raio informado, além dos que não têm coordenadas cadastradas (que precisam
+        ser resolvidas por cidade/UF ou CEP). O refinamento exato da distância fica
+        a cargo do chamador.
+        """
+        min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+        rows = self.db.query(ArtistModel, ProfileModel).join(
+            ProfileModel, ArtistModel.profile_id == ProfileModel.id
+        ).filter(
+            ProfileModel.role_id == 2,
+            or_(
+                and_(
+                    ProfileModel.latitude.between(min_lat, max_lat),
+                    ProfileModel.longitude.between(min_lng, max_lng)
+                ),
+                ProfileModel.latitude.is_(None),
+                ProfileModel.longitude.is_(None)
+            )
+        ).all()
+
+        return [
+            (self._to_entity(db_artist), ProfileRepositoryImpl.to_entity(db_profile))
+            for db_artist, db_profile in rows
+        ]
+
     def update(self, artist: Artist) -> Artist:
         """Atualizar artista"""
         db_artist = self.db.query(ArtistModel).filter(ArtistModel.id == artist.id).first()
@@ -0,0 +1,47 @@
+from typing import List, Optional, Tuple, Union
+from domain.entities.artist import Artist
+from domain.entities.profile import Profile
+from domain.repositories.pagination import PageRequest
+from infrastructure.repositories.async_repository_impl import AsyncRepositoryImpl
+from infrastructure.repositories.artist_repository_impl import ArtistRepositoryImpl
+
+class AsyncArtistRepositoryImpl(AsyncRepositoryImpl):
+    """Implementação assíncrona (AsyncSession) de ArtistRepository"""
+
+    repository_class = ArtistRepositoryImpl
+
+    async def create(self, artist: Artist) -> Artist:
+        """Criar um novo artista"""
+        return await self._run("create", artist)
+
+    async def get_by_id(self, artist_id: int, include_relations: bool = False) -> Optional[Union[Artist, 'ArtistModel']]:
+        """Obter artista por ID"""
+        return await self._run("get_by_id", artist_id, include_relations=include_relations)
+
+    async def get_by_profile_id(self, profile_id: int, include_relations: bool = False) -> Optional[Union[Artist, 'ArtistModel']]:
+        """Obter artista por ID do profile"""
+        return await self._run("get_by_profile_id", profile_id, include_relations=include_relations)
+
+    async def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Artist, 'ArtistModel']]:
+        """Listar todos os artistas"""
+        return await self._run("get_all", skip=skip, limit=limit, include_relations=include_relations, page=page)
+
+    async def get_by_artist_type(self, artist_type_id: int, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Artist, 'ArtistModel']]:
+        """Listar artistas por tipo"""
+        return await self._run("get_by_artist_type", artist_type_id, skip=skip, limit=limit, include_relations=include_relations, page=page)
+
+    async def get_max_raio_atuacao(self) -> float:
+        """Obter o maior raio de atuação entre todos os artistas"""
+        return await self._run("get_max_raio_atuacao")
+
+    async def get_with_profiles_near(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[Artist, Profile]]:
+        """Obter artistas com seus profiles dentro do bounding box do raio (ou sem coordenadas)"""
+        return await self._run("get_with_profiles_near", latitude, longitude, radius_km)
+
+    async def update(self, artist: Artist) -> Artist:
+        """Atualizar artista"""
+        return await self._run("update", artist)
+
+    async def delete(self, artist_id: int) -> bool:
+        """Deletar artista"""
+        return await self._run("delete", artist_id)
@@ -0,0 +1,67 @@
+from typing import List, Optional, Union, Any, Dict, Sequence, Tuple
+from datetime import datetime
+from domain.entities.booking import Booking
+from domain.repositories.pagination import PageRequest
+from infrastructure.repositories.async_repository_impl import AsyncRepositoryImpl
+from infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+
+class AsyncBookingRepositoryImpl(AsyncRepositoryImpl):
+    """Implementação assíncrona (AsyncSession) de BookingRepository"""
+
+    repository_class = BookingRepositoryImpl
+
+    async def create(self, booking: Booking) -> Booking:
+        """Criar um novo agendamento"""
+        return await self._run("create", booking)
+
+    async def get_by_id(self, booking_id: int, include_relations: bool = False) -> Optional[Union[Booking, Any]]:
+        """Obter um agendamento por ID"""
+        return await self._run("get_by_id", booking_id, include_relations=include_relations)
+
+    async def get_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
+        """Obter todos os agendamentos de um profile"""
+        return await self._run("get_by_profile_id", profile_id, include_relations=include_relations, page=page)
+
+    async def get_by_space_id(self, space_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
+        """Obter todos os agendamentos de um espaço"""
+        return await self._run("get_by_space_id", space_id, include_relations=include_relations, page=page)
+
+    async def get_by_artist_id(self, artist_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
+        """Obter todos os agendamentos de um artista"""
+        return await self._run("get_by_artist_id", artist_id, include_relations=include_relations, page=page)
+
+    async def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
+        """Obter todos os agendamentos de um space-event type"""
+        return await self._run("get_by_space_event_type_id", space_event_type_id, include_relations=include_relations, page=page)
+
+    async def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
+        """Obter todos os agendamentos de um space-festival type"""
+        return await self._run("get_by_space_festival_type_id", space_festival_type_id, include_relations=include_relations, page=page)
+
+    async def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
+        """Obter agendamentos em um período"""
+        return await self._run("get_by_date_range", data_inicio, data_fim, include_relations=include_relations, page=page)
+
+    async def update(self, booking_id: int, booking: Booking) -> Optional[Booking]:
+        """Atualizar um agendamento"""
+        return await self._run("update", booking_id, booking)
+
+    async def delete(self, booking_id: int) -> bool:
+        """Deletar um agendamento"""
+        return await self._run("delete", booking_id)
+
+    async def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, Any]]:
+        """Obter todos os agendamentos"""
+        return await self._run("get_all", include_relations=include_relations, page=page)
+
+    async def get_conflicting_bookings(self, artist_id: int, data: datetime, horario: str) -> List[Union[Booking, Any]]:
+        """Obter agendamentos conflitantes para um artista em uma data/horário específicos"""
+        return await self._run("get_conflicting_bookings", artist_id, data, horario)
+
+    async def get_conflicting_bookings_bulk(self, artist_ids: Sequence[int], slots: Sequence[Tuple[datetime, datetime]]) -> Dict[int, List[Booking]]:
+        """Obter, em uma única consulta, os agendamentos de vários artistas que se sobrepõem a vários intervalos (início, fim)"""
+        return await self._run("get_conflicting_bookings_bulk", artist_ids, slots)
+
+    async def get_space_conflicting_bookings_bulk(self, space_ids: Sequence[int], slots: Sequence[Tuple[datetime, datetime]]) -> Dict[int, List[Booking]]:
+        """Obter, em uma única consulta, os agendamentos de vários espaços que se sobrepõem a vários intervalos (início, fim)"""
+        return await self._run("get_space_conflicting_bookings_bulk", space_ids, slots)
@@ -0,0 +1,73 @@
+from typing import List, Optional, Union, Any
+from datetime import date
+from domain.entities.interest import Interest, StatusInterest
+from domain.repositories.pagination import PageRequest
+from infrastructure.repositories.async_repository_impl import AsyncRepositoryImpl
+from infrastructure.repositories.interest_repository_impl import InterestRepositoryImpl
+
+class AsyncInterestRepositoryImpl(AsyncRepositoryImpl):
+    """Implementação assíncrona (AsyncSession) de InterestRepository"""
+
+    repository_class = InterestRepositoryImpl
+
+    async def create(self, interest: Interest) -> Interest:
+        """Criar uma nova manifestação de interesse"""
+        return await self._run("create", interest)
+
+    async def get_by_id(self, interest_id: int, include_relations: bool = False) -> Optional[Union[Interest, Any]]:
+        """Obter uma manifestação de interesse por ID"""
+        return await self._run("get_by_id", interest_id, include_relations=include_relations)
+
+    async def get_by_profile_interessado(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter todas as manifestações de interesse feitas por um profile"""
+        return await self._run("get_by_profile_interessado", profile_id, include_relations=include_relations, page=page)
+
+    async def get_by_profile_interesse(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter todas as manifestações de interesse recebidas por um profile"""
+        return await self._run("get_by_profile_interesse", profile_id, include_relations=include_relations, page=page)
+
+    async def get_by_status(self, status: StatusInterest, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter manifestações de interesse por status"""
+        return await self._run("get_by_status", status, include_relations=include_relations, page=page)
+
+    async def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter manifestações de interesse relacionadas a um space-event type"""
+        return await self._run("get_by_space_event_type_id", space_event_type_id, include_relations=include_relations, page=page)
+
+    async def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter manifestações de interesse relacionadas a um space-festival type"""
+        return await self._run("get_by_space_festival_type_id", space_festival_type_id, include_relations=include_relations, page=page)
+
+    async def get_by_date_range(self, data_inicio: date, data_fim: date, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter manifestações de interesse em um período"""
+        return await self._run("get_by_date_range", data_inicio, data_fim, include_relations=include_relations, page=page)
+
+    async def get_by_profile_and_status(self, profile_id: int, status: StatusInterest, is_interessado: bool = True, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter manifestações de interesse de um profile filtradas por status
+
+Args:
+    profile_id: ID do profile
+    status: Status do interesse
+    is_interessado: True para buscar como interessado, False para buscar como pessoa de interesse
+    include_relations: Incluir dados relacionados"""
+        return await self._run("get_by_profile_and_status", profile_id, status, is_interessado=is_interessado, include_relations=include_relations, page=page)
+
+    async def get_pending_for_profile(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter manifestações de interesse pendentes para um profile (recebidas e aguardando confirmação)"""
+        return await self._run("get_pending_for_profile", profile_id, include_relations=include_relations, page=page)
+
+    async def get_statistics_by_profile(self, profile_id: int) -> dict:
+        """Obter estatísticas de interesse para um profile"""
+        return await self._run("get_statistics_by_profile", profile_id)
+
+    async def update(self, interest_id: int, interest: Interest) -> Optional[Interest]:
+        """Atualizar uma manifestação de interesse"""
+        return await self._run("update", interest_id, interest)
+
+    async def delete(self, interest_id: int) -> bool:
+        """Deletar uma manifestação de interesse"""
+        return await self._run("delete", interest_id)
+
+    async def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, Any]]:
+        """Obter todas as manifestações de interesse"""
+        return await self._run("get_all", include_relations=include_relations, page=page)
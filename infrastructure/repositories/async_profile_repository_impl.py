@@ -0,0 +1,54 @@
+from typing import List, Optional, Tuple
+from domain.entities.profile import Profile
+from domain.repositories.pagination import PageRequest
+from infrastructure.repositories.async_repository_impl import AsyncRepositoryImpl
+from infrastructure.repositories.profile_repository_impl import ProfileRepositoryImpl
+
+class AsyncProfileRepositoryImpl(AsyncRepositoryImpl):
+    """Implementação assíncrona (AsyncSession) de ProfileRepository"""
+
+    repository_class = ProfileRepositoryImpl
+
+    async def create(self, profile: Profile) -> Profile:
+        """Criar um novo profile"""
+        return await self._run("create", profile)
+
+    async def get_by_id(self, profile_id: int) -> Optional[Profile]:
+        """Obter profile por ID"""
+        return await self._run("get_by_id", profile_id)
+
+    async def get_by_role_id(self, role_id: int) -> List[Profile]:
+        """Obter profiles por role_id"""
+        return await self._run("get_by_role_id", role_id)
+
+    async def get_by_role_id_within_radius(self, role_id: int, latitude: float, longitude: float, radius_km: float) -> List[Profile]:
+        """Obter profiles de um role com coordenadas dentro de um raio, ordenados por distância"""
+        return await self._run("get_by_role_id_within_radius", role_id, latitude, longitude, radius_km)
+
+    async def get_by_role_id_without_coordinates(self, role_id: int) -> List[Profile]:
+        """Obter profiles de um role sem latitude/longitude cadastradas"""
+        return await self._run("get_by_role_id_without_coordinates", role_id)
+
+    async def get_without_coordinates(self, limit: int = 100, after_id: int = 0) -> List[Profile]:
+        """Obter profiles sem latitude/longitude, em ordem de ID, a partir de after_id"""
+        return await self._run("get_without_coordinates", limit=limit, after_id=after_id)
+
+    async def bulk_update_coordinates(self, updates: List[Tuple[int, float, float, str]]) -> int:
+        """Gravar em massa as coordenadas resolvidas: (profile_id, latitude, longitude, origem)"""
+        return await self._run("bulk_update_coordinates", updates)
+
+    async def get_by_user_id(self, user_id: int) -> Optional[Profile]:
+        """Obter profile por user_id"""
+        return await self._run("get_by_user_id", user_id)
+
+    async def get_all(self, skip: int = 0, limit: int = 100, page: Optional[PageRequest] = None) -> List[Profile]:
+        """Listar todos os profiles com paginação"""
+        return await self._run("get_all", skip=skip, limit=limit, page=page)
+
+    async def update(self, profile: Profile) -> Profile:
+        """Atualizar profile"""
+        return await self._run("update", profile)
+
+    async def delete(self, profile_id: int) -> bool:
+        """Deletar profile por ID"""
+        return await self._run("delete", profile_id)
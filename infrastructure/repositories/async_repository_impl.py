@@ -0,0 +1,26 @@
+from typing import Any, Type
+from sqlalchemy.ext.asyncio import AsyncSession
+
+class AsyncRepositoryImpl:
+    """
+    Base das implementações assíncronas dos repositórios
+
+    Cada método executa o método de mesmo nome da implementação síncrona
+    (`repository_class`) sobre a AsyncSession, via `run_sync`: o I/O passa pelo
+    driver assíncrono (aiosqlite/asyncpg) sem ocupar uma thread por consulta, e as
+    consultas continuam definidas em um único lugar.
+
+    Com `include_relations=True` os modelos retornados só podem ter acessados os
+    relacionamentos já carregados pela consulta (não há carregamento preguiçoso fora
+    de `run_sync`).
+    """
+
+    repository_class: Type[Any]
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        def call(session):
+            return getattr(self.repository_class(session), method)(*args, **kwargs)
+        return await self.db.run_sync(call)
@@ -0,0 +1,63 @@
+from typing import Dict, List, Optional, Sequence, Union, Any
+from datetime import datetime
+from domain.entities.review import Review, ProfileRatingSummary
+from domain.repositories.pagination import PageRequest
+from infrastructure.repositories.async_repository_impl import AsyncRepositoryImpl
+from infrastructure.repositories.review_repository_impl import ReviewRepositoryImpl
+
+class AsyncReviewRepositoryImpl(AsyncRepositoryImpl):
+    """Implementação assíncrona (AsyncSession) de ReviewRepository"""
+
+    repository_class = ReviewRepositoryImpl
+
+    async def create(self, review: Review) -> Review:
+        """Criar uma nova avaliação"""
+        return await self._run("create", review)
+
+    async def get_by_id(self, review_id: int, include_relations: bool = False) -> Optional[Union[Review, Any]]:
+        """Obter uma avaliação por ID"""
+        return await self._run("get_by_id", review_id, include_relations=include_relations)
+
+    async def get_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
+        """Obter todas as avaliações de um profile"""
+        return await self._run("get_by_profile_id", profile_id, include_relations=include_relations, page=page)
+
+    async def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
+        """Obter todas as avaliações de um space-event type"""
+        return await self._run("get_by_space_event_type_id", space_event_type_id, include_relations=include_relations, page=page)
+
+    async def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
+        """Obter todas as avaliações de um space-festival type"""
+        return await self._run("get_by_space_festival_type_id", space_festival_type_id, include_relations=include_relations, page=page)
+
+    async def get_by_nota(self, nota: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
+        """Obter todas as avaliações com uma nota específica"""
+        return await self._run("get_by_nota", nota, include_relations=include_relations, page=page)
+
+    async def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
+        """Obter avaliações em um período"""
+        return await self._run("get_by_date_range", data_inicio, data_fim, include_relations=include_relations, page=page)
+
+    async def update(self, review_id: int, review: Review) -> Optional[Review]:
+        """Atualizar uma avaliação"""
+        return await self._run("update", review_id, review)
+
+    async def delete(self, review_id: int) -> bool:
+        """Deletar uma avaliação"""
+        return await self._run("delete", review_id)
+
+    async def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, Any]]:
+        """Obter todas as avaliações"""
+        return await self._run("get_all", include_relations=include_relations, page=page)
+
+    async def get_average_rating_by_profile(self, profile_id: int) -> Optional[float]:
+        """Obter a média de avaliações de um profile"""
+        return await self._run("get_average_rating_by_profile", profile_id)
+
+    async def get_rating_summary(self, profile_id: int) -> ProfileRatingSummary:
+        """Obter o resumo (quantidade, média e distribuição) das avaliações de um profile"""
+        return await self._run("get_rating_summary", profile_id)
+
+    async def get_rating_summaries(self, profile_ids: Sequence[int]) -> Dict[int, ProfileRatingSummary]:
+        """Obter o resumo das avaliações de vários profiles"""
+        return await self._run("get_rating_summaries", profile_ids)
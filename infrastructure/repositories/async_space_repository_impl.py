@@ -0,0 +1,43 @@
+from typing import List, Optional, Union, TYPE_CHECKING
+from domain.entities.space import Space
+from domain.repositories.pagination import PageRequest
+from infrastructure.repositories.async_repository_impl import AsyncRepositoryImpl
+from infrastructure.repositories.space_repository_impl import SpaceRepositoryImpl
+
+if TYPE_CHECKING:
+    from infrastructure.database.models.space_model import SpaceModel
+
+class AsyncSpaceRepositoryImpl(AsyncRepositoryImpl):
+    """Implementação assíncrona (AsyncSession) de SpaceRepository"""
+
+    repository_class = SpaceRepositoryImpl
+
+    async def create(self, space: Space) -> Space:
+        return await self._run("create", space)
+
+    async def get_by_id(self, space_id: int, include_relations: bool = False) -> Optional[Union[Space, "SpaceModel"]]:
+        return await self._run("get_by_id", space_id, include_relations=include_relations)
+
+    async def get_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Space, "SpaceModel"]]:
+        return await self._run("get_by_profile_id", profile_id, include_relations=include_relations)
+
+    async def get_by_space_type_id(self, space_type_id: int, include_relations: bool = False) -> List[Union[Space, "SpaceModel"]]:
+        return await self._run("get_by_space_type_id", space_type_id, include_relations=include_relations)
+
+    async def get_by_event_type_id(self, event_type_id: int, include_relations: bool = False) -> List[Union[Space, "SpaceModel"]]:
+        return await self._run("get_by_event_type_id", event_type_id, include_relations=include_relations)
+
+    async def get_by_festival_type_id(self, festival_type_id: int, include_relations: bool = False) -> List[Union[Space, "SpaceModel"]]:
+        return await self._run("get_by_festival_type_id", festival_type_id, include_relations=include_relations)
+
+    async def get_contracting_by_profile_ids(self, profile_ids: List[int]) -> List[Space]:
+        return await self._run("get_contracting_by_profile_ids", profile_ids)
+
+    async def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Space, "SpaceModel"]]:
+        return await self._run("get_all", skip=skip, limit=limit, include_relations=include_relations, page=page)
+
+    async def update(self, space: Space) -> Space:
+        return await self._run("update", space)
+
+    async def delete(self, space_id: int) -> bool:
+        return await self._run("delete", space_id)
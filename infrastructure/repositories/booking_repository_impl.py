@@ -1,14 +1,17 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Union, Dict, Sequence, Tuple, Iterator
 from datetime import datetime
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session, joinedload
 from domain.repositories.booking_repository import BookingRepository
-from domain.entities.booking import Booking
+from domain.entities.booking import Booking, combine_date_and_time
 from infrastructure.database.models.booking_model import BookingModel
 from infrastructure.database.models.profile_model import ProfileModel
 from infrastructure.database.models.space_model import SpaceModel
 from infrastructure.database.models.artist_model import ArtistModel
 from infrastructure.database.models.space_event_type_model import SpaceEventTypeModel
 from infrastructure.database.models.space_festival_type_model import SpaceFestivalTypeModel
+from infrastructure.database.pagination import paginate, stream
+from domain.repositories.pagination import PageRequest
 
 class BookingRepositoryImpl(BookingRepository):
     """Implementação do repositório para agendamentos/reservas"""
@@ -88,64 +91,64 @@ class BookingRepositoryImpl(BookingRepository):
             return booking  # Retorna o modelo com relacionamentos carregados
         return self._to_entity(booking)
     
-    def get_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Booking, BookingModel]]:
+    def get_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, BookingModel]]:
         """Obter todos os agendamentos de um profile"""
         query = self.db.query(BookingModel).filter(BookingModel.profile_id == profile_id)
         query = self._configure_relations(query, include_relations)
-        bookings = query.all()
+        bookings = paginate(query, BookingModel, page)
         
         if include_relations:
             return bookings  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(booking) for booking in bookings]
     
-    def get_by_space_id(self, space_id: int, include_relations: bool = False) -> List[Union[Booking, BookingModel]]:
+    def get_by_space_id(self, space_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, BookingModel]]:
         """Obter todos os agendamentos de um espaço"""
         query = self.db.query(BookingModel).filter(BookingModel.space_id == space_id)
         query = self._configure_relations(query, include_relations)
-        bookings = query.all()
+        bookings = paginate(query, BookingModel, page)
         
         if include_relations:
             return bookings  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(booking) for booking in bookings]
     
-    def get_by_artist_id(self, artist_id: int, include_relations: bool = False) -> List[Union[Booking, BookingModel]]:
+    def get_by_artist_id(self, artist_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, BookingModel]]:
         """Obter todos os agendamentos de um artista"""
         query = self.db.query(BookingModel).filter(BookingModel.artist_id == artist_id)
         query = self._configure_relations(query, include_relations)
-        bookings = query.all()
+        bookings = paginate(query, BookingModel, page)
         
         if include_relations:
             return bookings  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(booking) for booking in bookings]
     
-    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False) -> List[Union[Booking, BookingModel]]:
+    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, BookingModel]]:
         """Obter todos os agendamentos de um space-event type"""
         query = self.db.query(BookingModel).filter(BookingModel.space_event_type_id == space_event_type_id)
         query = self._configure_relations(query, include_relations)
-        bookings = query.all()
+        bookings = paginate(query, BookingModel, page)
         
         if include_relations:
             return bookings  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(booking) for booking in bookings]
     
-    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False) -> List[Union[Booking, BookingModel]]:
+    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, BookingModel]]:
         """Obter todos os agendamentos de um space-festival type"""
         query = self.db.query(BookingModel).filter(BookingModel.space_festival_type_id == space_festival_type_id)
         query = self._configure_relations(query, include_relations)
-        bookings = query.all()
+        bookings = paginate(query, BookingModel, page)
         
         if include_relations:
             return bookings  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(booking) for booking in bookings]
     
-    def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False) -> List[Union[Booking, BookingModel]]:
+    def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, BookingModel]]:
         """Obter agendamentos em um período"""
         query = self.db.query(BookingModel).filter(
             BookingModel.data_inicio >= data_inicio,
             BookingModel.data_fim <= data_fim
         )
         query = self._configure_relations(query, include_relations)
-        bookings = query.all()
+        bookings = paginate(query, BookingModel, page)
         
         if include_relations:
             return bookings  # Retorna modelos com relacionamentos carregados
@@ -213,50 +216,58 @@ class BookingRepositoryImpl(BookingRepository):
         self.db.commit()
         return True
     
-    def get_all(self, include_relations: bool = False) -> List[Union[Booking, BookingModel]]:
+    def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Booking, BookingModel]]:
         """Obter todos os agendamentos"""
         query = self.db.query(BookingModel)
         query = self._configure_relations(query, include_relations)
-        bookings = query.all()
+        bookings = paginate(query, BookingModel, page)
         
         if include_relations:
             return bookings  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(booking) for booking in bookings]
     
+    def iter_all(self, batch_size: int = 500) -> Iterator[Booking]:
+        """Percorrer todos os agendamentos em lotes, sem carregar a tabela inteira na memória"""
+        for booking in stream(self.db.query(BookingModel), BookingModel, batch_size):
+            yield self._to_entity(booking)
+    
     def get_conflicting_bookings(self, artist_id: int, data: datetime, horario: str) -> List[Union[Booking, BookingModel]]:
         """Obter agendamentos conflitantes para um artista em uma data/horário específicos"""
-        # Buscar agendamentos do artista na mesma data
-        query = self.db.query(BookingModel).filter(
+        instante = combine_date_and_time(data, horario)
+        return self.db.query(BookingModel).filter(
             BookingModel.artist_id == artist_id,
-            BookingModel.data_inicio == data
-        )
+            self._overlaps(instante, instante)
+        ).all()
+    
+    def get_conflicting_bookings_bulk(self, artist_ids: Sequence[int], slots: Sequence[Tuple[datetime, datetime]]) -> Dict[int, List[Booking]]:
+        """Obter, em uma única consulta, os agendamentos de vários artistas que se sobrepõem a vários intervalos (início, fim)"""
+        return self._get_overlapping_bookings_bulk("artist_id", artist_ids, slots)
+    
+    def get_space_conflicting_bookings_bulk(self, space_ids: Sequence[int], slots: Sequence[Tuple[datetime, datetime]]) -> Dict[int, List[Booking]]:
+        """Obter, em uma única consulta, os agendamentos de vários espaços que se sobrepõem a vários intervalos (início, fim)"""
+        return self._get_overlapping_bookings_bulk("space_id", space_ids, slots)
+    
+    def _get_overlapping_bookings_bulk(self, owner_field: str, owner_ids: Sequence[int], slots: Sequence[Tuple[datetime, datetime]]) -> Dict[int, List[Booking]]:
+        """Agendamentos de cada dono (artista/espaço) que se sobrepõem a algum dos intervalos"""
+        if not owner_ids or not slots:
+            return {}
         
-        bookings = query.all()
-        conflicting_bookings = []
+        # Um predicado de faixa por intervalo, coberto pelo índice (dono, periodo_inicio, periodo_fim)
+        bookings = self.db.query(BookingModel).filter(
+            getattr(BookingModel, owner_field).in_(set(owner_ids)),
+            or_(*(self._overlaps(inicio, fim) for inicio, fim in set(slots)))
+        ).order_by(BookingModel.periodo_inicio).all()
         
+        conflicting_bookings: Dict[int, List[Booking]] = {}
         for booking in bookings:
-            # Verificar se há conflito de horário
-            if self._has_time_conflict(booking.horario_inicio, booking.horario_fim, horario):
-                conflicting_bookings.append(booking)
+            conflicting_bookings.setdefault(getattr(booking, owner_field), []).append(self._to_entity(booking))
         
         return conflicting_bookings
     
-    def _has_time_conflict(self, start_time1: str, end_time1: str, time2: str) -> bool:
-        """Verificar se há conflito entre dois horários"""
-        # Converter horários para minutos para facilitar comparação
-        def time_to_minutes(time_str: str) -> int:
-            try:
-                hours, minutes = map(int, time_str.split(':'))
-                return hours * 60 + minutes
-            except:
-                return 0
-        
-        start1 = time_to_minutes(start_time1)
-        end1 = time_to_minutes(end_time1)
-        time2_minutes = time_to_minutes(time2)
-        
-        # Verificar se há sobreposição
-        return start1 <= time2_minutes <= end1
+    @staticmethod
+    def _overlaps(inicio: datetime, fim: datetime):
+        """Predicado SQL de sobreposição com o intervalo fechado [inicio, fim]"""
+        return and_(BookingModel.periodo_inicio <= fim, BookingModel.periodo_fim >= inicio)
     
     def _to_entity(self, model: BookingModel) -> Booking:
         """Converter modelo para entidade"""
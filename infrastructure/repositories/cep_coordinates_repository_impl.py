@@ -1,8 +1,10 @@
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from domain.repositories.cep_coordinates_repository import CepCoordinatesRepository
 from domain.entities.cep_coordinates import CepCoordinates
 from infrastructure.database.models.cep_coordinates_model import CepCoordinatesModel
+from infrastructure.spatial.cep_gazetteer import CepGazetteer
+from infrastructure.spatial.geo import bounding_box, haversine_km
 import unicodedata
 import logging
 
@@ -11,9 +13,26 @@ logger = logging.getLogger(__name__)
 class CepCoordinatesRepositoryImpl(CepCoordinatesRepository):
     """Implementação do repositório de coordenadas de municípios"""
     
+    # Callbacks (cidade_normalizada, uf) chamados após escritas, para invalidar caches
+    _change_listeners: List[Callable[[str, str], None]] = []
+    
     def __init__(self, db: Session):
         self.db = db
     
+    @classmethod
+    def add_change_listener(cls, listener: Callable[[str, str], None]) -> None:
+        """Registrar callback chamado após create/update/delete de um município"""
+        if listener not in cls._change_listeners:
+            cls._change_listeners.append(listener)
+    
+    def _notify_change(self, cidade: str, uf: str) -> None:
+        """Notificar os listeners sobre a alteração de um município"""
+        for listener in self._change_listeners:
+            try:
+                listener(self._normalize_text(cidade), uf.strip().upper())
+            except Exception as e:
+                logger.error(f"Erro ao notificar alteração de '{cidade}'/UF '{uf}': {str(e)}")
+    
     def get_by_cidade_uf(self, cidade: str, uf: str) -> Optional[CepCoordinates]:
         """
         Obtém coordenadas por cidade e UF - ignora acentuação
@@ -75,6 +94,7 @@ class CepCoordinatesRepositoryImpl(CepCoordinatesRepository):
         model = CepCoordinatesModel(
             cidade=cep_coordinates.cidade,
             uf=cep_coordinates.uf,
+            cidade_normalizada=self._normalize_text(cep_coordinates.cidade),
             latitude=cep_coordinates.latitude,
             longitude=cep_coordinates.longitude
         )
@@ -82,6 +102,7 @@ class CepCoordinatesRepositoryImpl(CepCoordinatesRepository):
         self.db.add(model)
         self.db.commit()
         self.db.refresh(model)
+        self._notify_change(model.cidade, model.uf)
         
         return CepCoordinates(
             cidade=model.cidade,
@@ -107,6 +128,7 @@ class CepCoordinatesRepositoryImpl(CepCoordinatesRepository):
         
         self.db.commit()
         self.db.refresh(model)
+        self._notify_change(model.cidade, model.uf)
         
         return CepCoordinates(
             cidade=model.cidade,
@@ -127,6 +149,7 @@ class CepCoordinatesRepositoryImpl(CepCoordinatesRepository):
         if model:
             self.db.delete(model)
             self.db.commit()
+            self._notify_change(cidade, uf)
             return True
         return False
     
@@ -201,28 +224,58 @@ class CepCoordinatesRepositoryImpl(CepCoordinatesRepository):
         return ascii_text.strip().upper()
     
     def get_nearby_cities(self, latitude: float, longitude: float, radius_km: float = 50) -> List[CepCoordinates]:
-        """Busca cidades próximas usando fórmula de Haversine"""
-        # Fórmula de Haversine para calcular distância
-        # Esta é uma aproximação simples - para produção, considere usar PostGIS ou similar
-        models = self.db.query(CepCoordinatesModel).all()
+        """Busca cidades próximas usando fórmula de Haversine, ordenadas por distância"""
+        return [city for city, _ in self.get_nearby_cities_with_distance(latitude, longitude, radius_km)]
+    
+    def get_nearby_cities_with_distance(self, latitude: float, longitude: float, radius_km: float = 50) -> List[Tuple[CepCoordinates, float]]:
+        """
+        Busca cidades próximas com a distância em quilômetros
+        
+        O bounding box do raio é filtrado no SQL (usando idx_cep_coordinates_lat_lng)
+        e apenas os candidatos dentro dele são refinados com Haversine.
+        
+        Args:
+            latitude, longitude: Coordenadas do ponto central
+            radius_km: Raio de busca em quilômetros
+            
+        Returns:
+            Lista de (coordenadas, distancia_km) ordenada por distância
+        """
+        min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+        
+        models = self.db.query(CepCoordinatesModel).filter(
+            CepCoordinatesModel.latitude.between(min_lat, max_lat),
+            CepCoordinatesModel.longitude.between(min_lng, max_lng)
+        ).all()
         
         nearby_cities = []
         for model in models:
-            # Cálculo simplificado de distância (aproximação)
-            lat_diff = abs(model.latitude - latitude)
-            lng_diff = abs(model.longitude - longitude)
-            
-            # Aproximação: 1 grau ≈ 111 km
-            distance_km = ((lat_diff ** 2 + lng_diff ** 2) ** 0.5) * 111
-            
+            distance_km = haversine_km(latitude, longitude, model.latitude, model.longitude)
             if distance_km <= radius_km:
-                nearby_cities.append(CepCoordinates(
-                    cidade=model.cidade,
-                    uf=model.uf,
-                    latitude=model.latitude,
-                    longitude=model.longitude,
-                    created_at=model.created_at,
-                    updated_at=model.updated_at
-                ))
+                nearby_cities.append((self._to_entity(model), distance_km))
+        
+        nearby_cities.sort(key=lambda item: item[1])
+        return nearby_cities
+    
+    def load_gazetteer(self) -> CepGazetteer:
+        """Carrega a tabela inteira (uma única query) em um CepGazetteer imutável"""
+        rows = self.db.query(
+            CepCoordinatesModel.cidade,
+            CepCoordinatesModel.uf,
+            CepCoordinatesModel.cidade_normalizada,
+            CepCoordinatesModel.latitude,
+            CepCoordinatesModel.longitude
+        ).order_by(CepCoordinatesModel.uf, CepCoordinatesModel.cidade_normalizada).all()
         
-        return nearby_cities 
\ No newline at end of file
+        return CepGazetteer(rows)
+    
+    def _to_entity(self, model: CepCoordinatesModel) -> CepCoordinates:
+        """Converter modelo para entidade"""
+        return CepCoordinates(
+            cidade=model.cidade,
+            uf=model.uf,
+            latitude=model.latitude,
+            longitude=model.longitude,
+            created_at=model.created_at,
+            updated_at=model.updated_at
+        )
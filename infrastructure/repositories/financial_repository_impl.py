@@ -1,9 +1,12 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union, Iterator
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 from domain.repositories.financial_repository import FinancialRepository
 from domain.entities.financial import Financial, TipoConta, TipoChavePix, PreferenciaTransferencia
 from infrastructure.database.models.financial_model import FinancialModel
 from infrastructure.database.models.profile_model import ProfileModel
+from infrastructure.database.pagination import paginate, stream
+from domain.repositories.pagination import PageRequest
 
 class FinancialRepositoryImpl(FinancialRepository):
     """Implementação do repositório para dados financeiros/bancários"""
@@ -62,41 +65,41 @@ class FinancialRepositoryImpl(FinancialRepository):
             return financial  # Retorna o modelo com relacionamentos carregados
         return self._to_entity(financial)
     
-    def get_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Financial, FinancialModel]]:
+    def get_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, FinancialModel]]:
         """Obter todos os registros financeiros de um profile"""
         query = self.db.query(FinancialModel).filter(FinancialModel.profile_id == profile_id)
         query = self._configure_relations(query, include_relations)
-        financials = query.all()
+        financials = paginate(query, FinancialModel, page)
         
         if include_relations:
             return financials  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(financial) for financial in financials]
     
-    def get_by_banco(self, banco: str, include_relations: bool = False) -> List[Union[Financial, FinancialModel]]:
+    def get_by_banco(self, banco: str, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, FinancialModel]]:
         """Obter todos os registros financeiros de um banco específico"""
         query = self.db.query(FinancialModel).filter(FinancialModel.banco == banco)
         query = self._configure_relations(query, include_relations)
-        financials = query.all()
+        financials = paginate(query, FinancialModel, page)
         
         if include_relations:
             return financials  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(financial) for financial in financials]
     
-    def get_by_tipo_conta(self, tipo_conta: TipoConta, include_relations: bool = False) -> List[Union[Financial, FinancialModel]]:
+    def get_by_tipo_conta(self, tipo_conta: TipoConta, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, FinancialModel]]:
         """Obter registros financeiros por tipo de conta"""
         query = self.db.query(FinancialModel).filter(FinancialModel.tipo_conta == tipo_conta.value)
         query = self._configure_relations(query, include_relations)
-        financials = query.all()
+        financials = paginate(query, FinancialModel, page)
         
         if include_relations:
             return financials  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(financial) for financial in financials]
     
-    def get_by_tipo_chave_pix(self, tipo_chave_pix: TipoChavePix, include_relations: bool = False) -> List[Union[Financial, FinancialModel]]:
+    def get_by_tipo_chave_pix(self, tipo_chave_pix: TipoChavePix, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, FinancialModel]]:
         """Obter registros financeiros por tipo de chave PIX"""
         query = self.db.query(FinancialModel).filter(FinancialModel.tipo_chave_pix == tipo_chave_pix.value)
         query = self._configure_relations(query, include_relations)
-        financials = query.all()
+        financials = paginate(query, FinancialModel, page)
         
         if include_relations:
             return financials  # Retorna modelos com relacionamentos carregados
@@ -115,21 +118,21 @@ class FinancialRepositoryImpl(FinancialRepository):
             return financial  # Retorna o modelo com relacionamentos carregados
         return self._to_entity(financial)
     
-    def get_by_preferencia(self, preferencia: PreferenciaTransferencia, include_relations: bool = False) -> List[Union[Financial, FinancialModel]]:
+    def get_by_preferencia(self, preferencia: PreferenciaTransferencia, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, FinancialModel]]:
         """Obter registros financeiros por preferência de transferência"""
         query = self.db.query(FinancialModel).filter(FinancialModel.preferencia == preferencia.value)
         query = self._configure_relations(query, include_relations)
-        financials = query.all()
+        financials = paginate(query, FinancialModel, page)
         
         if include_relations:
             return financials  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(financial) for financial in financials]
     
-    def get_by_cpf_cnpj(self, cpf_cnpj: str, include_relations: bool = False) -> List[Union[Financial, FinancialModel]]:
+    def get_by_cpf_cnpj(self, cpf_cnpj: str, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, FinancialModel]]:
         """Obter registros financeiros por CPF/CNPJ"""
         query = self.db.query(FinancialModel).filter(FinancialModel.cpf_cnpj == cpf_cnpj)
         query = self._configure_relations(query, include_relations)
-        financials = query.all()
+        financials = paginate(query, FinancialModel, page)
         
         if include_relations:
             return financials  # Retorna modelos com relacionamentos carregados
@@ -181,16 +184,21 @@ class FinancialRepositoryImpl(FinancialRepository):
         self.db.commit()
         return True
     
-    def get_all(self, include_relations: bool = False) -> List[Union[Financial, FinancialModel]]:
+    def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Financial, FinancialModel]]:
         """Obter todos os registros financeiros"""
         query = self.db.query(FinancialModel)
         query = self._configure_relations(query, include_relations)
-        financials = query.all()
+        financials = paginate(query, FinancialModel, page)
         
         if include_relations:
             return financials  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(financial) for financial in financials]
     
+    def iter_all(self, batch_size: int = 500) -> Iterator[Financial]:
+        """Percorrer todos os registros financeiros em lotes, sem carregar a tabela inteira na memória"""
+        for financial in stream(self.db.query(FinancialModel), FinancialModel, batch_size):
+            yield self._to_entity(financial)
+    
     def check_chave_pix_exists(self, chave_pix: str, exclude_id: Optional[int] = None) -> bool:
         """Verificar se uma chave PIX já existe (para garantir unicidade)"""
         query = self.db.query(FinancialModel).filter(FinancialModel.chave_pix == chave_pix)
@@ -200,6 +208,27 @@ class FinancialRepositoryImpl(FinancialRepository):
         
         return query.first() is not None
     
+    def get_banks_summary(self) -> Dict[str, int]:
+        """Obter a quantidade de registros por banco"""
+        return self._count_by(FinancialModel.banco)
+    
+    def get_pix_types_summary(self) -> Dict[str, int]:
+        """Obter a quantidade de registros por tipo de chave PIX"""
+        return self._count_by(FinancialModel.tipo_chave_pix)
+    
+    def get_preferencias_summary(self) -> Dict[str, int]:
+        """Obter a quantidade de registros por preferência de transferência"""
+        return self._count_by(FinancialModel.preferencia)
+    
+    def get_tipos_conta_summary(self) -> Dict[str, int]:
+        """Obter a quantidade de registros por tipo de conta"""
+        return self._count_by(FinancialModel.tipo_conta)
+    
+    def _count_by(self, column) -> Dict[str, int]:
+        """Contar registros agrupados por uma coluna (GROUP BY no banco, sem carregar as linhas)"""
+        rows = self.db.query(column, func.count(FinancialModel.id)).group_by(column).order_by(column).all()
+        return {value: count for value, count in rows}
+    
     def _to_entity(self, model: FinancialModel) -> Financial:
         """Converter modelo para entidade"""
         return Financial(
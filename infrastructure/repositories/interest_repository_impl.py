@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Union, Iterator
 from datetime import date
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, and_, or_
@@ -8,6 +8,8 @@ from infrastructure.database.models.interest_model import InterestModel
 from infrastructure.database.models.profile_model import ProfileModel
 from infrastructure.database.models.space_event_type_model import SpaceEventTypeModel
 from infrastructure.database.models.space_festival_type_model import SpaceFestivalTypeModel
+from infrastructure.database.pagination import paginate, stream
+from domain.repositories.pagination import PageRequest
 
 class InterestRepositoryImpl(InterestRepository):
     """Implementação do repositório para manifestações de interesse"""
@@ -83,57 +85,57 @@ class InterestRepositoryImpl(InterestRepository):
             return interest  # Retorna o modelo com relacionamentos carregados
         return self._to_entity(interest)
     
-    def get_by_profile_interessado(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_by_profile_interessado(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter todas as manifestações de interesse feitas por um profile"""
         query = self.db.query(InterestModel).filter(InterestModel.profile_id_interessado == profile_id)
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(interest) for interest in interests]
     
-    def get_by_profile_interesse(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_by_profile_interesse(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter todas as manifestações de interesse recebidas por um profile"""
         query = self.db.query(InterestModel).filter(InterestModel.profile_id_interesse == profile_id)
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(interest) for interest in interests]
     
-    def get_by_status(self, status: StatusInterest, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_by_status(self, status: StatusInterest, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter manifestações de interesse por status"""
         query = self.db.query(InterestModel).filter(InterestModel.status == status)
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(interest) for interest in interests]
     
-    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter manifestações de interesse relacionadas a um space-event type"""
         query = self.db.query(InterestModel).filter(InterestModel.space_event_type_id == space_event_type_id)
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(interest) for interest in interests]
     
-    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter manifestações de interesse relacionadas a um space-festival type"""
         query = self.db.query(InterestModel).filter(InterestModel.space_festival_type_id == space_festival_type_id)
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(interest) for interest in interests]
     
-    def get_by_date_range(self, data_inicio: date, data_fim: date, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_by_date_range(self, data_inicio: date, data_fim: date, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter manifestações de interesse em um período"""
         query = self.db.query(InterestModel).filter(
             and_(
@@ -142,13 +144,13 @@ class InterestRepositoryImpl(InterestRepository):
             )
         )
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(interest) for interest in interests]
     
-    def get_by_profile_and_status(self, profile_id: int, status: StatusInterest, is_interessado: bool = True, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_by_profile_and_status(self, profile_id: int, status: StatusInterest, is_interessado: bool = True, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter manifestações de interesse de um profile filtradas por status"""
         if is_interessado:
             query = self.db.query(InterestModel).filter(
@@ -166,13 +168,13 @@ class InterestRepositoryImpl(InterestRepository):
             )
         
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(interest) for interest in interests]
     
-    def get_pending_for_profile(self, profile_id: int, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_pending_for_profile(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter manifestações de interesse pendentes para um profile (recebidas e aguardando confirmação)"""
         query = self.db.query(InterestModel).filter(
             and_(
@@ -181,7 +183,7 @@ class InterestRepositoryImpl(InterestRepository):
             )
         )
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
@@ -251,16 +253,21 @@ class InterestRepositoryImpl(InterestRepository):
         self.db.commit()
         return True
     
-    def get_all(self, include_relations: bool = False) -> List[Union[Interest, InterestModel]]:
+    def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Interest, InterestModel]]:
         """Obter todas as manifestações de interesse"""
         query = self.db.query(InterestModel)
         query = self._configure_relations(query, include_relations)
-        interests = query.all()
+        interests = paginate(query, InterestModel, page)
         
         if include_relations:
             return interests  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(interest) for interest in interests]
     
+    def iter_all(self, batch_size: int = 500) -> Iterator[Interest]:
+        """Percorrer todas as manifestações de interesse em lotes, sem carregar a tabela inteira na memória"""
+        for interest in stream(self.db.query(InterestModel), InterestModel, batch_size):
+            yield self._to_entity(interest)
+    
     def _to_entity(self, model: InterestModel) -> Interest:
         """Converter modelo para entidade"""
         return Interest(
@@ -1,8 +1,12 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
 from domain.entities.profile import Profile
 from domain.repositories.profile_repository import ProfileRepository
 from infrastructure.database.models.profile_model import ProfileModel
+from infrastructure.spatial.profile_spatial_index import profile_spatial_index
+from infrastructure.database.pagination import paginate
+from domain.repositories.pagination import PageRequest
 
 class ProfileRepositoryImpl(ProfileRepository):
     def __init__(self, session: Session):
@@ -26,11 +30,13 @@ class ProfileRepositoryImpl(ProfileRepository):
             telefone_movel=profile.telefone_movel,
             whatsapp=profile.whatsapp,
             latitude=profile.latitude,
-            longitude=profile.longitude
+            longitude=profile.longitude,
+            coordinates_source=profile.coordinates_source
         )
         self.session.add(db_profile)
         self.session.commit()
         self.session.refresh(db_profile)
+        profile_spatial_index.upsert(db_profile.id, db_profile.role_id, db_profile.latitude, db_profile.longitude)
         
         return Profile(
             id=db_profile.id,
@@ -50,6 +56,7 @@ class ProfileRepositoryImpl(ProfileRepository):
             whatsapp=db_profile.whatsapp,
             latitude=db_profile.latitude,
             longitude=db_profile.longitude,
+            coordinates_source=db_profile.coordinates_source,
             created_at=db_profile.created_at,
             updated_at=db_profile.updated_at
         )
@@ -78,6 +85,7 @@ class ProfileRepositoryImpl(ProfileRepository):
             whatsapp=db_profile.whatsapp,
             latitude=db_profile.latitude,
             longitude=db_profile.longitude,
+            coordinates_source=db_profile.coordinates_source,
             created_at=db_profile.created_at,
             updated_at=db_profile.updated_at
         )
@@ -104,12 +112,76 @@ class ProfileRepositoryImpl(ProfileRepository):
                 whatsapp=db_profile.whatsapp,
                 latitude=db_profile.latitude,
                 longitude=db_profile.longitude,
+                coordinates_source=db_profile.coordinates_source,
                 created_at=db_profile.created_at,
                 updated_at=db_profile.updated_at
             )
             for db_profile in db_profiles
         ]
 
+    def get_by_role_id_within_radius(self, role_id: int, latitude: float, longitude: float, radius_km: float) -> List[Profile]:
+        """Obter profiles de um role com coordenadas dentro de um raio, ordenados por distância"""
+        if not profile_spatial_index.is_loaded():
+            self._load_spatial_index()
+        
+        matches = profile_spatial_index.query(role_id, latitude, longitude, radius_km)
+        if not matches:
+            return []
+        
+        profile_ids = [profile_id for profile_id, _ in matches]
+        db_profiles = self.session.query(ProfileModel).filter(ProfileModel.id.in_(profile_ids)).all()
+        db_profiles_by_id = {db_profile.id: db_profile for db_profile in db_profiles}
+        
+        result = []
+        for profile_id in profile_ids:
+            db_profile = db_profiles_by_id.get(profile_id)
+            # Ignorar entradas desatualizadas (alteradas por outro processo)
+            if db_profile is None or db_profile.role_id != role_id or db_profile.latitude is None or db_profile.longitude is None:
+                continue
+            result.append(self.to_entity(db_profile))
+        return result
+
+    def get_by_role_id_without_coordinates(self, role_id: int) -> List[Profile]:
+        """Obter profiles de um role sem latitude/longitude cadastradas"""
+        db_profiles = self.session.query(ProfileModel).filter(
+            ProfileModel.role_id == role_id,
+            or_(ProfileModel.latitude.is_(None), ProfileModel.longitude.is_(None))
+        ).all()
+        return [self.to_entity(db_profile) for db_profile in db_profiles]
+
+    def get_without_coordinates(self, limit: int = 100, after_id: int = 0) -> List[Profile]:
+        """Obter profiles sem latitude/longitude, em ordem de ID, a partir de after_id"""
+        db_profiles = self.session.query(ProfileModel).filter(
+            ProfileModel.id > after_id,
+            or_(ProfileModel.latitude.is_(None), ProfileModel.longitude.is_(None))
+        ).order_by(ProfileModel.id).limit(limit).all()
+        return [self.to_entity(db_profile) for db_profile in db_profiles]
+
+    def bulk_update_coordinates(self, updates: List[Tuple[int, float, float, str]]) -> int:
+        """Gravar em massa as coordenadas resolvidas: (profile_id, latitude, longitude, origem)"""
+        if not updates:
+            return 0
+        
+        # UPDATE em massa por chave primária (executemany)
+        self.session.execute(
+            update(ProfileModel),
+            [
+                {"id": profile_id, "latitude": latitude, "longitude": longitude, "coordinates_source": source}
+                for profile_id, latitude, longitude, source in updates
+            ]
+        )
+        self.session.commit()
+        
+        roles = dict(
+            self.session.query(ProfileModel.id, ProfileModel.role_id).filter(
+                ProfileModel.id.in_([profile_id for profile_id, _, _, _ in updates])
+            ).all()
+        )
+        for profile_id, latitude, longitude, _ in updates:
+            if profile_id in roles:
+                profile_spatial_index.upsert(profile_id, roles[profile_id], latitude, longitude)
+        return len(roles)
+
     def get_by_user_id(self, user_id: int) -> Optional[Profile]:
         """Obter profile por user_id"""
         db_profile = self.session.query(ProfileModel).filter(ProfileModel.user_id == user_id).first()
@@ -134,13 +206,15 @@ class ProfileRepositoryImpl(ProfileRepository):
             whatsapp=db_profile.whatsapp,
             latitude=db_profile.latitude,
             longitude=db_profile.longitude,
+            coordinates_source=db_profile.coordinates_source,
             created_at=db_profile.created_at,
             updated_at=db_profile.updated_at
         )
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Profile]:
-        """Listar todos os profiles com paginação"""
-        db_profiles = self.session.query(ProfileModel).offset(skip).limit(limit).all()
+    def get_all(self, skip: int = 0, limit: int = 100, page: Optional[PageRequest] = None) -> List[Profile]:
+        """Listar todos os profiles com paginação (por cursor quando `page` é informado)"""
+        query = self.session.query(ProfileModel)
+        db_profiles = paginate(query, ProfileModel, page) if page else query.offset(skip).limit(limit).all()
         return [
             Profile(
                 id=db_profile.id,
@@ -160,6 +234,7 @@ class ProfileRepositoryImpl(ProfileRepository):
                 whatsapp=db_profile.whatsapp,
                 latitude=db_profile.latitude,
                 longitude=db_profile.longitude,
+                coordinates_source=db_profile.coordinates_source,
                 created_at=db_profile.created_at,
                 updated_at=db_profile.updated_at
             )
@@ -189,10 +264,12 @@ class ProfileRepositoryImpl(ProfileRepository):
         db_profile.whatsapp = profile.whatsapp
         db_profile.latitude = profile.latitude
         db_profile.longitude = profile.longitude
+        db_profile.coordinates_source = profile.coordinates_source
         db_profile.updated_at = profile.updated_at
         
         self.session.commit()
         self.session.refresh(db_profile)
+        profile_spatial_index.upsert(db_profile.id, db_profile.role_id, db_profile.latitude, db_profile.longitude)
         
         return Profile(
             id=db_profile.id,
@@ -212,6 +289,7 @@ class ProfileRepositoryImpl(ProfileRepository):
             whatsapp=db_profile.whatsapp,
             latitude=db_profile.latitude,
             longitude=db_profile.longitude,
+            coordinates_source=db_profile.coordinates_source,
             created_at=db_profile.created_at,
             updated_at=db_profile.updated_at
         )
@@ -224,4 +302,44 @@ class ProfileRepositoryImpl(ProfileRepository):
         
         self.session.delete(db_profile)
         self.session.commit()
-        return True 
\ No newline at end of file
+        profile_spatial_index.remove(profile_id)
+        return True
+
+    def _load_spatial_index(self) -> None:
+        """Carregar o índice espacial com as coordenadas de todos os profiles"""
+        rows = self.session.query(
+            ProfileModel.id,
+            ProfileModel.role_id,
+            ProfileModel.latitude,
+            ProfileModel.longitude
+        ).filter(
+            ProfileModel.latitude.isnot(None),
+            ProfileModel.longitude.isnot(None)
+        ).all()
+        profile_spatial_index.load(rows)
+
+    @staticmethod
+    def to_entity(db_profile: ProfileModel) -> Profile:
+        """Converter modelo do banco para entidade de domínio (também usado por consultas com join de outros repositórios)"""
+        return Profile(
+            id=db_profile.id,
+            user_id=db_profile.user_id,
+            role_id=db_profile.role_id,
+            full_name=db_profile.full_name,
+            artistic_name=db_profile.artistic_name,
+            bio=db_profile.bio,
+            cep=db_profile.cep,
+            logradouro=db_profile.logradouro,
+            numero=db_profile.numero,
+            complemento=db_profile.complemento,
+            cidade=db_profile.cidade,
+            uf=db_profile.uf,
+            telefone_fixo=db_profile.telefone_fixo,
+            telefone_movel=db_profile.telefone_movel,
+            whatsapp=db_profile.whatsapp,
+            latitude=db_profile.latitude,
+            longitude=db_profile.longitude,
+            coordinates_source=db_profile.coordinates_source,
+            created_at=db_profile.created_at,
+            updated_at=db_profile.updated_at
+        )
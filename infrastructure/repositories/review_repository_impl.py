@@ -1,13 +1,22 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Union, Iterator
 from datetime import datetime
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy import case, func, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from domain.repositories.review_repository import ReviewRepository
-from domain.entities.review import Review
+from domain.entities.review import Review, ProfileRatingSummary
 from infrastructure.database.models.review_model import ReviewModel
+from infrastructure.database.models.profile_rating_summary_model import ProfileRatingSummaryModel
 from infrastructure.database.models.profile_model import ProfileModel
 from infrastructure.database.models.space_event_type_model import SpaceEventTypeModel
 from infrastructure.database.models.space_festival_type_model import SpaceFestivalTypeModel
+from infrastructure.database.pagination import paginate, stream
+from domain.repositories.pagination import PageRequest
+
+# INSERT ... ON CONFLICT DO UPDATE por dialeto
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
 
 class ReviewRepositoryImpl(ReviewRepository):
     """Implementação do repositório para avaliações/reviews"""
@@ -54,6 +63,7 @@ class ReviewRepositoryImpl(ReviewRepository):
         )
         
         self.db.add(db_review)
+        self._apply_rating(review.profile_id, review.nota, 1)
         self.db.commit()
         self.db.refresh(db_review)
         
@@ -72,54 +82,54 @@ class ReviewRepositoryImpl(ReviewRepository):
             return review  # Retorna o modelo com relacionamentos carregados
         return self._to_entity(review)
     
-    def get_by_profile_id(self, profile_id: int, include_relations: bool = False) -> List[Union[Review, ReviewModel]]:
+    def get_by_profile_id(self, profile_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, ReviewModel]]:
         """Obter todas as avaliações de um profile"""
         query = self.db.query(ReviewModel).filter(ReviewModel.profile_id == profile_id)
         query = self._configure_relations(query, include_relations)
-        reviews = query.all()
+        reviews = paginate(query, ReviewModel, page)
         
         if include_relations:
             return reviews  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(review) for review in reviews]
     
-    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False) -> List[Union[Review, ReviewModel]]:
+    def get_by_space_event_type_id(self, space_event_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, ReviewModel]]:
         """Obter todas as avaliações de um space-event type"""
         query = self.db.query(ReviewModel).filter(ReviewModel.space_event_type_id == space_event_type_id)
         query = self._configure_relations(query, include_relations)
-        reviews = query.all()
+        reviews = paginate(query, ReviewModel, page)
         
         if include_relations:
             return reviews  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(review) for review in reviews]
     
-    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False) -> List[Union[Review, ReviewModel]]:
+    def get_by_space_festival_type_id(self, space_festival_type_id: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, ReviewModel]]:
         """Obter todas as avaliações de um space-festival type"""
         query = self.db.query(ReviewModel).filter(ReviewModel.space_festival_type_id == space_festival_type_id)
         query = self._configure_relations(query, include_relations)
-        reviews = query.all()
+        reviews = paginate(query, ReviewModel, page)
         
         if include_relations:
             return reviews  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(review) for review in reviews]
     
-    def get_by_nota(self, nota: int, include_relations: bool = False) -> List[Union[Review, ReviewModel]]:
+    def get_by_nota(self, nota: int, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, ReviewModel]]:
         """Obter todas as avaliações com uma nota específica"""
         query = self.db.query(ReviewModel).filter(ReviewModel.nota == nota)
         query = self._configure_relations(query, include_relations)
-        reviews = query.all()
+        reviews = paginate(query, ReviewModel, page)
         
         if include_relations:
             return reviews  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(review) for review in reviews]
     
-    def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False) -> List[Union[Review, ReviewModel]]:
+    def get_by_date_range(self, data_inicio: datetime, data_fim: datetime, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, ReviewModel]]:
         """Obter avaliações em um período"""
         query = self.db.query(ReviewModel).filter(
             ReviewModel.data_hora >= data_inicio,
             ReviewModel.data_hora <= data_fim
         )
         query = self._configure_relations(query, include_relations)
-        reviews = query.all()
+        reviews = paginate(query, ReviewModel, page)
         
         if include_relations:
             return reviews  # Retorna modelos com relacionamentos carregados
@@ -143,6 +153,11 @@ class ReviewRepositoryImpl(ReviewRepository):
             if not space_festival_type:
                 raise ValueError(f"Space-Festival Type com ID {review.space_festival_type_id} não encontrado")
         
+        # Atualizar o resumo de avaliações se a nota mudou
+        if review.nota and review.nota != db_review.nota:
+            self._apply_rating(db_review.profile_id, db_review.nota, -1)
+            self._apply_rating(db_review.profile_id, review.nota, 1)
+        
         # Atualizar os campos (profile_id não pode ser alterado)
         if review.data_hora:
             db_review.data_hora = review.data_hora
@@ -167,28 +182,127 @@ class ReviewRepositoryImpl(ReviewRepository):
         if not review:
             return False
         
+        self._apply_rating(review.profile_id, review.nota, -1)
         self.db.delete(review)
         self.db.commit()
         return True
     
-    def get_all(self, include_relations: bool = False) -> List[Union[Review, ReviewModel]]:
+    def get_all(self, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Review, ReviewModel]]:
         """Obter todas as avaliações"""
         query = self.db.query(ReviewModel)
         query = self._configure_relations(query, include_relations)
-        reviews = query.all()
+        reviews = paginate(query, ReviewModel, page)
         
         if include_relations:
             return reviews  # Retorna modelos com relacionamentos carregados
         return [self._to_entity(review) for review in reviews]
     
+    def iter_all(self, batch_size: int = 500) -> Iterator[Review]:
+        """Percorrer todas as avaliações em lotes, sem carregar a tabela inteira na memória"""
+        for review in stream(self.db.query(ReviewModel), ReviewModel, batch_size):
+            yield self._to_entity(review)
+    
     def get_average_rating_by_profile(self, profile_id: int) -> Optional[float]:
         """Obter a média de avaliações de um profile"""
-        result = self.db.query(func.avg(ReviewModel.nota)).filter(ReviewModel.profile_id == profile_id).scalar()
+        return self.get_rating_summary(profile_id).average_rating
+    
+    def get_rating_summary(self, profile_id: int) -> ProfileRatingSummary:
+        """Obter o resumo (quantidade, média e distribuição) das avaliações de um profile"""
+        return self.get_rating_summaries([profile_id])[profile_id]
+    
+    def get_rating_summaries(self, profile_ids: Sequence[int]) -> Dict[int, ProfileRatingSummary]:
+        """Obter, em uma única consulta, o resumo das avaliações de vários profiles"""
+        summaries = {profile_id: ProfileRatingSummary(profile_id=profile_id) for profile_id in profile_ids}
+        if not summaries:
+            return summaries
         
-        if result is None:
-            return None
+        models = self.db.query(ProfileRatingSummaryModel).filter(
+            ProfileRatingSummaryModel.profile_id.in_(summaries.keys())
+        ).all()
+        for model in models:
+            summaries[model.profile_id] = self._summary_to_entity(model)
+        
+        return summaries
+    
+    def rebuild_rating_summaries(self) -> int:
+        """
+        Recalcular todos os resumos a partir da tabela reviews
+        
+        Necessário apenas quando avaliações são gravadas fora deste repositório (ex.: scripts de carga).
+        
+        Returns:
+            Quantidade de profiles com avaliações
+        """
+        rows = self.db.query(
+            ReviewModel.profile_id,
+            func.count(ReviewModel.id),
+            func.sum(ReviewModel.nota),
+            *(func.sum(case((ReviewModel.nota == nota, 1), else_=0)) for nota in range(1, 6))
+        ).group_by(ReviewModel.profile_id).all()
         
-        return round(float(result), 2)
+        self.db.query(ProfileRatingSummaryModel).delete(synchronize_session=False)
+        for profile_id, total_reviews, soma_notas, *histograma in rows:
+            self.db.add(ProfileRatingSummaryModel(
+                profile_id=profile_id,
+                total_reviews=total_reviews,
+                soma_notas=soma_notas,
+                **{f"nota_{nota}": count for nota, count in zip(range(1, 6), histograma)}
+            ))
+        self.db.commit()
+        return len(rows)
+    
+    def _apply_rating(self, profile_id: int, nota: int, delta: int) -> None:
+        """Somar (delta=1) ou subtrair (delta=-1) uma nota no resumo do profile, na transação corrente"""
+        nota_column = getattr(ProfileRatingSummaryModel, f"nota_{nota}")
+        increments = {
+            "total_reviews": ProfileRatingSummaryModel.total_reviews + delta,
+            "soma_notas": ProfileRatingSummaryModel.soma_notas + delta * nota,
+            nota_column.key: nota_column + delta
+        }
+        
+        def apply_update():
+            return self.db.execute(
+                update(ProfileRatingSummaryModel)
+                .where(ProfileRatingSummaryModel.profile_id == profile_id)
+                .values(increments)
+                .execution_options(synchronize_session=False)
+            )
+        
+        if delta < 0:
+            apply_update()
+            return
+        
+        # Primeira avaliação do profile: criar a linha do resumo
+        first_rating = {
+            "profile_id": profile_id,
+            "total_reviews": delta,
+            "soma_notas": delta * nota,
+            **{f"nota_{value}": (delta if value == nota else 0) for value in range(1, 6)}
+        }
+        dialect_insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if dialect_insert is not None:
+            # INSERT ... ON CONFLICT DO UPDATE: duas primeiras avaliações simultâneas
+            # do profile não disputam a criação da linha
+            self.db.execute(dialect_insert(ProfileRatingSummaryModel).values(**first_rating).on_conflict_do_update(
+                index_elements=[ProfileRatingSummaryModel.profile_id],
+                set_={**increments, "updated_at": func.now()}
+            ))
+        elif apply_update().rowcount == 0:
+            # Sem ON CONFLICT: se outra transação criou a linha no meio tempo, repetir o UPDATE
+            try:
+                with self.db.begin_nested():
+                    self.db.add(ProfileRatingSummaryModel(**first_rating))
+            except IntegrityError:
+                apply_update()
+    
+    def _summary_to_entity(self, model: ProfileRatingSummaryModel) -> ProfileRatingSummary:
+        """Converter modelo de resumo para entidade"""
+        return ProfileRatingSummary(
+            profile_id=model.profile_id,
+            total_reviews=model.total_reviews,
+            soma_notas=model.soma_notas,
+            distribuicao={nota: getattr(model, f"nota_{nota}") for nota in range(1, 6)}
+        )
     
     def _to_entity(self, model: ReviewModel) -> Review:
         """Converter modelo para entidade"""
@@ -5,6 +5,9 @@ from domain.entities.space_event_type import SpaceEventType, StatusEventType
 from infrastructure.database.models.space_event_type_model import SpaceEventTypeModel
 from infrastructure.database.models.space_model import SpaceModel
 from infrastructure.database.models.event_type_model import EventTypeModel
+from infrastructure.repositories.space_repository_impl import refresh_contracting_events_count
+from infrastructure.database.pagination import paginate
+from domain.repositories.pagination import PageRequest
 
 class SpaceEventTypeRepositoryImpl(SpaceEventTypeRepository):
     """Implementação do repositório para o relacionamento N:N entre Spaces e Event Types"""
@@ -38,6 +41,7 @@ class SpaceEventTypeRepositoryImpl(SpaceEventTypeRepository):
         )
         
         self.db.add(db_space_event_type)
+        refresh_contracting_events_count(self.db, [db_space_event_type.space_id])
         self.db.commit()
         self.db.refresh(db_space_event_type)
         
@@ -54,28 +58,31 @@ class SpaceEventTypeRepositoryImpl(SpaceEventTypeRepository):
         
         return self._to_entity(relationship)
     
-    def get_by_space_id(self, space_id: int) -> List[SpaceEventType]:
+    def get_by_space_id(self, space_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os tipos de eventos de um espaço"""
-        relationships = self.db.query(SpaceEventTypeModel).filter(
+        query = self.db.query(SpaceEventTypeModel).filter(
             SpaceEventTypeModel.space_id == space_id
-        ).all()
+        )
+        relationships = paginate(query, SpaceEventTypeModel, page)
         
         return [self._to_entity(rel) for rel in relationships]
     
-    def get_by_event_type_id(self, event_type_id: int) -> List[SpaceEventType]:
+    def get_by_event_type_id(self, event_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os espaços de um tipo de evento"""
-        relationships = self.db.query(SpaceEventTypeModel).filter(
+        query = self.db.query(SpaceEventTypeModel).filter(
             SpaceEventTypeModel.event_type_id == event_type_id
-        ).all()
+        )
+        relationships = paginate(query, SpaceEventTypeModel, page)
         
         return [self._to_entity(rel) for rel in relationships]
     
-    def get_by_space_and_event_type(self, space_id: int, event_type_id: int) -> List[SpaceEventType]:
+    def get_by_space_and_event_type(self, space_id: int, event_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter relacionamentos específicos entre espaço e tipo de evento"""
-        relationships = self.db.query(SpaceEventTypeModel).filter(
+        query = self.db.query(SpaceEventTypeModel).filter(
             SpaceEventTypeModel.space_id == space_id,
             SpaceEventTypeModel.event_type_id == event_type_id
-        ).all()
+        )
+        relationships = paginate(query, SpaceEventTypeModel, page)
         
         return [self._to_entity(rel) for rel in relationships]
     
@@ -104,6 +111,7 @@ class SpaceEventTypeRepositoryImpl(SpaceEventTypeRepository):
         if space_event_type.horario:
             db_relationship.horario = space_event_type.horario
         
+        refresh_contracting_events_count(self.db, [db_relationship.space_id])
         self.db.commit()
         self.db.refresh(db_relationship)
         
@@ -119,6 +127,7 @@ class SpaceEventTypeRepositoryImpl(SpaceEventTypeRepository):
             return None
         
         db_relationship.status = status
+        refresh_contracting_events_count(self.db, [db_relationship.space_id])
         self.db.commit()
         self.db.refresh(db_relationship)
         
@@ -134,6 +143,7 @@ class SpaceEventTypeRepositoryImpl(SpaceEventTypeRepository):
             return False
         
         self.db.delete(relationship)
+        refresh_contracting_events_count(self.db, [relationship.space_id])
         self.db.commit()
         return True
     
@@ -143,21 +153,29 @@ class SpaceEventTypeRepositoryImpl(SpaceEventTypeRepository):
             SpaceEventTypeModel.space_id == space_id
         ).delete()
         
+        refresh_contracting_events_count(self.db, [space_id])
         self.db.commit()
         return deleted_count > 0
     
     def delete_by_event_type_id(self, event_type_id: int) -> bool:
         """Deletar todos os relacionamentos de um tipo de evento"""
+        space_ids = [
+            space_id for (space_id,) in self.db.query(SpaceEventTypeModel.space_id).filter(
+                SpaceEventTypeModel.event_type_id == event_type_id
+            ).distinct()
+        ]
         deleted_count = self.db.query(SpaceEventTypeModel).filter(
             SpaceEventTypeModel.event_type_id == event_type_id
         ).delete()
         
+        refresh_contracting_events_count(self.db, space_ids)
         self.db.commit()
         return deleted_count > 0
     
-    def get_all(self) -> List[SpaceEventType]:
+    def get_all(self, page: Optional[PageRequest] = None) -> List[SpaceEventType]:
         """Obter todos os relacionamentos"""
-        relationships = self.db.query(SpaceEventTypeModel).all()
+        query = self.db.query(SpaceEventTypeModel)
+        relationships = paginate(query, SpaceEventTypeModel, page)
         return [self._to_entity(rel) for rel in relationships]
     
     def get_by_space_id_and_status(self, space_id: int, status: StatusEventType) -> List[SpaceEventType]:
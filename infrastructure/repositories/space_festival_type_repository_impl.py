@@ -5,6 +5,9 @@ from domain.entities.space_festival_type import SpaceFestivalType, StatusFestiva
 from infrastructure.database.models.space_festival_type_model import SpaceFestivalTypeModel
 from infrastructure.database.models.space_model import SpaceModel
 from infrastructure.database.models.festival_type_model import FestivalTypeModel
+from infrastructure.repositories.space_repository_impl import refresh_contracting_events_count
+from infrastructure.database.pagination import paginate
+from domain.repositories.pagination import PageRequest
 
 class SpaceFestivalTypeRepositoryImpl(SpaceFestivalTypeRepository):
     """Implementação do repositório para o relacionamento N:N entre Spaces e Festival Types"""
@@ -38,6 +41,7 @@ class SpaceFestivalTypeRepositoryImpl(SpaceFestivalTypeRepository):
         )
         
         self.db.add(db_space_festival_type)
+        refresh_contracting_events_count(self.db, [db_space_festival_type.space_id])
         self.db.commit()
         self.db.refresh(db_space_festival_type)
         
@@ -54,28 +58,31 @@ class SpaceFestivalTypeRepositoryImpl(SpaceFestivalTypeRepository):
         
         return self._to_entity(relationship)
     
-    def get_by_space_id(self, space_id: int) -> List[SpaceFestivalType]:
+    def get_by_space_id(self, space_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os tipos de festivais de um espaço"""
-        relationships = self.db.query(SpaceFestivalTypeModel).filter(
+        query = self.db.query(SpaceFestivalTypeModel).filter(
             SpaceFestivalTypeModel.space_id == space_id
-        ).all()
+        )
+        relationships = paginate(query, SpaceFestivalTypeModel, page)
         
         return [self._to_entity(rel) for rel in relationships]
     
-    def get_by_festival_type_id(self, festival_type_id: int) -> List[SpaceFestivalType]:
+    def get_by_festival_type_id(self, festival_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os espaços de um tipo de festival"""
-        relationships = self.db.query(SpaceFestivalTypeModel).filter(
+        query = self.db.query(SpaceFestivalTypeModel).filter(
             SpaceFestivalTypeModel.festival_type_id == festival_type_id
-        ).all()
+        )
+        relationships = paginate(query, SpaceFestivalTypeModel, page)
         
         return [self._to_entity(rel) for rel in relationships]
     
-    def get_by_space_and_festival_type(self, space_id: int, festival_type_id: int) -> List[SpaceFestivalType]:
+    def get_by_space_and_festival_type(self, space_id: int, festival_type_id: int, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter relacionamentos específicos entre espaço e tipo de festival"""
-        relationships = self.db.query(SpaceFestivalTypeModel).filter(
+        query = self.db.query(SpaceFestivalTypeModel).filter(
             SpaceFestivalTypeModel.space_id == space_id,
             SpaceFestivalTypeModel.festival_type_id == festival_type_id
-        ).all()
+        )
+        relationships = paginate(query, SpaceFestivalTypeModel, page)
         
         return [self._to_entity(rel) for rel in relationships]
     
@@ -104,6 +111,7 @@ class SpaceFestivalTypeRepositoryImpl(SpaceFestivalTypeRepository):
         if space_festival_type.horario:
             db_relationship.horario = space_festival_type.horario
         
+        refresh_contracting_events_count(self.db, [db_relationship.space_id])
         self.db.commit()
         self.db.refresh(db_relationship)
         
@@ -119,6 +127,7 @@ class SpaceFestivalTypeRepositoryImpl(SpaceFestivalTypeRepository):
             return None
         
         db_relationship.status = status
+        refresh_contracting_events_count(self.db, [db_relationship.space_id])
         self.db.commit()
         self.db.refresh(db_relationship)
         
@@ -134,6 +143,7 @@ class SpaceFestivalTypeRepositoryImpl(SpaceFestivalTypeRepository):
             return False
         
         self.db.delete(relationship)
+        refresh_contracting_events_count(self.db, [relationship.space_id])
         self.db.commit()
         return True
     
@@ -143,21 +153,29 @@ class SpaceFestivalTypeRepositoryImpl(SpaceFestivalTypeRepository):
             SpaceFestivalTypeModel.space_id == space_id
         ).delete()
         
+        refresh_contracting_events_count(self.db, [space_id])
         self.db.commit()
         return deleted_count > 0
     
     def delete_by_festival_type_id(self, festival_type_id: int) -> bool:
         """Deletar todos os relacionamentos de um tipo de festival"""
+        space_ids = [
+            space_id for (space_id,) in self.db.query(SpaceFestivalTypeModel.space_id).filter(
+                SpaceFestivalTypeModel.festival_type_id == festival_type_id
+            ).distinct()
+        ]
         deleted_count = self.db.query(SpaceFestivalTypeModel).filter(
             SpaceFestivalTypeModel.festival_type_id == festival_type_id
         ).delete()
         
+        refresh_contracting_events_count(self.db, space_ids)
         self.db.commit()
         return deleted_count > 0
     
-    def get_all(self) -> List[SpaceFestivalType]:
+    def get_all(self, page: Optional[PageRequest] = None) -> List[SpaceFestivalType]:
         """Obter todos os relacionamentos"""
-        relationships = self.db.query(SpaceFestivalTypeModel).all()
+        query = self.db.query(SpaceFestivalTypeModel)
+        relationships = paginate(query, SpaceFestivalTypeModel, page)
         return [self._to_entity(rel) for rel in relationships]
     
     def get_by_space_id_and_status(self, space_id: int, status: StatusFestivalType) -> List[SpaceFestivalType]:
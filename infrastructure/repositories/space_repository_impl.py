@@ -1,8 +1,42 @@
-from typing import List, Optional, Union
+from typing import Iterable, List, Optional, Union
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 from domain.entities.space import Space
+from domain.entities.space_event_type import StatusEventType
+from domain.entities.space_festival_type import StatusFestivalType
 from domain.repositories.space_repository import SpaceRepository
 from infrastructure.database.models.space_model import SpaceModel
+from infrastructure.database.models.space_event_type_model import SpaceEventTypeModel
+from infrastructure.database.models.space_festival_type_model import SpaceFestivalTypeModel
+from infrastructure.database.pagination import paginate
+from domain.repositories.pagination import PageRequest
+
+def refresh_contracting_events_count(db: Session, space_ids: Iterable[int]) -> None:
+    """
+    Recalcula spaces.contracting_events_count (eventos + festivais CONTRATANDO) dos espaços
+    informados com um único UPDATE. Não faz commit: deve ser chamado na mesma transação
+    da escrita em space_event_types/space_festival_types.
+    """
+    space_ids = {space_id for space_id in space_ids if space_id is not None}
+    if not space_ids:
+        return
+    
+    # Garantir que inserts/deletes pendentes sejam considerados na contagem
+    db.flush()
+    
+    events_count = select(func.count(SpaceEventTypeModel.id)).where(
+        SpaceEventTypeModel.space_id == SpaceModel.id,
+        SpaceEventTypeModel.status == StatusEventType.CONTRATANDO
+    ).scalar_subquery()
+    festivals_count = select(func.count(SpaceFestivalTypeModel.id)).where(
+        SpaceFestivalTypeModel.space_id == SpaceModel.id,
+        SpaceFestivalTypeModel.status == StatusFestivalType.CONTRATANDO
+    ).scalar_subquery()
+    
+    db.query(SpaceModel).filter(SpaceModel.id.in_(space_ids)).update(
+        {SpaceModel.contracting_events_count: events_count + festivals_count},
+        synchronize_session=False
+    )
 
 class SpaceRepositoryImpl(SpaceRepository):
     def __init__(self, db: Session):
@@ -131,7 +165,19 @@ class SpaceRepositoryImpl(SpaceRepository):
         else:
             return [self._to_entity(db_space) for db_space in db_spaces]
 
-    def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False) -> List[Union[Space, SpaceModel]]:
+    def get_contracting_by_profile_ids(self, profile_ids: List[int]) -> List[Space]:
+        """Obter os espaços dos profiles informados com eventos/festivais CONTRATANDO"""
+        if not profile_ids:
+            return []
+        
+        db_spaces = self.db.query(SpaceModel).filter(
+            SpaceModel.profile_id.in_(set(profile_ids)),
+            SpaceModel.contracting_events_count > 0
+        ).order_by(SpaceModel.id).all()
+        
+        return [self._to_entity(db_space) for db_space in db_spaces]
+
+    def get_all(self, skip: int = 0, limit: int = 100, include_relations: bool = False, page: Optional[PageRequest] = None) -> List[Union[Space, SpaceModel]]:
         query = self.db.query(SpaceModel)
         
         if include_relations:
@@ -142,7 +188,7 @@ class SpaceRepositoryImpl(SpaceRepository):
                 joinedload(SpaceModel.festival_type)
             )
         
-        db_spaces = query.offset(skip).limit(limit).all()
+        db_spaces = paginate(query, SpaceModel, page) if page else query.offset(skip).limit(limit).all()
         
         # Se include_relations=True, retornar os modelos do banco diretamente
         if include_relations:
@@ -3,6 +3,9 @@ from sqlalchemy.orm import Session
 from domain.entities.user import User
 from domain.repositories.user_repository import UserRepository
 from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.pagination import paginate
+from infrastructure.cache.principal_cache import invalidate_principal
+from domain.repositories.pagination import PageRequest
 
 class UserRepositoryImpl(UserRepository):
     def __init__(self, session: Session):
@@ -62,9 +65,10 @@ class UserRepositoryImpl(UserRepository):
             updated_at=db_user.updated_at
         )
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """Listar todos os usuários com paginação"""
-        db_users = self.session.query(UserModel).offset(skip).limit(limit).all()
+    def get_all(self, skip: int = 0, limit: int = 100, page: Optional[PageRequest] = None) -> List[User]:
+        """Listar todos os usuários com paginação (por cursor quando `page` é informado)"""
+        query = self.session.query(UserModel)
+        db_users = paginate(query, UserModel, page) if page else query.offset(skip).limit(limit).all()
         return [
             User(
                 id=db_user.id,
@@ -91,6 +95,8 @@ class UserRepositoryImpl(UserRepository):
         db_user.updated_at = user.updated_at
         
         self.session.commit()
+        # O principal em cache (get_current_user) inclui is_active, nome e email
+        invalidate_principal(db_user.id)
         self.session.refresh(db_user)
         
         return User(
@@ -103,6 +109,15 @@ class UserRepositoryImpl(UserRepository):
             updated_at=db_user.updated_at
         )
 
+    def update_password(self, user_id: int, password: str, current_password: str) -> bool:
+        """Trocar o hash da senha, se o atual ainda for `current_password` (sem sobrescrever troca concorrente)"""
+        updated = self.session.query(UserModel).filter(
+            UserModel.id == user_id,
+            UserModel.password == current_password
+        ).update({UserModel.password: password}, synchronize_session=False)
+        self.session.commit()
+        return updated > 0
+
     def delete(self, user_id: int) -> bool:
         """Deletar usuário por ID"""
         db_user = self.session.query(UserModel).filter(UserModel.id == user_id).first()
@@ -111,4 +126,5 @@ class UserRepositoryImpl(UserRepository):
         
         self.session.delete(db_user)
         self.session.commit()
+        invalidate_principal(user_id)
         return True 
\ No newline at end of file
@@ -0,0 +1,3 @@
+# Módulo de índices espaciais em memória
+from .profile_spatial_index import ProfileSpatialIndex, profile_spatial_index
+from .cep_gazetteer import CepGazetteer
@@ -0,0 +1,132 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from domain.entities.cep_coordinates import CepCoordinates
+from infrastructure.spatial.geo import bounding_box, haversine_km
+
+class CepGazetteer:
+    """
+    Cópia imutável, em memória, da tabela de coordenadas de municípios
+
+    Os dados ficam em arrays paralelos (nomes, UFs e coordenadas em NumPy), com:
+    - índice exato (cidade_normalizada, uf) -> posição;
+    - índice de trigramas para buscas parciais (equivalente ao LIKE '%nome%');
+    - latitudes ordenadas para buscas por raio via busca binária.
+
+    Não há escrita: para refletir alterações da tabela, uma nova instância é
+    construída e substitui a anterior.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, str, str, float, float]]):
+        """
+        Args:
+            rows: Tuplas (cidade, uf, cidade_normalizada, latitude, longitude), na
+                ordem em que as buscas parciais devem retornar os resultados
+        """
+        cidades, ufs, normalizadas, latitudes, longitudes = [], [], [], [], []
+        for cidade, uf, cidade_normalizada, latitude, longitude in rows:
+            cidades.append(cidade)
+            ufs.append(uf)
+            normalizadas.append(cidade_normalizada)
+            latitudes.append(latitude)
+            longitudes.append(longitude)
+
+        self._cidades: Tuple[str, ...] = tuple(cidades)
+        self._ufs: Tuple[str, ...] = tuple(ufs)
+        self._normalizadas: Tuple[str, ...] = tuple(normalizadas)
+        self._latitudes = np.asarray(latitudes, dtype=np.float64)
+        self._longitudes = np.asarray(longitudes, dtype=np.float64)
+
+        self._exact: Dict[Tuple[str, str], int] = {}
+        trigrams: Dict[str, List[int]] = {}
+        for position, (cidade_normalizada, uf) in enumerate(zip(normalizadas, ufs)):
+            self._exact.setdefault((cidade_normalizada, uf), position)
+            for trigram in self._trigrams(cidade_normalizada):
+                trigrams.setdefault(trigram, []).append(position)
+        self._trigram_index: Dict[str, Tuple[int, ...]] = {
+            trigram: tuple(postings) for trigram, postings in trigrams.items()
+        }
+
+        # Posições ordenadas por latitude, para recortar a faixa do bounding box
+        self._lat_order = np.argsort(self._latitudes, kind="stable")
+        self._sorted_latitudes = self._latitudes[self._lat_order]
+
+    @staticmethod
+    def _trigrams(text: str) -> set:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def __len__(self) -> int:
+        return len(self._cidades)
+
+    def _entity(self, position: int) -> CepCoordinates:
+        return CepCoordinates(
+            cidade=self._cidades[position],
+            uf=self._ufs[position],
+            latitude=float(self._latitudes[position]),
+            longitude=float(self._longitudes[position])
+        )
+
+    def get_by_cidade_uf(self, cidade_normalizada: str, uf: str) -> Optional[CepCoordinates]:
+        """Busca exata por cidade normalizada e UF"""
+        position = self._exact.get((cidade_normalizada, uf))
+        return self._entity(position) if position is not None else None
+
+    def search_by_cidade(self, cidade_normalizada: str, uf: Optional[str] = None, limit: int = 20) -> List[CepCoordinates]:
+        """
+        Busca parcial (nome contém o texto) por cidade normalizada
+
+        Args:
+            cidade_normalizada: Texto já normalizado (sem acentos, maiúsculas)
+            uf: Restringe os resultados a uma UF
+            limit: Limite de resultados
+
+        Returns:
+            Municípios encontrados, na ordem de carga
+        """
+        trigrams = self._trigrams(cidade_normalizada)
+        if trigrams:
+            # Interseção das listas de posições, começando pela menor
+            postings = sorted((self._trigram_index.get(trigram, ()) for trigram in trigrams), key=len)
+            candidates = set(postings[0])
+            for other in postings[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(other)
+            candidates = sorted(candidates)
+        else:
+            # Texto curto demais para trigramas: percorrer os nomes
+            candidates = range(len(self._cidades))
+
+        results = []
+        for position in candidates:
+            if uf is not None and self._ufs[position] != uf:
+                continue
+            if cidade_normalizada in self._normalizadas[position]:
+                results.append(self._entity(position))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def get_nearby_cities_with_distance(self, latitude: float, longitude: float, radius_km: float = 50) -> List[Tuple[CepCoordinates, float]]:
+        """
+        Busca municípios dentro de um raio
+
+        Returns:
+            Lista de (coordenadas, distancia_km) ordenada por distância
+        """
+        min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+        start = int(np.searchsorted(self._sorted_latitudes, min_lat, side="left"))
+        end = int(np.searchsorted(self._sorted_latitudes, max_lat, side="right"))
+        band = self._lat_order[start:end]
+        band_longitudes = self._longitudes[band]
+        candidates = band[(band_longitudes >= min_lng) & (band_longitudes <= max_lng)]
+
+        nearby_cities = []
+        for position in candidates.tolist():
+            distance_km = haversine_km(
+                latitude, longitude, float(self._latitudes[position]), float(self._longitudes[position])
+            )
+            if distance_km <= radius_km:
+                nearby_cities.append((self._entity(position), distance_km))
+
+        nearby_cities.sort(key=lambda item: item[1])
+        return nearby_cities
@@ -0,0 +1,37 @@
+import math
+from typing import Tuple
+
+# Raio médio da Terra em quilômetros
+EARTH_RADIUS_KM = 6371.0
+
+# Quilômetros por grau de latitude
+KM_PER_DEGREE = 111.195
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Distância em quilômetros entre dois pontos (fórmula de Haversine)"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    Calcula o retângulo lat/lng que contém o círculo de raio `radius_km`
+
+    Returns:
+        Tupla (min_lat, max_lat, min_lng, max_lng), limitada aos intervalos válidos
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    cos_lat = math.cos(math.radians(latitude))
+    if cos_lat > 1e-6:
+        dlng = min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+    else:
+        dlng = 180.0
+    return (
+        max(latitude - dlat, -90.0),
+        min(latitude + dlat, 90.0),
+        max(longitude - dlng, -180.0),
+        min(longitude + dlng, 180.0)
+    )
@@ -0,0 +1,153 @@
+import math
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from infrastructure.spatial.geo import bounding_box, haversine_km
+
+class ProfileSpatialIndex:
+    """
+    Índice espacial em memória (grade regular lat/lng) sobre as coordenadas dos profiles
+
+    Cada profile com latitude/longitude é registrado em uma célula da grade, separada
+    por role_id. Uma busca por raio visita apenas as células que cobrem o bounding box
+    do círculo e refina os candidatos com Haversine, evitando percorrer todos os
+    profiles do role.
+
+    O índice é carregado sob demanda a partir do banco e mantido atualizado pelas
+    operações de escrita do ProfileRepositoryImpl. Como é local ao processo, ele é
+    recarregado após `max_age_seconds` para absorver escritas feitas por outros workers.
+    """
+
+    def __init__(self, cell_size_deg: float = 0.25, max_age_seconds: Optional[float] = 300):
+        self.cell_size_deg = cell_size_deg
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.RLock()
+        # (role_id, célula_lat, célula_lng) -> ids dos profiles
+        self._cells: Dict[Tuple[int, int, int], Set[int]] = {}
+        # profile_id -> (role_id, latitude, longitude)
+        self._entries: Dict[int, Tuple[int, float, float]] = {}
+        self._role_counts: Dict[int, int] = {}
+        self._loaded_at: Optional[float] = None
+
+    def _cell_of(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        """Obter a célula da grade que contém o ponto"""
+        return (
+            int(math.floor(latitude / self.cell_size_deg)),
+            int(math.floor(longitude / self.cell_size_deg))
+        )
+
+    def is_loaded(self) -> bool:
+        """Verifica se o índice está carregado e dentro do prazo de validade"""
+        with self._lock:
+            if self._loaded_at is None:
+                return False
+            if self.max_age_seconds is not None and time.monotonic() - self._loaded_at > self.max_age_seconds:
+                return False
+            return True
+
+    def load(self, entries: Iterable[Tuple[int, int, Optional[float], Optional[float]]]) -> None:
+        """
+        (Re)constrói o índice a partir de tuplas (profile_id, role_id, latitude, longitude)
+        """
+        with self._lock:
+            self._cells = {}
+            self._entries = {}
+            self._role_counts = {}
+            for profile_id, role_id, latitude, longitude in entries:
+                self._insert(profile_id, role_id, latitude, longitude)
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Descarta o conteúdo do índice, forçando nova carga na próxima busca"""
+        with self._lock:
+            self._cells = {}
+            self._entries = {}
+            self._role_counts = {}
+            self._loaded_at = None
+
+    def upsert(self, profile_id: int, role_id: int, latitude: Optional[float], longitude: Optional[float]) -> None:
+        """Inserir ou atualizar um profile; sem coordenadas o profile sai do índice"""
+        with self._lock:
+            self._remove(profile_id)
+            self._insert(profile_id, role_id, latitude, longitude)
+
+    def remove(self, profile_id: int) -> None:
+        """Remover um profile do índice"""
+        with self._lock:
+            self._remove(profile_id)
+
+    def query(self, role_id: int, latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, float]]:
+        """
+        Busca profiles de um role dentro de um raio
+
+        Args:
+            role_id: Role dos profiles buscados
+            latitude, longitude: Coordenadas do ponto central
+            radius_km: Raio de busca em quilômetros
+
+        Returns:
+            Lista de (profile_id, distancia_km) ordenada por distância
+        """
+        if radius_km is None or radius_km < 0:
+            return []
+
+        min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+        min_i, min_j = self._cell_of(min_lat, min_lng)
+        max_i, max_j = self._cell_of(max_lat, max_lng)
+
+        results = []
+        with self._lock:
+            cell_count = (max_i - min_i + 1) * (max_j - min_j + 1)
+            if cell_count > self._role_counts.get(role_id, 0):
+                # Raio grande demais: percorrer as entradas sai mais barato que as células
+                candidates = [
+                    profile_id for profile_id, entry in self._entries.items() if entry[0] == role_id
+                ]
+            else:
+                candidates = []
+                for i in range(min_i, max_i + 1):
+                    for j in range(min_j, max_j + 1):
+                        cell = self._cells.get((role_id, i, j))
+                        if cell:
+                            candidates.extend(cell)
+
+            for profile_id in candidates:
+                _, entry_lat, entry_lng = self._entries[profile_id]
+                distance = haversine_km(latitude, longitude, entry_lat, entry_lng)
+                if distance <= radius_km:
+                    results.append((profile_id, distance))
+
+        results.sort(key=lambda item: item[1])
+        return results
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _insert(self, profile_id: int, role_id: int, latitude: Optional[float], longitude: Optional[float]) -> None:
+        if latitude is None or longitude is None:
+            return
+        i, j = self._cell_of(latitude, longitude)
+        self._cells.setdefault((role_id, i, j), set()).add(profile_id)
+        self._entries[profile_id] = (role_id, latitude, longitude)
+        self._role_counts[role_id] = self._role_counts.get(role_id, 0) + 1
+
+    def _remove(self, profile_id: int) -> None:
+        entry = self._entries.pop(profile_id, None)
+        if entry is None:
+            return
+        role_id, latitude, longitude = entry
+        i, j = self._cell_of(latitude, longitude)
+        cell = self._cells.get((role_id, i, j))
+        if cell is not None:
+            cell.discard(profile_id)
+            if not cell:
+                del self._cells[(role_id, i, j)]
+        self._role_counts[role_id] -= 1
+
+# Instância compartilhada pelo processo
+profile_spatial_index = ProfileSpatialIndex(
+    cell_size_deg=float(os.getenv("PROFILE_SPATIAL_INDEX_CELL_DEG", "0.25")),
+    max_age_seconds=float(os.getenv("PROFILE_SPATIAL_INDEX_MAX_AGE_SECONDS", "300"))
+)
@@ -6,6 +6,7 @@ Script para popular a tabela reviews seguindo as regras de negócio implementada
 from datetime import datetime, timedelta
 from infrastructure.database.database import SessionLocal
 from infrastructure.database.models.review_model import ReviewModel
+from infrastructure.repositories.review_repository_impl import ReviewRepositoryImpl
 
 def main():
     db = SessionLocal()
@@ -115,6 +116,9 @@ def main():
         db.add(review)
     
     db.commit()
+    
+    # Recalcular o resumo de avaliações por profile
+    ReviewRepositoryImpl(db).rebuild_rating_summaries()
     db.close()
     
     print(f"✅ {len(reviews_data)} reviews criados com sucesso!")
@@ -4,7 +4,10 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from infrastructure.database.database import Base, get_database_session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
+from infrastructure.database.database import Base, get_database_session, get_read_database_session, get_async_database_session
+from infrastructure.cache.principal_cache import principal_cache
 from app.main import app
 from app.core.auth import get_current_active_user
 from datetime import datetime, timedelta
@@ -24,6 +27,15 @@ def override_get_db():
     finally:
         db.close()
 
+# Mesmo arquivo de banco pelo driver assíncrono (aiosqlite); sem pool, pois cada
+# TestClient usa o seu próprio event loop
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{_db_path}", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
 def mock_get_current_active_user():
     from app.schemas.user import UserResponse
     return UserResponse(
@@ -219,13 +231,23 @@ def client(setup_database, db_session):
         print(f"Erro ao criar tabelas no client fixture: {e}")
         raise
     
+    # Testes que recriam as tabelas reaproveitam ids de usuários sem passar pelo repositório
+    principal_cache.clear()
     app.dependency_overrides[get_database_session] = override_get_db
+    app.dependency_overrides[get_read_database_session] = override_get_db
+    app.dependency_overrides[get_async_database_session] = override_get_async_db
     # Não usar mock para get_current_active_user nos testes de integração
     # app.dependency_overrides[get_current_active_user] = mock_get_current_active_user
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
+@pytest.fixture(scope="function")
+def authenticated_client(client):
+    """Cliente de teste com o usuário autenticado simulado (get_current_active_user)"""
+    app.dependency_overrides[get_current_active_user] = mock_get_current_active_user
+    yield client
+
 @pytest.fixture
 def auth_headers():
     return {"Authorization": "Bearer mock_token"}
@@ -0,0 +1,75 @@
+import asyncio
+import importlib
+import inspect
+from tests.conftest import TestingAsyncSessionLocal
+
+REPOSITORIES = ["profile", "artist", "space", "booking", "interest", "review"]
+
+def test_async_repositories_cover_domain_interfaces():
+    """Testa que cada repositório assíncrono oferece todos os métodos da interface (exceto iter_all)"""
+    for name in REPOSITORIES:
+        class_name = "".join(part.capitalize() for part in name.split("_"))
+        interface = getattr(importlib.import_module(f"domain.repositories.{name}_repository"), f"{class_name}Repository")
+        implementation = getattr(
+            importlib.import_module(f"infrastructure.repositories.async_{name}_repository_impl"),
+            f"Async{class_name}RepositoryImpl"
+        )
+
+        missing = [
+            method for method in interface.__abstractmethods__ - {"iter_all"}
+            if not inspect.iscoroutinefunction(getattr(implementation, method, None))
+        ]
+        assert missing == [], f"{implementation.__name__} sem {missing}"
+
+def test_async_review_repository_matches_sync_under_concurrency(setup_database, db_session):
+    """Testa leituras concorrentes pelo aiosqlite com os mesmos resultados do driver síncrono"""
+    from domain.entities.review import Review
+    from infrastructure.database.models.profile_model import ProfileModel
+    from infrastructure.repositories.review_repository_impl import ReviewRepositoryImpl
+    from infrastructure.repositories.async_review_repository_impl import AsyncReviewRepositoryImpl
+
+    profile = ProfileModel(
+        user_id=1, role_id=2, full_name="Avaliado Async", artistic_name="Avaliado Async", bio="Bio",
+        cep="01234-567", logradouro="Rua", numero="1", cidade="São Paulo", uf="SP", telefone_movel="11999999999"
+    )
+    db_session.add(profile)
+    db_session.commit()
+    sync_repository = ReviewRepositoryImpl(db_session)
+    created = [
+        sync_repository.create(Review(profile_id=profile.id, nota=nota, depoimento="Apresentação muito boa, recomendo."))
+        for nota in (5, 4, 4)
+    ]
+
+    async def read():
+        async with TestingAsyncSessionLocal() as session:
+            repository = AsyncReviewRepositoryImpl(session)
+            return await repository.get_rating_summary(profile.id), await repository.get_by_profile_id(profile.id)
+
+    async def run():
+        return await asyncio.gather(*(read() for _ in range(20)))
+
+    try:
+        results = asyncio.run(run())
+        assert len(results) == 20
+        for summary, reviews in results:
+            assert (summary.total_reviews, summary.average_rating) == (3, 4.33)
+            assert sorted(review.id for review in reviews) == sorted(review.id for review in created)
+    finally:
+        for review in created:
+            sync_repository.delete(review.id)
+        db_session.delete(profile)
+        db_session.commit()
+
+def test_async_endpoints_use_async_session(authenticated_client):
+    """Testa os endpoints de leitura servidos pela sessão assíncrona"""
+    response = authenticated_client.get("/api/v1/profiles/1")
+    assert response.status_code == 200
+    assert response.json()["id"] == 1
+    assert authenticated_client.get("/api/v1/profiles/999999").status_code == 404
+
+    response = authenticated_client.get("/api/v1/reviews/profiles/ratings", params={"profile_ids": [999999, 999999]})
+    assert response.status_code == 200
+    assert response.json() == {"items": [{
+        "profile_id": 999999, "average_rating": None, "total_reviews": 0,
+        "distribuicao": {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}
+    }]}
@@ -52,4 +52,168 @@ def test_login_invalid_credentials(client: TestClient):
     }
     
     response = client.post("/api/v1/auth/login", json=login_data)
-    assert response.status_code == 401 
\ No newline at end of file
+    assert response.status_code == 401
+
+
+def test_authenticated_user_is_cached_until_updated(client: TestClient):
+    """Teste do cache do usuário autenticado: sem SELECT em users até a alteração do usuário"""
+    from sqlalchemy import event
+    from tests.conftest import engine
+
+    response = client.post("/api/v1/auth/register", json={
+        "name": "Cache Auth", "email": "cache.auth@example.com", "password": "senha123"
+    })
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    user_queries = []
+
+    def count_user_queries(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            user_queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count_user_queries)
+    try:
+        me = client.get("/api/v1/users/me", headers=headers)
+        assert me.status_code == 200
+        assert len(user_queries) == 1
+        assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+        assert len(user_queries) == 1
+
+        # Desativar o usuário invalida o cache: a próxima requisição já o vê inativo
+        user_id = me.json()["id"]
+        assert client.put(f"/api/v1/users/{user_id}", json={"is_active": False}, headers=headers).status_code == 200
+        assert client.get("/api/v1/users/me", headers=headers).status_code == 400
+    finally:
+        event.remove(engine, "before_cursor_execute", count_user_queries)
+
+def test_logout_revokes_token_by_jti(client: TestClient):
+    """Teste do logout: o token revogado é recusado e os demais continuam válidos"""
+    client.post("/api/v1/auth/register", json={
+        "name": "Logout Auth", "email": "logout.auth@example.com", "password": "senha123"
+    })
+    login = {"email": "logout.auth@example.com", "password": "senha123"}
+    first = client.post("/api/v1/auth/login", json=login).json()
+    second = client.post("/api/v1/auth/login", json=login).json()
+    assert first["access_token"] != second["access_token"]
+
+    headers = {"Authorization": f"Bearer {first['access_token']}"}
+    assert client.post("/api/v1/auth/logout", headers=headers).status_code == 200
+    response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token foi invalidado (logout)"
+    assert client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {second['access_token']}"}).status_code == 200
+
+def test_in_memory_revocation_store_evicts_expired_entries():
+    """Teste da remoção das revogações vencidas pelo heap de expiração"""
+    from unittest.mock import patch
+    from infrastructure.cache.token_revocation_store import InMemoryTokenRevocationStore
+
+    store = InMemoryTokenRevocationStore()
+    with patch("infrastructure.cache.token_revocation_store.time.time", return_value=1000.0):
+        store.revoke("a", 1010.0)
+        store.revoke("b", 1100.0)
+        store.revoke("expirado", 999.0)
+        assert store.is_revoked("a") and store.is_revoked("b")
+        assert not store.is_revoked("expirado")
+        assert len(store) == 2
+
+    with patch("infrastructure.cache.token_revocation_store.time.time", return_value=1050.0):
+        assert not store.is_revoked("a")
+        store.revoke("c", 1200.0)
+        assert len(store) == 2
+        assert store.is_revoked("b") and store.is_revoked("c")
+
+def test_database_revocation_store_is_shared_between_processes(client: TestClient):
+    """Teste do store em banco: revogação feita por uma instância vista por outra"""
+    import time
+    from infrastructure.cache.token_revocation_store import DatabaseTokenRevocationStore
+    from infrastructure.database.models.revoked_token_model import RevokedTokenModel
+    from tests.conftest import TestingSessionLocal
+
+    worker_a = DatabaseTokenRevocationStore(TestingSessionLocal, sync_interval_seconds=0)
+    worker_b = DatabaseTokenRevocationStore(TestingSessionLocal, sync_interval_seconds=0)
+    try:
+        assert not worker_b.is_revoked("jti-compartilhado")
+        worker_a.revoke("jti-compartilhado", time.time() + 60)
+        worker_a.revoke("jti-vencendo", time.time() + 0.5)
+        assert worker_b.is_revoked("jti-compartilhado")
+        assert worker_b.is_revoked("jti-vencendo")
+
+        # Registros expirados saem da tabela na próxima revogação
+        time.sleep(0.6)
+        worker_a.revoke("jti-outro", time.time() + 60)
+        db = TestingSessionLocal()
+        try:
+            jtis = {row.jti for row in db.query(RevokedTokenModel).all()}
+        finally:
+            db.close()
+        assert "jti-vencendo" not in jtis
+        assert {"jti-compartilhado", "jti-outro"} <= jtis
+    finally:
+        db = TestingSessionLocal()
+        db.query(RevokedTokenModel).delete()
+        db.commit()
+        db.close()
+
+def test_database_revocation_store_backs_off_after_sync_error():
+    """Teste do store em banco: falha na sincronização não repete a query a cada consulta"""
+    from unittest.mock import MagicMock
+    from infrastructure.cache.token_revocation_store import DatabaseTokenRevocationStore
+
+    session = MagicMock()
+    session.query.side_effect = RuntimeError("banco indisponível")
+    store = DatabaseTokenRevocationStore(lambda: session, sync_interval_seconds=60)
+
+    assert not store.is_revoked("jti")
+    assert not store.is_revoked("jti")
+    assert session.query.call_count == 1
+    assert session.close.call_count == 1
+
+def test_password_hasher_process_pool_applies_backpressure():
+    """Teste do pool de processos do bcrypt: hash/verificação e recusa com a fila cheia"""
+    import asyncio
+    from app.core.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+
+    async def run():
+        hashed = await hasher.hash("senha123")
+        assert await hasher.verify("senha123", hashed)
+        assert not await hasher.verify("outra", hashed)
+        return await asyncio.gather(hasher.hash("a"), hasher.hash("b"), return_exceptions=True)
+
+    try:
+        results = asyncio.run(run())
+        assert sum(isinstance(result, PasswordHasherBusyError) for result in results) == 1
+        stats = hasher.stats()
+        assert (stats["completed"], stats["rejected"], stats["pending"]) == (4, 1, 0)
+        assert stats["max_pending_seen"] == 1
+        assert hasher._executor._mp_context.get_start_method() != "fork"
+        assert stats["duration"]["hash"]["count"] == 2
+        assert stats["duration"]["verify"]["count"] == 2
+        assert stats["duration"]["hash"]["p99_ms"] > 0
+    finally:
+        hasher.shutdown()
+
+def test_login_upgrades_password_hash_to_configured_cost(client: TestClient, db_session):
+    """Teste do login refazendo o hash criado com outro custo do bcrypt"""
+    from passlib.context import CryptContext
+    from app.core.config import settings
+    from infrastructure.database.models.user_model import UserModel
+
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("senha123")
+    user = UserModel(name="Rehash Auth", email="rehash.auth@example.com", password=old_hash, is_active=True)
+    db_session.add(user)
+    db_session.commit()
+
+    login = {"email": "rehash.auth@example.com", "password": "senha123"}
+    assert client.post("/api/v1/auth/login", json=login).status_code == 200
+    db_session.refresh(user)
+    assert user.password != old_hash
+    assert user.password.startswith(f"$2b${settings.PASSWORD_BCRYPT_ROUNDS:02d}$")
+
+    # Senha errada não altera o hash; o novo hash continua válido
+    upgraded_hash = user.password
+    assert client.post("/api/v1/auth/login", json={**login, "password": "errada"}).status_code == 401
+    assert client.post("/api/v1/auth/login", json=login).status_code == 200
+    db_session.refresh(user)
+    assert user.password == upgraded_hash
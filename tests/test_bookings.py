@@ -218,4 +218,85 @@ def test_get_bookings_by_artist(client: TestClient):
     
     data = response.json()
     assert "items" in data  # BookingListResponse tem campo 'items'
-    assert isinstance(data["items"], list) 
\ No newline at end of file
+    assert isinstance(data["items"], list)
+
+
+def test_booking_repository_interval_overlap(setup_database, db_session):
+    """Teste da verificação de conflitos por sobreposição de intervalos"""
+    from domain.entities.booking import Booking
+    from infrastructure.database.models.artist_model import ArtistModel
+    from infrastructure.database.models.booking_model import BookingModel
+    from infrastructure.database.models.profile_model import ProfileModel
+    from infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+    
+    db_profile = ProfileModel(
+        user_id=1, role_id=2, full_name="Artista Agenda", artistic_name="Artista Agenda", bio="Bio",
+        cep="01234-567", logradouro="Rua A", numero="1", cidade="São Paulo", uf="SP", telefone_movel="11999999999"
+    )
+    db_session.add(db_profile)
+    db_session.flush()
+    db_artist = ArtistModel(
+        profile_id=db_profile.id, artist_type_id=1, dias_apresentacao='["sexta"]', raio_atuacao=50.0,
+        duracao_apresentacao=2.0, valor_hora=100.0, valor_couvert=20.0, requisitos_minimos="Som"
+    )
+    db_session.add(db_artist)
+    db_session.commit()
+    
+    repository = BookingRepositoryImpl(db_session)
+    # Agendamento que atravessa a meia-noite
+    booking = repository.create(Booking(
+        profile_id=db_profile.id, artist_id=db_artist.id,
+        data_inicio=datetime(2032, 3, 5), horario_inicio="22:00",
+        data_fim=datetime(2032, 3, 6), horario_fim="02:00"
+    ))
+    
+    try:
+        db_booking = db_session.query(BookingModel).filter(BookingModel.id == booking.id).first()
+        assert (db_booking.periodo_inicio, db_booking.periodo_fim) == (datetime(2032, 3, 5, 22), datetime(2032, 3, 6, 2))
+        assert booking.periodo == (datetime(2032, 3, 5, 22), datetime(2032, 3, 6, 2))
+        
+        # Instante no dia seguinte, dentro do intervalo
+        assert [b.id for b in repository.get_conflicting_bookings(db_artist.id, datetime(2032, 3, 6), "01:00")] == [booking.id]
+        assert repository.get_conflicting_bookings(db_artist.id, datetime(2032, 3, 6), "03:00") == []
+        
+        slots = [
+            (datetime(2032, 3, 5, 18), datetime(2032, 3, 5, 21)),   # antes
+            (datetime(2032, 3, 5, 21), datetime(2032, 3, 5, 23)),   # sobrepõe o início
+        ]
+        conflicts = repository.get_conflicting_bookings_bulk([db_artist.id, 9999], slots)
+        assert list(conflicts) == [db_artist.id]
+        assert repository.get_conflicting_bookings_bulk([db_artist.id], slots[:1]) == {}
+        assert repository.get_space_conflicting_bookings_bulk([db_artist.id], slots) == {}
+        
+        # Alteração do horário recalcula o intervalo
+        booking.horario_inicio = "23:30"
+        repository.update(booking.id, booking)
+        assert repository.get_conflicting_bookings_bulk([db_artist.id], slots) == {}
+    finally:
+        repository.delete(booking.id)
+        db_session.delete(db_artist)
+        db_session.delete(db_profile)
+        db_session.commit()
+
+def test_booking_model_derives_periodo_on_write(setup_database, db_session):
+    """Testa que inserções diretas no modelo (seeds, scripts) também preenchem o intervalo"""
+    from infrastructure.database.models.booking_model import BookingModel
+    
+    db_booking = BookingModel(
+        profile_id=1, space_id=1,
+        data_inicio=datetime(2033, 7, 1), horario_inicio="21:00",
+        data_fim=datetime(2033, 7, 2), horario_fim="01:30"
+    )
+    db_session.add(db_booking)
+    db_session.commit()
+    
+    try:
+        assert (db_booking.periodo_inicio, db_booking.periodo_fim) == (datetime(2033, 7, 1, 21), datetime(2033, 7, 2, 1, 30))
+        
+        db_booking.horario_fim = "02:00"
+        db_session.commit()
+        db_session.refresh(db_booking)
+        assert db_booking.periodo_fim == datetime(2033, 7, 2, 2)
+    finally:
+        db_session.delete(db_booking)
+        db_session.commit()
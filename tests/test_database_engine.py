@@ -0,0 +1,88 @@
+import os
+import tempfile
+import pytest
+from sqlalchemy import exc, text
+from infrastructure.database.engine import EngineSettings, create_database_engine, get_pool_status
+
+@pytest.fixture
+def sqlite_url():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        yield f"sqlite:///{path}"
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+def test_engine_applies_sqlite_pragmas(sqlite_url):
+    """Testa os PRAGMAs configurados, aplicados em cada nova conexão"""
+    settings = EngineSettings(sqlite_journal_mode="WAL", sqlite_synchronous="NORMAL", sqlite_mmap_size=1048576)
+    engine = create_database_engine(sqlite_url, settings)
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert connection.execute(text("PRAGMA mmap_size")).scalar() == 1048576
+    finally:
+        engine.dispose()
+
+def test_production_profile_reads_run_alongside_writes(sqlite_url):
+    """Testa o perfil production (WAL) e o engine somente leitura lendo durante uma escrita aberta"""
+    settings = EngineSettings(sqlite_profile="production", sqlite_busy_timeout_ms=100)
+    writer = create_database_engine(sqlite_url, settings)
+    reader = create_database_engine(sqlite_url, settings, read_only=True)
+    try:
+        with writer.begin() as connection:
+            connection.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, nome TEXT)"))
+            connection.execute(text("INSERT INTO item (nome) VALUES ('a')"))
+
+        with reader.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA cache_size")).scalar() == -65536
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 100
+            with pytest.raises(exc.OperationalError):
+                connection.execute(text("INSERT INTO item (nome) VALUES ('b')"))
+
+        with writer.connect() as write_connection:
+            write_connection.execute(text("BEGIN IMMEDIATE"))
+            write_connection.execute(text("INSERT INTO item (nome) VALUES ('c')"))
+            # Com a transação de escrita ainda aberta, a leitura não espera o lock
+            with reader.connect() as connection:
+                assert connection.execute(text("SELECT nome FROM item")).scalars().all() == ["a"]
+            write_connection.execute(text("COMMIT"))
+    finally:
+        reader.dispose()
+        writer.dispose()
+
+    with pytest.raises(ValueError):
+        EngineSettings(sqlite_profile="turbo")
+
+def test_pool_metrics_count_checkouts_and_timeouts(sqlite_url):
+    """Testa as métricas do pool: conexões em uso, checkouts e timeouts"""
+    engine = create_database_engine(sqlite_url, EngineSettings(pool_size=1, max_overflow=0, pool_timeout=0.05))
+    try:
+        with engine.connect():
+            status = get_pool_status(engine)
+            assert (status["checked_out"], status["checked_in"], status["pool_size"]) == (1, 0, 1)
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        status = get_pool_status(engine)
+        assert status["backend"] == "sqlite"
+        assert (status["checked_out"], status["checked_in"]) == (0, 1)
+        assert status["checkouts"] == 1
+        assert status["timeouts"] == 1
+        assert status["wait_max_ms"] >= 50
+
+        # As métricas sobrevivem à recriação do pool
+        engine.dispose()
+        assert get_pool_status(engine)["timeouts"] == 1
+    finally:
+        engine.dispose()
+
+def test_db_pool_metrics_endpoint(authenticated_client):
+    """Testa o endpoint interno de métricas do pool"""
+    response = authenticated_client.get("/api/v1/internal/db-pool")
+    assert response.status_code == 200
+    assert {"backend", "checked_out", "overflow", "timeouts", "wait_avg_ms"} <= set(response.json()["sync"])
@@ -0,0 +1,42 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+def test_export_reviews_streams_ndjson_and_csv(authenticated_client, db_session):
+    """Testa a exportação em streaming das avaliações (NDJSON e CSV)"""
+    from infrastructure.database.models.review_model import ReviewModel
+
+    models = [
+        ReviewModel(profile_id=998, data_hora=datetime(2024, 5, 1, 20, 0), nota=nota,
+                    depoimento=f"Depoimento, com vírgula {nota}")
+        for nota in (3, 5, 4)
+    ]
+    db_session.add_all(models)
+    db_session.commit()
+    ids = [model.id for model in models]
+
+    try:
+        response = authenticated_client.get("/api/v1/reviews/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert 'filename="reviews.ndjson"' in response.headers["content-disposition"]
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        exported = [row for row in rows if row["id"] in ids]
+        assert [row["nota"] for row in exported] == [3, 5, 4]
+        assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+
+        response = authenticated_client.get("/api/v1/reviews/export", params={"format": "csv"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        records = list(csv.DictReader(io.StringIO(response.text)))
+        exported = [record for record in records if int(record["id"]) in ids]
+        assert [record["depoimento"] for record in exported] == [
+            "Depoimento, com vírgula 3", "Depoimento, com vírgula 5", "Depoimento, com vírgula 4"
+        ]
+        assert exported[0]["space_event_type_id"] == ""
+
+        assert authenticated_client.get("/api/v1/reviews/export", params={"format": "xml"}).status_code == 422
+    finally:
+        db_session.query(ReviewModel).filter(ReviewModel.id.in_(ids)).delete(synchronize_session=False)
+        db_session.commit()
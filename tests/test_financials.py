@@ -260,4 +260,40 @@ def test_get_financials_by_status(client: TestClient):
     
     data = response.json()
     assert "items" in data  # FinancialListResponse tem campo 'items'
-    assert isinstance(data["items"], list) 
\ No newline at end of file
+    assert isinstance(data["items"], list) 
+
+def test_financial_summaries_use_group_by_and_cache(setup_database, db_session):
+    """Testa os resumos estatísticos agregados no banco e o cache invalidado nas escritas"""
+    from collections import Counter
+    from app.application.services.financial_service import FinancialService
+    from infrastructure.database.models.financial_model import FinancialModel
+
+    rows = [
+        FinancialModel(profile_id=1, banco="997", agencia="0001", conta="12345-6", tipo_conta="Corrente",
+                       cpf_cnpj="123.456.789-00", tipo_chave_pix="E-mail", chave_pix=f"resumo{i}@teste.com",
+                       preferencia="PIX" if i % 2 else "TED")
+        for i in range(3)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    try:
+        service = FinancialService(db_session)
+        FinancialService.invalidate_summary_cache()
+        financials = service.repository.get_all()
+
+        assert service.get_banks_summary() == dict(Counter(f.banco for f in financials))
+        assert service.get_banks_summary()["997"] == 3
+        assert service.get_pix_types_summary() == dict(Counter(f.tipo_chave_pix.value for f in financials))
+        assert service.get_preferencias_summary() == dict(Counter(f.preferencia.value for f in financials))
+        assert service.get_tipos_conta_summary() == dict(Counter(f.tipo_conta.value for f in financials))
+
+        # Resultado em cache até a próxima escrita pelo serviço
+        db_session.delete(rows[0])
+        db_session.commit()
+        assert service.get_banks_summary()["997"] == 3
+        assert service.delete_financial(rows[1].id)
+        assert service.get_banks_summary()["997"] == 1
+    finally:
+        db_session.query(FinancialModel).filter(FinancialModel.banco == "997").delete()
+        db_session.commit()
+        FinancialService.invalidate_summary_cache()
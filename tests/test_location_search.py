@@ -217,20 +217,9 @@ class TestLocationSearchService:
         # Mock dos repositórios
         self.mock_profile_repository.get_by_id.return_value = artist_profile
         self.mock_artist_repository.get_by_profile_id.return_value = artist
-        self.mock_profile_repository.get_by_role_id.return_value = [space_profile]
-        self.mock_space_repository.get_by_profile_id.return_value = [space]
-        self.mock_space_event_type_repository.get_by_space_id_and_status.return_value = [
-            SpaceEventType(
-                id=1,
-                space_id=1,
-                event_type_id=1,
-                tema="Show",
-                descricao="Show musical",
-                data=datetime.now().date(),
-                horario="20:00",
-                status=StatusEventType.CONTRATANDO
-            )
-        ]
+        self.mock_profile_repository.get_by_role_id_within_radius.return_value = [space_profile]
+        self.mock_profile_repository.get_by_role_id_without_coordinates.return_value = []
+        self.mock_space_repository.get_contracting_by_profile_ids.return_value = [space]
         
         # Act
         with patch.object(LocationUtils, 'get_coordinates_from_profile') as mock_get_coords:
@@ -252,6 +241,7 @@ class TestLocationSearchService:
         assert result.results[0].id == 1
         assert result.results[0].distance_km > 0
         assert result.search_radius_km == 50.0
+        self.mock_space_repository.get_contracting_by_profile_ids.assert_called_once_with([2])
     
     def test_search_artists_for_space_with_profile_coordinates(self):
         """Testa busca de artistas para espaço usando coordenadas do profile"""
@@ -319,9 +309,9 @@ class TestLocationSearchService:
         # Mock dos repositórios
         self.mock_profile_repository.get_by_id.return_value = space_profile
         self.mock_space_repository.get_by_profile_id.return_value = [space]
-        self.mock_profile_repository.get_by_role_id.return_value = [artist_profile]
-        self.mock_artist_repository.get_by_profile_id.return_value = artist
-        self.mock_booking_repository.get_conflicting_bookings.return_value = []
+        self.mock_artist_repository.get_with_profiles_near.return_value = [(artist, artist_profile)]
+        self.mock_artist_repository.get_max_raio_atuacao.return_value = 50.0
+        self.mock_booking_repository.get_conflicting_bookings_bulk.return_value = {}
         
         # Mock para eventos e festivais contratando
         self.mock_space_event_type_repository.get_by_space_id_and_status.return_value = [
@@ -400,4 +390,348 @@ class TestLocationSearchService:
             assert result == (-23.5505, -46.6333)
             
             # Verifica que não foi chamado o fallback
-            mock_get_coords.assert_called_once() 
\ No newline at end of file
+            mock_get_coords.assert_called_once() 
+
+class TestProfileSpatialIndex:
+    """Testes para o índice espacial de profiles"""
+    
+    def setup_method(self):
+        from infrastructure.spatial.profile_spatial_index import ProfileSpatialIndex
+        self.index = ProfileSpatialIndex(cell_size_deg=0.25, max_age_seconds=None)
+        self.index.load([
+            (1, 3, -23.5505, -46.6333),  # São Paulo
+            (2, 3, -22.9064, -47.0616),  # Campinas
+            (3, 3, -22.9068, -43.1729),  # Rio de Janeiro
+            (4, 2, -23.5600, -46.6400),  # Artista em São Paulo
+            (5, 3, None, None)           # Sem coordenadas
+        ])
+    
+    def test_query_filters_by_radius_and_role(self):
+        """Testa busca por raio respeitando o role"""
+        result = self.index.query(3, -23.5505, -46.6333, 120)
+        
+        assert [profile_id for profile_id, _ in result] == [1, 2]
+        assert result[0][1] == pytest.approx(0.0, abs=1e-6)
+        assert 80 <= result[1][1] <= 120
+    
+    def test_query_matches_brute_force(self):
+        """Testa que o índice retorna o mesmo que a busca linear"""
+        points = {1: (-23.5505, -46.6333), 2: (-22.9064, -47.0616), 3: (-22.9068, -43.1729)}
+        for radius in (1, 50, 100, 400, 5000):
+            expected = sorted(
+                profile_id for profile_id, (lat, lng) in points.items()
+                if LocationUtils.calculate_distance(-23.0, -46.0, lat, lng) <= radius
+            )
+            result = sorted(profile_id for profile_id, _ in self.index.query(3, -23.0, -46.0, radius))
+            assert result == expected
+    
+    def test_upsert_and_remove_keep_index_updated(self):
+        """Testa atualização do índice em escritas de profiles"""
+        self.index.upsert(2, 3, -22.9068, -43.1729)  # Campinas "muda" para o Rio
+        assert [pid for pid, _ in self.index.query(3, -23.5505, -46.6333, 120)] == [1]
+        
+        self.index.upsert(1, 3, None, None)
+        assert self.index.query(3, -23.5505, -46.6333, 120) == []
+        
+        self.index.remove(3)
+        assert self.index.query(3, -22.9068, -43.1729, 10) == [(2, pytest.approx(0.0, abs=1e-6))]
+        assert len(self.index) == 2
+    
+    def test_invalidate_forces_reload(self):
+        """Testa expiração manual do índice"""
+        assert self.index.is_loaded()
+        self.index.invalidate()
+        assert not self.index.is_loaded()
+        assert self.index.query(3, -23.5505, -46.6333, 120) == []
+
+
+def test_cep_repository_get_nearby_cities_sorted_by_distance(setup_database, db_session):
+    """Testa busca de cidades próximas com pré-filtro por bounding box e refinamento Haversine"""
+    from domain.entities.cep_coordinates import CepCoordinates
+    from infrastructure.repositories.cep_coordinates_repository_impl import CepCoordinatesRepositoryImpl
+    from infrastructure.database.models.cep_coordinates_model import CepCoordinatesModel
+    
+    cities = [
+        ("Campinas", "SP", -22.9064, -47.0616),
+        ("São Paulo", "SP", -23.5505, -46.6333),
+        ("Guarulhos", "SP", -23.4538, -46.5333),
+        ("Rio de Janeiro", "RJ", -22.9068, -43.1729),
+    ]
+    db_session.add_all([
+        CepCoordinatesModel(
+            cidade=cidade, uf=uf, cidade_normalizada=LocationUtils._normalize_text(cidade),
+            latitude=lat, longitude=lng
+        )
+        for cidade, uf, lat, lng in cities
+    ])
+    db_session.commit()
+    
+    try:
+        repository = CepCoordinatesRepositoryImpl(db_session)
+        result = repository.get_nearby_cities_with_distance(-23.5505, -46.6333, 120)
+        
+        assert [city.cidade for city, _ in result] == ["São Paulo", "Guarulhos", "Campinas"]
+        distances = [distance for _, distance in result]
+        assert distances == sorted(distances)
+        assert distances[-1] == pytest.approx(
+            LocationUtils.calculate_distance(-23.5505, -46.6333, -22.9064, -47.0616)
+        )
+        assert [city.cidade for city in repository.get_nearby_cities(-23.5505, -46.6333, 20)] == [
+            "São Paulo", "Guarulhos"
+        ]
+    finally:
+        db_session.query(CepCoordinatesModel).delete()
+        db_session.commit()
+
+
+def test_calculate_distances_batch_matches_scalar():
+    """Testa o cálculo vetorizado de distâncias e a máscara de raio"""
+    latitudes = [-23.5505, -22.9064, -22.9068, -23.4538]
+    longitudes = [-46.6333, -47.0616, -43.1729, -46.5333]
+    
+    distances, in_radius = LocationUtils.calculate_distances(-23.5505, -46.6333, latitudes, longitudes, 100)
+    
+    assert distances.shape == (4,)
+    assert distances[0] == pytest.approx(0.0, abs=1e-9)
+    for lat, lng, distance in zip(latitudes, longitudes, distances):
+        assert LocationUtils.calculate_distance(-23.5505, -46.6333, lat, lng) == pytest.approx(distance)
+    assert in_radius.tolist() == [True, True, False, True]
+    
+    # Raio por candidato
+    _, in_radius = LocationUtils.calculate_distances(-23.5505, -46.6333, latitudes, longitudes, [0, 50, 500, 5])
+    assert in_radius.tolist() == [True, False, True, False]
+    
+    # Sem candidatos
+    distances, in_radius = LocationUtils.calculate_distances(-23.5505, -46.6333, [], [])
+    assert distances.size == 0 and in_radius.size == 0
+
+
+def test_artist_search_repositories_use_bulk_queries(setup_database, db_session):
+    """Testa as consultas em lote usadas na busca de artistas para espaço"""
+    from infrastructure.repositories.artist_repository_impl import ArtistRepositoryImpl
+    from infrastructure.repositories.booking_repository_impl import BookingRepositoryImpl
+    from infrastructure.database.models.artist_model import ArtistModel
+    from infrastructure.database.models.booking_model import BookingModel
+    from infrastructure.database.models.profile_model import ProfileModel
+    
+    def create_artist(latitude, longitude):
+        db_profile = ProfileModel(
+            user_id=1, role_id=2, full_name="Artista Busca", artistic_name="Artista Busca",
+            bio="Bio", cep="01234-567", logradouro="Rua A", numero="1", cidade="São Paulo", uf="SP",
+            telefone_movel="11999999999", latitude=latitude, longitude=longitude
+        )
+        db_session.add(db_profile)
+        db_session.flush()
+        db_artist = ArtistModel(
+            profile_id=db_profile.id, artist_type_id=1, dias_apresentacao='["sexta"]', raio_atuacao=50.0,
+            duracao_apresentacao=2.0, valor_hora=100.0, valor_couvert=20.0, requisitos_minimos="Som"
+        )
+        db_session.add(db_artist)
+        db_session.commit()
+        return db_profile, db_artist
+    
+    near_profile, db_artist = create_artist(-23.5600, -46.6400)
+    far_profile, far_artist = create_artist(-3.7319, -38.5267)  # Fortaleza
+    no_coords_profile, no_coords_artist = create_artist(None, None)
+    data = datetime(2031, 5, 10, 0, 0)
+    booking = BookingModel(
+        profile_id=db_artist.profile_id,
+        artist_id=db_artist.id,
+        data_inicio=data,
+        horario_inicio="19:00",
+        data_fim=data,
+        horario_fim="22:00"
+    )
+    db_session.add(booking)
+    db_session.commit()
+    
+    try:
+        # Profiles sem coordenadas também são retornados (resolvidos por cidade/UF)
+        artists_with_profiles = ArtistRepositoryImpl(db_session).get_with_profiles_near(-23.5505, -46.6333, 50)
+        artist_ids = [artist.id for artist, _ in artists_with_profiles]
+        assert db_artist.id in artist_ids
+        assert no_coords_artist.id in artist_ids
+        assert far_artist.id not in artist_ids
+        for artist, profile in artists_with_profiles:
+            assert artist.profile_id == profile.id
+            assert profile.role_id == 2
+        
+        repository = BookingRepositoryImpl(db_session)
+        as_slot = lambda hour, day=10: (datetime(2031, 5, day, hour, 0), datetime(2031, 5, day, hour, 0))
+        conflicts = repository.get_conflicting_bookings_bulk(
+            [db_artist.id, 9999], [as_slot(20), as_slot(20, day=11)]
+        )
+        assert list(conflicts) == [db_artist.id]
+        assert conflicts[db_artist.id][0].id == booking.id
+        
+        assert repository.get_conflicting_bookings_bulk([db_artist.id], [as_slot(23)]) == {}
+        assert repository.get_conflicting_bookings_bulk([db_artist.id], []) == {}
+    finally:
+        db_session.delete(booking)
+        for db_model in (db_artist, far_artist, no_coords_artist, near_profile, far_profile, no_coords_profile):
+            db_session.delete(db_model)
+        db_session.commit()
+
+
+class TestTTLCache:
+    """Testes do cache limitado com expiração"""
+    
+    def test_lru_eviction_and_stats(self):
+        """Testa remoção do menos usado recentemente e contadores"""
+        from infrastructure.cache.ttl_cache import TTLCache
+        
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" passa a ser o menos usado
+        cache.set("c", 3)
+        
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        stats = cache.stats()
+        assert stats["size"] == 2
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+    
+    def test_ttl_expiration(self):
+        """Testa expiração das entradas pelo TTL"""
+        from infrastructure.cache.ttl_cache import TTLCache
+        
+        cache = TTLCache(maxsize=10, ttl_seconds=60)
+        with patch("infrastructure.cache.ttl_cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl_seconds=1000)
+        with patch("infrastructure.cache.ttl_cache.time.monotonic", return_value=1061.0):
+            assert cache.get("a") is None
+            assert cache.get("b") == 2
+        assert cache.stats()["expirations"] == 1
+    
+    def test_invalidate_where(self):
+        """Testa invalidação seletiva por predicado"""
+        from infrastructure.cache.ttl_cache import TTLCache
+        
+        cache = TTLCache(maxsize=10)
+        cache.set(("sao paulo", "SP"), (1.0, 2.0))
+        cache.set(("campinas", "SP"), (3.0, 4.0))
+        cache.set(("niteroi", "RJ"), (5.0, 6.0))
+        
+        assert cache.invalidate_where(lambda key: key[1] == "SP") == 2
+        assert len(cache) == 1
+        assert ("niteroi", "RJ") in cache
+
+
+def test_coordinates_cache_invalidated_by_repository_writes(setup_database, db_session):
+    """Testa a invalidação do cache de coordenadas após escrita no repositório"""
+    from domain.entities.cep_coordinates import CepCoordinates
+    from infrastructure.repositories.cep_coordinates_repository_impl import CepCoordinatesRepositoryImpl
+    
+    cache = LocationUtils._coordinates_cache
+    cache.set(("cidade teste", "ZZ"), (-10.0, -50.0))
+    cache.set(("outra cidade", "ZZ"), (-11.0, -51.0))
+    cache.set(("cidade teste", "YY"), (-12.0, -52.0))
+    
+    repository = CepCoordinatesRepositoryImpl(db_session)
+    try:
+        repository.create(CepCoordinates(cidade="Cidade Teste", uf="ZZ", latitude=-10.5, longitude=-50.5))
+        
+        assert ("cidade teste", "ZZ") not in cache
+        assert ("outra cidade", "ZZ") not in cache
+        assert ("cidade teste", "YY") in cache
+        assert "invalidations" in LocationUtils.get_coordinates_cache_stats()
+    finally:
+        repository.delete("Cidade Teste", "ZZ")
+        cache.invalidate(("cidade teste", "YY"))
+
+
+def test_cep_gazetteer_matches_repository(setup_database, db_session):
+    """Testa a cópia em memória dos municípios contra as consultas no banco"""
+    from infrastructure.repositories.cep_coordinates_repository_impl import CepCoordinatesRepositoryImpl
+    from infrastructure.database.models.cep_coordinates_model import CepCoordinatesModel
+    
+    cities = [
+        ("Campinas", "SP", -22.9064, -47.0616),
+        ("São Paulo", "SP", -23.5505, -46.6333),
+        ("Guarulhos", "SP", -23.4538, -46.5333),
+        ("São Gonçalo", "RJ", -22.8268, -43.0634),
+        ("Rio de Janeiro", "RJ", -22.9068, -43.1729),
+    ]
+    db_session.add_all([
+        CepCoordinatesModel(
+            cidade=cidade, uf=uf, cidade_normalizada=LocationUtils._normalize_text(cidade),
+            latitude=lat, longitude=lng
+        )
+        for cidade, uf, lat, lng in cities
+    ])
+    db_session.commit()
+    
+    try:
+        repository = CepCoordinatesRepositoryImpl(db_session)
+        gazetteer = repository.load_gazetteer()
+        
+        assert len(gazetteer) == 5
+        assert gazetteer.get_by_cidade_uf("SAO PAULO", "SP").coordinates == (-23.5505, -46.6333)
+        assert gazetteer.get_by_cidade_uf("SAO PAULO", "RJ") is None
+        
+        # Busca parcial equivalente ao LIKE '%nome%'
+        for text in ["SAO", "PAULO", "AS", "GONCALO", "XYZ"]:
+            expected = {(c.cidade, c.uf) for c in repository.search_by_cidade(text)}
+            assert {(c.cidade, c.uf) for c in gazetteer.search_by_cidade(text)} == expected
+        assert [c.cidade for c in gazetteer.search_by_cidade("SAO", uf="RJ")] == ["São Gonçalo"]
+        
+        for radius in [0, 20, 120, 500]:
+            expected = repository.get_nearby_cities_with_distance(-23.5505, -46.6333, radius)
+            result = gazetteer.get_nearby_cities_with_distance(-23.5505, -46.6333, radius)
+            assert [c.cidade for c, _ in result] == [c.cidade for c, _ in expected]
+            assert [d for _, d in result] == pytest.approx([d for _, d in expected])
+        
+        # LocationUtils consulta a cópia em memória quando carregada
+        with patch.object(LocationUtils, "_gazetteer", gazetteer), \
+             patch.object(LocationUtils, "_get_cep_repository", side_effect=AssertionError("sem banco")):
+            assert LocationUtils._get_coordinates_from_local_db("GONCALO", "RJ") == (-22.8268, -43.0634)
+            assert [c["cidade"] for c in LocationUtils.get_nearby_cities(-23.5505, -46.6333, 20)] == [
+                "São Paulo", "Guarulhos"
+            ]
+            assert [c["cidade"] for c in LocationUtils.search_cities_by_name("rio de")] == ["Rio de Janeiro"]
+    finally:
+        db_session.query(CepCoordinatesModel).delete()
+        db_session.commit()
+
+
+def test_availability_matrix_marks_overlapping_slots():
+    """Testa a matriz de disponibilidade artistas x horários (uma única consulta de agendamentos)"""
+    from app.application.services.availability_service import AvailabilityService, AvailabilitySlot
+
+    booking_repository = Mock()
+    service = AvailabilityService(booking_repository, Mock(), Mock())
+    slots = [
+        AvailabilitySlot(tipo="festival", id=2, inicio=datetime(2025, 3, 2, 20, 0), fim=datetime(2025, 3, 2, 20, 0)),
+        AvailabilitySlot(tipo="evento", id=1, inicio=datetime(2025, 3, 1, 20, 0), fim=datetime(2025, 3, 1, 23, 0)),
+        AvailabilitySlot(tipo="evento", id=3, inicio=datetime(2025, 3, 5, 20, 0), fim=datetime(2025, 3, 5, 20, 0)),
+    ]
+    # Artista 10: agendamento cobre o fim do evento 1; artista 11: cobre o festival 2 (limite inclusivo)
+    booking_repository.get_conflicting_bookings_bulk.return_value = {
+        10: [Booking(profile_id=1, artist_id=10, data_inicio=datetime(2025, 3, 1), horario_inicio="22:00",
+                     data_fim=datetime(2025, 3, 1), horario_fim="23:30")],
+        11: [Booking(profile_id=1, artist_id=11, data_inicio=datetime(2025, 3, 2), horario_inicio="18:00",
+                     data_fim=datetime(2025, 3, 2), horario_fim="20:00")],
+    }
+
+    matrix = service.get_availability_matrix([10, 11, 12], slots)
+
+    booking_repository.get_conflicting_bookings_bulk.assert_called_once_with(
+        [10, 11, 12], [(slot.inicio, slot.fim) for slot in slots]
+    )
+    assert matrix.available.tolist() == [
+        [True, False, True],
+        [False, True, True],
+        [True, True, True],
+    ]
+    assert matrix.is_available(10, 0) and not matrix.is_fully_available(10)
+    assert matrix.fully_available_artist_ids() == [12]
+
+    # Sem horários ou artistas não há consulta
+    booking_repository.reset_mock()
+    assert service.get_availability_matrix([10], []).available.shape == (1, 0)
+    booking_repository.get_conflicting_bookings_bulk.assert_not_called()
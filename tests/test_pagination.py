@@ -0,0 +1,85 @@
+import pytest
+from datetime import datetime
+from domain.repositories.pagination import Page, PageRequest, decode_cursor, encode_cursor
+
+def test_cursor_round_trip_and_invalid_cursor():
+    """Testa a codificação do cursor opaco"""
+    created_at = datetime(2025, 3, 1, 20, 15, 30, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+    
+    with pytest.raises(ValueError):
+        decode_cursor("não-é-um-cursor")
+    with pytest.raises(ValueError):
+        PageRequest(limit=0)
+
+def test_keyset_pagination_walks_all_rows_once(setup_database, db_session):
+    """Testa a paginação por (created_at, id), inclusive com empates de created_at"""
+    from infrastructure.database.models.review_model import ReviewModel
+    from infrastructure.repositories.review_repository_impl import ReviewRepositoryImpl
+    
+    same_instant = datetime(2020, 1, 1, 12, 0, 0)
+    models = [
+        ReviewModel(profile_id=999, data_hora=same_instant, nota=4, depoimento="Depoimento de teste",
+                    created_at=created_at)
+        for created_at in (same_instant, same_instant, datetime(2019, 12, 31, 8, 0, 0, 500000), same_instant, None)
+    ]
+    db_session.add_all(models)
+    db_session.commit()
+    ids = [model.id for model in models]
+    
+    try:
+        repository = ReviewRepositoryImpl(db_session)
+        seen = []
+        page = PageRequest(limit=2)
+        while True:
+            rows = repository.get_by_profile_id(999, page=page)
+            result = Page.from_rows(rows, page)
+            assert len(result.items) <= 2
+            seen.extend(review.id for review in result.items)
+            if not result.next_cursor:
+                break
+            page = PageRequest(limit=2, cursor=result.next_cursor)
+        
+        # Mais antigo primeiro; empates desfeitos pelo id; o registro com created_at do banco por último
+        assert seen == [ids[2], ids[0], ids[1], ids[3], ids[4]]
+        # Sem página, a listagem continua completa
+        assert len(repository.get_by_profile_id(999)) == 5
+    finally:
+        db_session.query(ReviewModel).filter(ReviewModel.profile_id == 999).delete()
+        db_session.commit()
+
+def test_cursor_takes_precedence_over_skip(authenticated_client, db_session):
+    """Testa que skip é ignorado quando o cursor é informado e que o limit é reduzido ao máximo"""
+    from app.application.dependencies import get_page_request
+    from app.core.config import settings
+    from infrastructure.database.models.profile_model import ProfileModel
+    
+    models = [
+        ProfileModel(user_id=1, role_id=1, full_name=f"Perfil {i}", artistic_name=f"Perfil {i}", bio="Bio de teste",
+                     cep="01001-000", logradouro="Praça da Sé", numero="1", cidade="São Paulo", uf="SP",
+                     telefone_movel="11999999999")
+        for i in range(3)
+    ]
+    db_session.add_all(models)
+    db_session.commit()
+    ids = [model.id for model in models]
+    
+    try:
+        first = authenticated_client.get("/api/v1/profiles/?limit=1")
+        assert first.status_code == 200
+        cursor = first.headers["X-Next-Cursor"]
+        
+        expected = authenticated_client.get(f"/api/v1/profiles/?limit=1&cursor={cursor}")
+        mixed = authenticated_client.get(f"/api/v1/profiles/?limit=1&cursor={cursor}&skip=5")
+        assert mixed.status_code == 200
+        assert mixed.json() == expected.json()
+        assert mixed.headers.get("X-Next-Cursor") == expected.headers.get("X-Next-Cursor")
+        
+        # limit acima do máximo é reduzido, não recusado
+        assert get_page_request(cursor=None, limit=settings.PAGINATION_MAX_LIMIT + 1).limit == settings.PAGINATION_MAX_LIMIT
+        response = authenticated_client.get(f"/api/v1/profiles/?limit={settings.PAGINATION_MAX_LIMIT + 1}")
+        assert response.status_code == 200
+        assert len(response.json()) <= settings.PAGINATION_MAX_LIMIT
+    finally:
+        db_session.query(ProfileModel).filter(ProfileModel.id.in_(ids)).delete(synchronize_session=False)
+        db_session.commit()
@@ -183,4 +183,122 @@ def test_delete_profile(client: TestClient):
     
     # Verificar se o profile foi deletado
     get_response = client.get(f"/api/v1/profiles/{profile_id}", headers=headers)
-    assert get_response.status_code == 404 
\ No newline at end of file
+    assert get_response.status_code == 404 
+
+def _profile_entity(**overrides):
+    from domain.entities.profile import Profile
+    data = dict(
+        id=10, user_id=1, role_id=2, full_name="João Silva", artistic_name="João Artista",
+        bio="Bio", cep="01234-567", logradouro="Rua das Flores", numero="123",
+        cidade="São Paulo", uf="SP", telefone_movel="11999999999"
+    )
+    data.update(overrides)
+    return Profile(**data)
+
+def test_profile_service_geocodes_on_write():
+    """Teste da geocodificação do endereço ao criar/atualizar profiles"""
+    from unittest.mock import Mock, patch
+    from app.application.services.profile_service import ProfileService
+    from app.schemas.profile import ProfileCreate, ProfileUpdate
+    
+    profile_repository = Mock()
+    profile_repository.create.side_effect = lambda profile: setattr(profile, "id", 10) or profile
+    profile_repository.update.side_effect = lambda profile: profile
+    role_repository = Mock()
+    service = ProfileService(profile_repository, role_repository)
+    create_data = dict(
+        user_id=1, role_id=2, full_name="João Silva", artistic_name="João Artista", bio="Bio",
+        cep="01234-567", logradouro="Rua das Flores", numero="123", cidade="São Paulo", uf="SP",
+        telefone_movel="11999999999"
+    )
+    
+    with patch("app.application.services.profile_service.LocationUtils.resolve_address_coordinates",
+               return_value=(-23.5505, -46.6333, "CIDADE_UF")) as mock_resolve:
+        # Sem coordenadas: geocodificar o endereço
+        response = service.create_profile(ProfileCreate(**create_data))
+        assert (response.latitude, response.longitude, response.coordinates_source) == (-23.5505, -46.6333, "CIDADE_UF")
+        
+        # Coordenadas informadas: mantidas como MANUAL
+        response = service.create_profile(ProfileCreate(**create_data, latitude=-23.0, longitude=-46.0))
+        assert (response.latitude, response.coordinates_source) == (-23.0, "MANUAL")
+        assert mock_resolve.call_count == 1
+        
+        # Atualização sem mudança de endereço não geocodifica de novo
+        profile_repository.get_by_id.return_value = _profile_entity(
+            latitude=-23.0, longitude=-46.0, coordinates_source="MANUAL"
+        )
+        response = service.update_profile(10, ProfileUpdate(bio="Nova bio"))
+        assert (response.latitude, response.coordinates_source) == (-23.0, "MANUAL")
+        assert mock_resolve.call_count == 1
+        
+        # Mudança de endereço invalida as coordenadas antigas
+        profile_repository.get_by_id.return_value = _profile_entity(
+            latitude=-23.0, longitude=-46.0, coordinates_source="MANUAL"
+        )
+        response = service.update_profile(10, ProfileUpdate(cidade="Campinas"))
+        assert (response.latitude, response.coordinates_source) == (-23.5505, "CIDADE_UF")
+        mock_resolve.assert_called_with("Campinas", "SP", "01234-567")
+
+def test_profile_service_backfills_missing_coordinates():
+    """Teste do backfill de coordenadas dos profiles existentes"""
+    from unittest.mock import Mock, patch
+    from app.application.services.profile_service import ProfileService
+    
+    profile_repository = Mock()
+    profile_repository.bulk_update_coordinates.side_effect = lambda updates: len(updates)
+    profile_repository.get_without_coordinates.side_effect = [
+        [_profile_entity(id=1), _profile_entity(id=2, cidade="Inexistente")],
+        [_profile_entity(id=5)],
+        []
+    ]
+    service = ProfileService(profile_repository, Mock())
+    
+    def resolve(cidade, uf, cep):
+        return None if cidade == "Inexistente" else (-23.5505, -46.6333, "CIDADE_UF")
+    
+    with patch("app.application.services.profile_service.LocationUtils.resolve_address_coordinates", side_effect=resolve):
+        stats = service.geocode_missing_coordinates(batch_size=2, max_workers=2, chunk_size=1)
+    
+    assert (stats["processed"], stats["resolved"], stats["failed"], stats["failed_ids"]) == (3, 2, 1, [2])
+    assert stats["profiles_per_second"] > 0
+    assert [c.kwargs["after_id"] for c in profile_repository.get_without_coordinates.call_args_list] == [0, 2, 5]
+    assert [c.args[0] for c in profile_repository.bulk_update_coordinates.call_args_list] == [
+        [(1, -23.5505, -46.6333, "CIDADE_UF")],
+        [(5, -23.5505, -46.6333, "CIDADE_UF")]
+    ]
+
+def test_profile_repository_bulk_update_coordinates(setup_database, db_session):
+    """Teste da leitura por lotes e do UPDATE em massa de coordenadas"""
+    from infrastructure.database.models.profile_model import ProfileModel
+    from infrastructure.repositories.profile_repository_impl import ProfileRepositoryImpl
+    
+    models = [
+        ProfileModel(
+            user_id=1, role_id=2, full_name=f"Backfill {i}", artistic_name=f"Backfill {i}", bio="Bio",
+            cep="01234-567", logradouro="Rua", numero="1", cidade="São Paulo", uf="SP", telefone_movel="11999999999"
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(models)
+    db_session.commit()
+    ids = [model.id for model in models]
+    
+    try:
+        repository = ProfileRepositoryImpl(db_session)
+        pending = [p.id for p in repository.get_without_coordinates(limit=1000, after_id=ids[0] - 1) if p.id in ids]
+        assert pending == ids
+        
+        assert repository.bulk_update_coordinates([
+            (ids[0], -23.5505, -46.6333, "CIDADE_UF"),
+            (ids[2], -22.9064, -47.0616, "VIACEP")
+        ]) == 2
+        
+        db_session.expire_all()
+        updated = {p.id: p for p in db_session.query(ProfileModel).filter(ProfileModel.id.in_(ids))}
+        assert (updated[ids[0]].latitude, updated[ids[0]].coordinates_source) == (-23.5505, "CIDADE_UF")
+        assert (updated[ids[2]].longitude, updated[ids[2]].coordinates_source) == (-47.0616, "VIACEP")
+        assert updated[ids[1]].latitude is None
+        assert [p.id for p in repository.get_without_coordinates(limit=1000, after_id=ids[0] - 1) if p.id in ids] == [ids[1]]
+    finally:
+        db_session.query(ProfileModel).filter(ProfileModel.id.in_(ids)).delete(synchronize_session=False)
+        db_session.commit()
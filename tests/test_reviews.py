@@ -136,4 +136,53 @@ def test_get_reviews_by_user(client: TestClient):
     
     data = response.json()
     assert "items" in data  # ReviewListResponse tem campo 'items'
-    assert isinstance(data["items"], list) 
\ No newline at end of file
+    assert isinstance(data["items"], list)
+
+
+def test_rating_summary_maintained_on_writes(setup_database, db_session):
+    """Testa o resumo de avaliações por profile mantido em create/update/delete"""
+    from domain.entities.review import Review
+    from infrastructure.database.models.profile_model import ProfileModel
+    from infrastructure.database.models.review_model import ReviewModel
+    from infrastructure.database.models.profile_rating_summary_model import ProfileRatingSummaryModel
+    from infrastructure.repositories.review_repository_impl import ReviewRepositoryImpl
+
+    profiles = [
+        ProfileModel(
+            user_id=1, role_id=2, full_name=f"Avaliado {i}", artistic_name=f"Avaliado {i}", bio="Bio",
+            cep="01234-567", logradouro="Rua", numero="1", cidade="São Paulo", uf="SP", telefone_movel="11999999999"
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(profiles)
+    db_session.commit()
+    first_id, second_id = [profile.id for profile in profiles]
+    depoimento = "Apresentação muito boa, recomendo."
+
+    try:
+        repository = ReviewRepositoryImpl(db_session)
+        created = [repository.create(Review(profile_id=first_id, nota=nota, depoimento=depoimento)) for nota in (5, 4, 4)]
+
+        repository.update(created[1].id, Review(profile_id=first_id, nota=2, depoimento=depoimento))
+        repository.delete(created[2].id)
+
+        summaries = repository.get_rating_summaries([first_id, second_id])
+        assert summaries[first_id].total_reviews == 2
+        assert summaries[first_id].average_rating == 3.5
+        assert summaries[first_id].distribuicao == {1: 0, 2: 1, 3: 0, 4: 0, 5: 1}
+        assert summaries[second_id].total_reviews == 0
+        assert summaries[second_id].average_rating is None
+        assert repository.get_average_rating_by_profile(first_id) == 3.5
+
+        # O recálculo completo produz o mesmo resumo
+        repository.rebuild_rating_summaries()
+        rebuilt = repository.get_rating_summary(first_id)
+        assert (rebuilt.total_reviews, rebuilt.soma_notas, rebuilt.distribuicao) == (
+            2, 7, summaries[first_id].distribuicao
+        )
+    finally:
+        ids = [first_id, second_id]
+        db_session.query(ReviewModel).filter(ReviewModel.profile_id.in_(ids)).delete(synchronize_session=False)
+        db_session.query(ProfileRatingSummaryModel).filter(ProfileRatingSummaryModel.profile_id.in_(ids)).delete(synchronize_session=False)
+        db_session.query(ProfileModel).filter(ProfileModel.id.in_(ids)).delete(synchronize_session=False)
+        db_session.commit()
@@ -29,4 +29,44 @@ def test_simple_client(client):
     """Teste simples para verificar se o cliente funciona"""
     # Teste simples de health check
     response = client.get("/docs")
-    assert response.status_code == 200 
\ No newline at end of file
+    assert response.status_code == 200
+
+
+def test_blocking_endpoints_run_in_threadpool(client):
+    """Testa que só endpoints que não bloqueiam (sem I/O ou com a sessão assíncrona) são `async def`"""
+    import inspect
+    from anyio import to_thread
+    from fastapi.routing import APIRoute
+    from app.core.config import settings
+
+    async_routes = {
+        route.path for route in app.routes
+        if isinstance(route, APIRoute) and inspect.iscoroutinefunction(route.endpoint)
+    }
+    assert async_routes == {
+        "/", "/health", "/api/v1/profiles/{profile_id}",
+        "/api/v1/reviews/profile/{profile_id}/average", "/api/v1/reviews/profiles/ratings",
+        "/api/v1/auth/register", "/api/v1/auth/login", "/api/v1/users/"
+    }
+
+    async def total_tokens():
+        return to_thread.current_default_thread_limiter().total_tokens
+
+    assert client.portal.call(total_tokens) == settings.THREADPOOL_MAX_WORKERS
+
+def test_app_version_comes_from_version_file_without_git():
+    """Testa a versão lida de version.py, sem subprocessos do Git e memorizada"""
+    from unittest.mock import patch
+    from app.core import config
+    from version import VERSION
+
+    config.get_app_version.cache_clear()
+    try:
+        with patch.dict("os.environ", {}, clear=False) as environ, patch("app.core.config.subprocess.run") as run:
+            environ.pop("APP_VERSION", None)
+            assert config.settings.APP_VERSION == VERSION
+            assert config.settings.APP_VERSION == VERSION
+            run.assert_not_called()
+        assert config.get_app_version.cache_info().misses == 1
+    finally:
+        config.get_app_version.cache_clear()
@@ -123,4 +123,74 @@ def test_delete_space_event_type(client: TestClient):
     
     # Verificar se a associação foi deletada
     get_response = client.get(f"/api/v1/space-event-types/{association_id}")
-    assert get_response.status_code == 404 
\ No newline at end of file
+    assert get_response.status_code == 404 
+
+def test_contracting_events_count_maintained_by_repositories(setup_database, db_session):
+    """Testa a manutenção do contador de eventos/festivais CONTRATANDO por espaço"""
+    import json
+    from datetime import datetime
+    from domain.entities.space_event_type import SpaceEventType, StatusEventType
+    from domain.entities.space_festival_type import SpaceFestivalType, StatusFestivalType
+    from infrastructure.database.models.space_model import SpaceModel
+    from infrastructure.database.models.event_type_model import EventTypeModel
+    from infrastructure.database.models.festival_type_model import FestivalTypeModel
+    from infrastructure.repositories.space_repository_impl import SpaceRepositoryImpl
+    from infrastructure.repositories.space_event_type_repository_impl import SpaceEventTypeRepositoryImpl
+    from infrastructure.repositories.space_festival_type_repository_impl import SpaceFestivalTypeRepositoryImpl
+    
+    space = SpaceModel(
+        profile_id=987654, space_type_id=1, acesso="Público", dias_apresentacao=json.dumps(["sexta"]),
+        duracao_apresentacao=2.0, valor_hora=100.0, valor_couvert=10.0, requisitos_minimos="Som",
+        oferecimentos="Palco", estrutura_apresentacao="Palco", publico_estimado="<50",
+        fotos_ambiente=json.dumps([])
+    )
+    event_type = EventTypeModel(type="Evento Contador")
+    festival_type = FestivalTypeModel(type="Festival Contador")
+    db_session.add_all([space, event_type, festival_type])
+    db_session.commit()
+    
+    event_repository = SpaceEventTypeRepositoryImpl(db_session)
+    festival_repository = SpaceFestivalTypeRepositoryImpl(db_session)
+    space_repository = SpaceRepositoryImpl(db_session)
+    
+    def contracting_count():
+        db_session.expire_all()
+        return db_session.query(SpaceModel).filter(SpaceModel.id == space.id).one().contracting_events_count
+    
+    try:
+        assert contracting_count() == 0
+        assert space_repository.get_contracting_by_profile_ids([987654]) == []
+        
+        event = event_repository.create(SpaceEventType(
+            space_id=space.id, event_type_id=event_type.id, tema="Show", descricao="Show",
+            data=datetime(2031, 1, 1), horario="20:00"
+        ))
+        festival = festival_repository.create(SpaceFestivalType(
+            space_id=space.id, festival_type_id=festival_type.id, tema="Festival", descricao="Festival",
+            data=datetime(2031, 1, 2), horario="18:00"
+        ))
+        assert contracting_count() == 2
+        assert [s.id for s in space_repository.get_contracting_by_profile_ids([987654])] == [space.id]
+        
+        event_repository.update_status(event.id, StatusEventType.FECHADO)
+        assert contracting_count() == 1
+        
+        festival_repository.update_status(festival.id, StatusFestivalType.SUSPENSO)
+        assert contracting_count() == 0
+        assert space_repository.get_contracting_by_profile_ids([987654]) == []
+        
+        event_repository.update_status(event.id, StatusEventType.CONTRATANDO)
+        assert contracting_count() == 1
+        
+        event_repository.delete(event.id)
+        assert contracting_count() == 0
+        
+        festival_repository.update_status(festival.id, StatusFestivalType.CONTRATANDO)
+        assert contracting_count() == 1
+        festival_repository.delete_by_festival_type_id(festival_type.id)
+        assert contracting_count() == 0
+    finally:
+        db_session.query(SpaceModel).filter(SpaceModel.id == space.id).delete()
+        db_session.query(EventTypeModel).filter(EventTypeModel.id == event_type.id).delete()
+        db_session.query(FestivalTypeModel).filter(FestivalTypeModel.id == festival_type.id).delete()
+        db_session.commit()
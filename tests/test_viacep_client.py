@@ -0,0 +1,190 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from sqlalchemy.orm import sessionmaker
+from infrastructure.external.cep_lookup_store import CepLookupStore
+from infrastructure.external.circuit_breaker import CircuitBreaker
+from infrastructure.external.viacep_client import ViaCepClient
+from infrastructure.database.models.cep_lookup_model import CepLookupModel
+
+class _StubViaCepHandler(BaseHTTPRequestHandler):
+    """Servidor local que imita a ViaCEP"""
+
+    responses = {
+        "01001000": (200, {"cep": "01001-000", "localidade": "São Paulo", "uf": "SP"}),
+        "20040020": (200, {"cep": "20040-020", "localidade": "Rio de Janeiro", "uf": "RJ"}),
+        "99999999": (200, {"erro": True}),
+        "50000000": (500, {}),
+    }
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.request_paths.append(self.path)
+        time.sleep(server.delay)
+        cep = self.path.strip("/").split("/")[-2]
+        status, body = self.responses.get(cep, (400, {}))
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubViaCepHandler)
+    server.lock = threading.Lock()
+    server.request_paths = []
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(server, **kwargs) -> ViaCepClient:
+    host, port = server.server_address
+    return ViaCepClient(base_url=f"http://{host}:{port}/ws", timeout_seconds=2, **kwargs)
+
+
+def test_lookup_caches_positive_and_negative_results(stub_server):
+    """Testa cache positivo e negativo por CEP limpo"""
+    client = _client(stub_server)
+    try:
+        assert client.lookup("01001-000") == {"cep": "01001000", "cidade": "São Paulo", "uf": "SP"}
+        assert client.lookup("01001000")["uf"] == "SP"
+        assert client.lookup("99999-999") is None
+        assert client.lookup("99999999") is None
+        # CEP malformado não gera requisição
+        assert client.lookup("123") is None
+
+        assert stub_server.request_paths == ["/ws/01001000/json/", "/ws/99999999/json/"]
+        assert client.stats()["requests"] == 2
+    finally:
+        client.close()
+
+
+def test_concurrent_lookups_are_coalesced(stub_server):
+    """Testa o agrupamento de consultas simultâneas ao mesmo CEP"""
+    stub_server.delay = 0.2
+    client = _client(stub_server)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(client.lookup, ["20040-020"] * 8))
+
+        assert all(result and result["cidade"] == "Rio de Janeiro" for result in results)
+        assert len(stub_server.request_paths) == 1
+    finally:
+        client.close()
+
+
+def test_circuit_breaker_opens_after_failures(stub_server):
+    """Testa que falhas do servidor não vão para o cache e abrem o circuito"""
+    client = _client(stub_server, circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60))
+    try:
+        assert client.lookup("50000-000") is None
+        assert client.lookup("50000-000") is None
+        assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+        # Circuito aberto: nenhuma nova requisição, nem para CEPs válidos
+        assert client.lookup("01001-000") is None
+        assert len(stub_server.request_paths) == 2
+
+        # Após o prazo, uma chamada de teste bem-sucedida fecha o circuito
+        client.circuit_breaker.reset_timeout_seconds = 0
+        assert client.lookup("01001-000")["cidade"] == "São Paulo"
+        assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+    finally:
+        client.close()
+
+
+def test_unexpected_error_in_half_open_call_reopens_circuit(stub_server):
+    """Testa que erro inesperado (ou cancelamento) na chamada de teste não deixa o circuito meio-aberto"""
+    from unittest.mock import patch
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=0)
+    client = _client(stub_server, circuit_breaker=breaker)
+    try:
+        assert client.lookup("50000-000") is None
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with patch.object(ViaCepClient, "_parse_response", side_effect=KeyError("cidade")):
+            with pytest.raises(KeyError):
+                client.lookup("01001-000")
+        assert breaker.state == CircuitBreaker.OPEN
+
+        async def cancelled_lookup():
+            task = asyncio.ensure_future(client.lookup_async("20040-020"))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await client.aclose()
+
+        stub_server.delay = 0.5
+        asyncio.run(cancelled_lookup())
+        assert breaker.state == CircuitBreaker.OPEN
+
+        # O circuito volta a liberar a chamada de teste
+        stub_server.delay = 0.0
+        assert client.lookup("01001-000")["cidade"] == "São Paulo"
+        assert breaker.state == CircuitBreaker.CLOSED
+    finally:
+        client.close()
+
+
+def test_lookup_async_coalesces_and_shares_cache(stub_server):
+    """Testa a variante assíncrona"""
+    stub_server.delay = 0.1
+    client = _client(stub_server)
+
+    async def run():
+        try:
+            return await asyncio.gather(*(client.lookup_async("01001000") for _ in range(5)))
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(run())
+    assert all(result["cidade"] == "São Paulo" for result in results)
+    assert len(stub_server.request_paths) == 1
+    # O resultado fica disponível também para a variante síncrona
+    assert client.lookup("01001-000")["uf"] == "SP"
+    assert len(stub_server.request_paths) == 1
+
+
+def test_persistent_store_survives_new_client(stub_server, setup_database, db_session):
+    """Testa o cache persistente (tabela cep_lookups)"""
+    session_factory = sessionmaker(bind=db_session.get_bind())
+    store = CepLookupStore(session_factory)
+    try:
+        client = _client(stub_server, store=store)
+        assert client.lookup("01001-000")["cidade"] == "São Paulo"
+        assert client.lookup("99999-999") is None
+        client.close()
+
+        # Novo processo/cliente: resultados vêm do banco, sem requisições
+        client = _client(stub_server, store=store)
+        assert client.lookup("01001-000")["cidade"] == "São Paulo"
+        assert client.lookup("99999-999") is None
+        client.close()
+        assert len(stub_server.request_paths) == 2
+
+        # Registros expirados são ignorados
+        store.positive_ttl_seconds = -1
+        assert store.get("01001000") is None
+        assert store.get("99999999") == (False, None)
+    finally:
+        db_session.query(CepLookupModel).delete()
+        db_session.commit()
@@ -8,30 +8,32 @@ Uso:
     python version.py show     # Mostra versão atual
 """
 
+import os
 import subprocess
 import sys
 import re
 from typing import Tuple
 
-# Versão atual do projeto
+# Versão atual do projeto (lida pela API em app/core/config.py; atualizada por este script)
 VERSION = "0.23.0"
 
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
 def get_current_version() -> str:
-    """Obtém a versão atual baseada na tag mais recente"""
-    try:
-        result = subprocess.run(
-            ["git", "describe", "--tags", "--abbrev=0"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            if version.startswith('v'):
-                version = version[1:]
-            return version
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
-    return "0.1.0"
+    """Obtém a versão atual (VERSION deste arquivo)"""
+    return VERSION
+
+def write_version(version: str) -> None:
+    """Grava a nova versão em version.py e pyproject.toml"""
+    for filename, pattern, replacement in (
+        ("version.py", r'^VERSION = "[^"]*"', f'VERSION = "{version}"'),
+        ("pyproject.toml", r'^version = "[^"]*"', f'version = "{version}"'),
+    ):
+        path = os.path.join(_PROJECT_ROOT, filename)
+        with open(path, encoding="utf-8") as file:
+            content = file.read()
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(re.sub(pattern, replacement, content, count=1, flags=re.MULTILINE))
 
 def parse_version(version: str) -> Tuple[int, int, int]:
     """Converte string de versão em tupla (major, minor, patch)"""
@@ -123,9 +125,12 @@ def main():
         return
     
     try:
+        # A tag aponta para o commit que já contém a nova versão
+        write_version(new_version)
+        subprocess.run(["git", "commit", "-m", f"Versão {new_version}", "version.py", "pyproject.toml"], check=True, cwd=_PROJECT_ROOT)
         create_git_tag(new_version)
         print(f"✅ Versão {new_version} criada com sucesso!")
-        print(f"📦 A API agora usará automaticamente a versão {new_version}")
+        print(f"📦 A API agora usará a versão {new_version} (VERSION de version.py)")
     except subprocess.CalledProcessError as e:
         print(f"❌ Erro ao criar tag: {e}")
         sys.exit(1)